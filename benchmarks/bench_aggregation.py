@@ -0,0 +1,75 @@
+"""
+Trend aggregation benchmark.
+
+Fills years of history and interruptions, then measures the full rebuild
+of the dense per-day arrays, every metric/granularity series, and the
+incremental update after a recorded session, with and without NumPy.
+
+Usage: python benchmarks/bench_aggregation.py [years]
+"""
+import os
+import sys
+import time
+import random
+import itertools
+import datetime
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.aggregation import StatsAggregator, GRANULARITIES, INTERRUPTION_RATE
+
+
+def make_data(years):
+    rng = random.Random(7)
+    today = datetime.date.today()
+    history, interruptions = {}, []
+    for offset in range(years * 366):
+        day = (today - datetime.timedelta(days=offset)).isoformat()
+        if rng.random() < 0.7:
+            count = rng.randint(1, 10)
+            history[day] = {"minutes": count * 25, "count": count}
+        for _ in range(rng.randint(0, 3)):
+            interruptions.append({"type": "internal", "timestamp": day + "T10:00:00"})
+    return history, interruptions
+
+
+def timed(fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    history, interruptions = make_data(years)
+    today = datetime.date.today().isoformat()
+    print(f"{len(history)} days of history, {len(interruptions)} interruptions")
+
+    for use_numpy in (True, False):
+        aggregator = StatsAggregator(use_numpy=use_numpy)
+        if use_numpy and aggregator.np is None:
+            print("NumPy not available, skipping")
+            continue
+        name = "NumPy " if use_numpy else "Python"
+
+        rebuild = timed(lambda: aggregator.rebuild(history, interruptions), repeat=5)
+        print(f"[{name}] Rebuild:               {rebuild:8.2f} ms")
+
+        def all_series():
+            for metric in ("minutes", "count", INTERRUPTION_RATE):
+                for granularity in GRANULARITIES:
+                    aggregator.series(metric, granularity, 30, 7)
+
+        series = timed(all_series, repeat=20)
+        print(f"[{name}] All 9 series:          {series:8.2f} ms")
+
+        # A fresh value each call so set_day always has a delta to apply
+        minutes = itertools.cycle(range(25, 325, 25))
+        update = timed(lambda: aggregator.set_day(today, minutes=next(minutes), count=1), repeat=200)
+        print(f"[{name}] Session (set_day):     {update:8.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
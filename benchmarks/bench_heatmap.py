@@ -0,0 +1,73 @@
+"""
+Yearly heatmap benchmark.
+
+Fills ten years of history, then measures the first render of each year
+(bucketing plus drawing the cached pixmap), flipping back through the
+cached years, and the single-cell update after a recorded session.
+
+Usage: python benchmarks/bench_heatmap.py [years]
+"""
+import os
+import sys
+import time
+import random
+import datetime
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from PyQt6.QtWidgets import QApplication
+from logic.data_manager import DataManager
+from ui.heatmap import YearHeatmap
+
+
+def make_history(years):
+    rng = random.Random(7)
+    today = datetime.date.today()
+    history = {}
+    for offset in range(years * 366):
+        if rng.random() < 0.7:
+            minutes = rng.choice((25, 50, 75, 100, 150, 200))
+            history[(today - datetime.timedelta(days=offset)).isoformat()] = {"minutes": minutes, "count": minutes // 25}
+    return history
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    app = QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager = DataManager(os.path.join(tmp, "data.json"))
+        data_manager.save_data = lambda: None
+        data_manager.data["stats"]["history"] = make_history(years)
+        data_manager.rebuild_stats_index()
+        heatmap = YearHeatmap(data_manager)
+        heatmap.show()
+        app.processEvents()
+        last_year = heatmap.year
+
+        def flip_through():
+            for year in range(last_year, last_year - years, -1):
+                heatmap.set_year(year)
+                heatmap.repaint()
+
+        first = timed(flip_through)
+        print(f"First render of {years} years:   {first:8.1f} ms ({first / years:.2f} ms/year)")
+        cached = timed(flip_through)
+        print(f"Flip through cached years:  {cached:8.1f} ms ({cached / years:.2f} ms/year)")
+
+        heatmap.set_year(last_year)
+        heatmap.repaint()
+        update = timed(lambda: (data_manager.record_session(25), heatmap.repaint()))
+        print(f"Session recorded (1 cell):  {update:8.2f} ms, pixmap builds: {heatmap.pixmap_builds}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Idle wakeup benchmark.
+
+Runs a focus session with the real MainWindow and FloatingWindow, then counts
+timer events delivered by the Qt event loop (each one is a CPU wakeup) with a
+window visible and with every window hidden (low-power mode).
+
+Usage: python benchmarks/bench_idle_wakeups.py [seconds_per_phase]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QEvent, QEventLoop, QTimer
+
+from logic.timer import PomodoroTimer
+from logic.scheduler import TimerScheduler
+from logic.power import PowerManager
+from ui.main_window import MainWindow
+from ui.floating_window import FloatingWindow
+
+
+class WakeupCounter(QObject):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Timer:
+            self.count += 1
+        return False
+
+
+def measure(app, counter, seconds):
+    loop = QEventLoop()
+    # The quit timer itself fires once; it is subtracted below
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    counter.count = 0
+    cpu_start = time.process_time()
+    loop.exec()
+    cpu = time.process_time() - cpu_start
+    return counter.count - 1, cpu
+
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    app = QApplication(sys.argv)
+
+    scheduler = TimerScheduler()
+    timer = PomodoroTimer(scheduler=scheduler)
+    timer.set_sound_enabled(False)
+    main_window = MainWindow(timer)
+    floating_window = FloatingWindow(timer)
+    power = PowerManager(timer, [main_window, floating_window])
+
+    counter = WakeupCounter()
+    app.installEventFilter(counter)
+
+    main_window.show()
+    timer.start()
+    # Let startup work (quote fetch, first layout) settle before measuring
+    measure(app, counter, 1)
+
+    results = []
+    wakeups, cpu = measure(app, counter, seconds)
+    results.append(("main window visible", wakeups, cpu, power.low_power))
+
+    main_window.hide()
+    measure(app, counter, 0.2)
+    wakeups, cpu = measure(app, counter, seconds)
+    results.append(("all windows hidden", wakeups, cpu, power.low_power))
+
+    print(f"Timer wakeups over {seconds:g}s with a running session:")
+    for label, wakeups, cpu, low_power in results:
+        state = "low power" if low_power else "normal"
+        print(f"  {label:<22} {wakeups:6d} wakeups ({wakeups / seconds:6.1f}/s), "
+              f"{cpu * 1000:7.1f} ms CPU  [{state}]")
+
+    timer.pause()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Kanban board benchmark.
+
+Measures how long a KanbanList takes to populate with N tasks, to scroll
+through the whole column with repaints, and how long a drop takes for
+different column sizes.
+
+Usage: python benchmarks/bench_kanban.py [task_count]
+"""
+import os
+import sys
+import time
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QThreadPool
+from logic.data_manager import DataManager
+from ui.widgets import KanbanList
+
+DROPS = 200
+
+
+def make_tasks(n):
+    return [{"id": str(i), "content": f"任务 {i}: 整理本周的工作计划并回复邮件", "pomodoros": i % 4}
+            for i in range(n)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_drops(data_manager, size):
+    """Average GUI-thread time of a drop into a column holding `size` tasks."""
+    source = KanbanList(data_manager, "q3")
+    target = KanbanList(data_manager, "q4")
+    source.set_tasks(make_tasks(DROPS))
+    target.set_tasks(make_tasks(size))
+    QThreadPool.globalInstance().waitForDone()
+
+    start = time.perf_counter()
+    for i in range(DROPS):
+        target.move_from(source, 0, (i * 7919) % (target.count() + 1))
+    elapsed = (time.perf_counter() - start) * 1000
+    QThreadPool.globalInstance().waitForDone()
+    return elapsed / DROPS
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    app = QApplication(sys.argv)
+    tasks = make_tasks(count)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_manager = DataManager(os.path.join(tmp, "data.json"))
+        kanban = KanbanList(data_manager, "q1")
+        kanban.resize(480, 600)
+        kanban.show()
+        app.processEvents()
+
+        def bulk_load():
+            kanban.set_tasks(tasks)
+            app.processEvents()
+
+        def scroll_all():
+            bar = kanban.verticalScrollBar()
+            step = kanban.viewport().height()
+            value = 0
+            while value < bar.maximum():
+                value += step
+                bar.setValue(value)
+                kanban.viewport().repaint()
+
+        print(f"KanbanList with {count} tasks:")
+        print(f"  bulk load (set_tasks)   {timed(bulk_load):8.1f} ms")
+        pages = kanban.verticalScrollBar().maximum() // max(1, kanban.viewport().height()) + 1
+        elapsed = timed(scroll_all)
+        print(f"  scroll {pages} pages       {elapsed:8.1f} ms ({elapsed / pages:.2f} ms/page)")
+
+        print(f"\nDrop latency (average of {DROPS} cross-column drops):")
+        for size in (100, 1000, count):
+            print(f"  into {size:>6} tasks        {bench_drops(data_manager, size):8.3f} ms")
+        QThreadPool.globalInstance().waitForDone()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
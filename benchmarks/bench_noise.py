@@ -0,0 +1,66 @@
+"""
+White noise engine benchmark.
+
+Measures the one-off cost of building each loop buffer and the steady-state
+CPU cost of streaming it, by pulling audio from LoopDevice in the same chunk
+sizes an audio sink would use.
+
+Usage: python benchmarks/bench_noise.py [stream_seconds]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from PyQt6.QtCore import QIODevice
+from logic import noise
+from logic.noise import generate_noise, LoopDevice, NOISE_KINDS, SAMPLE_RATE
+
+CHUNK_BYTES = 4096
+
+
+def bench_generate():
+    try:
+        import numpy
+        backend = f"numpy {numpy.__version__}"
+    except ImportError:
+        backend = "pure Python"
+    print(f"Loop generation ({noise.LOOP_SECONDS}s @ {SAMPLE_RATE} Hz, {backend}):")
+    buffers = {}
+    for kind in NOISE_KINDS:
+        start = time.perf_counter()
+        buffers[kind] = generate_noise(kind, seed=1)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"  {kind:<6} {elapsed:8.1f} ms  ({len(buffers[kind]) / 1024:.0f} KiB)")
+    return buffers
+
+
+def bench_stream(pcm, seconds):
+    device = LoopDevice(pcm)
+    device.open(QIODevice.OpenModeFlag.ReadOnly)
+    total_bytes = seconds * SAMPLE_RATE * 2
+    pulled = 0
+    cpu_start = time.process_time()
+    while pulled < total_bytes:
+        pulled += len(device.readData(CHUNK_BYTES))
+    cpu = time.process_time() - cpu_start
+    device.close()
+    return cpu
+
+
+def main():
+    stream_seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    buffers = bench_generate()
+
+    print(f"\nStreaming {stream_seconds}s of audio in {CHUNK_BYTES}-byte pulls:")
+    for kind, pcm in buffers.items():
+        cpu = bench_stream(pcm, stream_seconds)
+        per_second_us = cpu / stream_seconds * 1e6
+        print(f"  {kind:<6} {cpu * 1000:8.1f} ms CPU total, {per_second_us:6.1f} us CPU per audio second "
+              f"({per_second_us / 1e4:.4f}% of one core)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Progress ring repaint benchmark.
+
+Counts down a session on the timer page's CircularProgressBar (with the
+timer label on top, as in the main window) and measures the time spent in
+paintEvent and the area repainted per tick. The cached ring (track pixmap,
+arc-segment invalidation) is compared with the previous full redraw. Then
+measures how many frames smooth mode adds, and what they cost, for a
+25 minute focus session and a 5 minute break.
+
+Usage: QT_QPA_PLATFORM=offscreen python benchmarks/bench_progress_ring.py [ticks]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from PyQt6.QtWidgets import QApplication, QLabel
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QPainter, QPen
+
+from ui.widgets import CircularProgressBar, SMOOTH_DURATION_MS
+
+
+class TimedRing(CircularProgressBar):
+    def __init__(self):
+        super().__init__()
+        self.paint_seconds = 0.0
+        self.paint_pixels = 0
+        self.paints = 0
+
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        super().paintEvent(event)
+        self.paint_seconds += time.perf_counter() - start
+        self.paint_pixels += event.rect().width() * event.rect().height()
+        self.paints += 1
+
+
+class FullRedrawRing(TimedRing):
+    """The ring as it was: every change repaints the widget, pens and all."""
+
+    def _show_value(self, val):
+        self._value = val
+        self.update()
+
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        width = self.width()
+        height = self.height()
+        side = min(width, height) - 20
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.translate(width / 2, height / 2)
+        bg_pen = QPen(self._bg_color)
+        bg_pen.setWidth(10)
+        bg_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        painter.setPen(bg_pen)
+        painter.drawEllipse(QRectF(-side/2, -side/2, side, side))
+        if self._max_value > 0:
+            progress_pen = QPen(self._color)
+            progress_pen.setWidth(10)
+            progress_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+            painter.setPen(progress_pen)
+            span_angle = int(-(self._value / self._max_value) * 360 * 16)
+            painter.drawArc(QRectF(-side/2, -side/2, side, side), 90 * 16, span_angle)
+        painter.end()
+        self.paint_seconds += time.perf_counter() - start
+        self.paint_pixels += event.rect().width() * event.rect().height()
+        self.paints += 1
+
+
+def make_ring(cls, total, smooth=False):
+    ring = cls()
+    ring.resize(400, 400)
+    ring.set_color("#1A1A1A")
+    ring.set_bg_color("#F0F0F0")
+    ring.set_max_value(total)
+    ring.value = total
+    ring.set_smooth(smooth)
+    label = QLabel(ring)
+    label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    label.setStyleSheet("font-size: 80px; font-weight: bold;")
+    ring.layout.addWidget(label)
+    ring.show()
+    return ring, label
+
+
+def countdown(app, cls, total, ticks, smooth=False):
+    ring, label = make_ring(cls, total, smooth)
+    app.processEvents()
+    ring.paint_seconds, ring.paint_pixels, ring.paints = 0.0, 0, 0
+    for seconds in range(total - 1, total - 1 - ticks, -1):
+        label.setText(f"{seconds // 60:02d}:{seconds % 60:02d}")
+        ring.animate_to(seconds)
+        if smooth:
+            # Let the glide play out over the tick, like the real one-second timer
+            deadline = time.perf_counter() + SMOOTH_DURATION_MS / 1000
+            while time.perf_counter() < deadline:
+                app.processEvents()
+        else:
+            app.processEvents()
+    result = (ring.paint_seconds * 1000 / ticks, ring.paint_pixels / ticks, ring.paints / ticks,
+              ring.animation_frames / ticks)
+    ring.close()
+    return result
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    app = QApplication(sys.argv)
+    # Warm-up: fonts and the label stylesheet
+    countdown(app, TimedRing, 1500, 5)
+
+    print(f"Repaint per one-second tick, 400x400 ring, {ticks} ticks:")
+    for name, cls in (("Full redraw", FullRedrawRing), ("Cached ring", TimedRing)):
+        ms, pixels, paints, _ = countdown(app, cls, 1500, ticks)
+        print(f"  [{name:11}] paintEvent {ms:7.3f} ms/tick, {pixels:9.0f} px/tick repainted")
+
+    # Smooth mode plays for real time, so only a few ticks
+    smooth_ticks = min(ticks, 5)
+    print(f"\nSmooth mode, {smooth_ticks} ticks of one second:")
+    for name, total in (("25 min focus", 1500), ("5 min break", 300)):
+        for smooth in (False, True):
+            ms, pixels, paints, frames = countdown(app, TimedRing, total, smooth_ticks, smooth)
+            mode = "smooth" if smooth else "stepped"
+            print(f"  [{name:12} {mode:7}] {paints:5.1f} paints/s, {frames:5.1f} extra frames/s, "
+                  f"paintEvent {ms:6.3f} ms/s, {pixels:8.0f} px/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
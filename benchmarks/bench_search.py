@@ -0,0 +1,62 @@
+"""
+Full-text search benchmark.
+
+Builds the SearchIndex over N generated notes, then measures query latency
+for CJK and Latin queries, and the cost of re-syncing after one note changes.
+
+Usage: python benchmarks/bench_search.py [note_count]
+"""
+import os
+import sys
+import time
+import random
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.search_index import SearchIndex
+
+WORDS = ["番茄", "工作", "计划", "会议", "读书", "笔记", "复盘", "专注", "休息", "目标",
+         "deep", "work", "review", "sprint", "release", "reading", "focus", "habit"]
+QUERIES = ["番", "番茄", "番茄工作", "会议计划", "deep", "rev", "focus habit", "专注 sprint"]
+RUNS = 20
+
+
+def make_notes(n):
+    rng = random.Random(42)
+    notes = []
+    for i in range(n):
+        content = "".join(rng.choice(WORDS) + (" " if rng.random() < 0.3 else "") for _ in range(60))
+        notes.append((str(i), f"笔记 {i} {rng.choice(WORDS)}", content))
+    return notes
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    notes = make_notes(count)
+    index = SearchIndex()
+
+    elapsed, _ = timed(lambda: index.sync("note", notes))
+    print(f"Index {count} notes: {elapsed:.0f} ms")
+
+    print(f"\nQuery latency (average of {RUNS} runs):")
+    for query in QUERIES:
+        total = 0.0
+        for _ in range(RUNS):
+            elapsed, hits = timed(lambda: index.search(query, kind="note"))
+            total += elapsed
+        print(f"  {query!r:<16} {total / RUNS:8.2f} ms  {len(hits):>6} hits")
+
+    notes[0] = (notes[0][0], notes[0][1], "番茄工作法 updated")
+    elapsed, _ = timed(lambda: index.sync("note", notes))
+    print(f"\nRe-sync after editing one note: {elapsed:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,98 @@
+"""
+Main window startup benchmark.
+
+Measures the time to import the main window module in a fresh interpreter,
+with the single-use modules (networking, multimedia, notes model, note editor,
+heatmap, trend chart) left to load on first use and, for comparison, imported
+up front as before. Then measures time to first paint of the main window when
+only the timer page is built (the rest are placeholders), how long the idle
+prebuild of the other pages takes afterwards, and the same first paint with
+every page built up front.
+
+Usage: QT_QPA_PLATFORM=offscreen python benchmarks/bench_startup.py [runs]
+"""
+import os
+import sys
+import time
+import tempfile
+import statistics
+import subprocess
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.append(SRC)
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QThreadPool
+
+from ui.main_window import MainWindow, PAGES
+from logic.timer import PomodoroTimer
+
+# Imported at startup before they were deferred to first use
+DEFERRED = ("requests", "PyQt6.QtMultimedia", "logic.quote_worker", "ui.notes_model",
+            "ui.note_editor", "ui.heatmap", "ui.trend_chart")
+
+IMPORT_SCRIPT = """
+import sys, time, importlib
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+import ui.main_window
+for name in {eager!r}:
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        pass
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def import_time(eager):
+    # A fresh interpreter each run, since imports are cached per process
+    script = IMPORT_SCRIPT.format(src=SRC, eager=DEFERRED if eager else ())
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def first_paint(app, eager):
+    start = time.perf_counter()
+    window = MainWindow(PomodoroTimer())
+    window.data_manager.save_data = lambda: None
+    if eager:
+        for index in range(len(PAGES)):
+            window.ensure_page(index)
+    window.show()
+    window.repaint()
+    painted = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    while len(window.pages) < len(PAGES):
+        app.processEvents()
+    prebuilt = (time.perf_counter() - start) * 1000
+    window.close()
+    QThreadPool.globalInstance().waitForDone()
+    return painted, prebuilt
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for eager in (False, True):
+        name = "Up front" if eager else "Deferred"
+        median = statistics.median(import_time(eager) for _ in range(runs))
+        print(f"[{name:10}] Import main window: {median:8.2f} ms")
+
+    app = QApplication(sys.argv)
+    # Keep the benchmark's data files out of the working directory
+    os.chdir(tempfile.mkdtemp())
+    # Warm-up: fonts, icons and the stylesheet are process-wide caches
+    first_paint(app, eager=True)
+
+    for eager in (False, True):
+        results = [first_paint(app, eager) for _ in range(runs)]
+        name = "All pages" if eager else "Timer only"
+        print(f"[{name:10}] First paint:   {sum(r[0] for r in results) / runs:8.2f} ms")
+        if not eager:
+            print(f"[{name:10}] Idle prebuild: {sum(r[1] for r in results) / runs:8.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
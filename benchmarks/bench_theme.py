@@ -0,0 +1,62 @@
+"""
+Theme switch benchmark.
+
+Builds the main window and the floating window, then measures compiling the
+tokenized stylesheet for every palette and switching between the light and
+dark themes (one app-level stylesheet swap plus icon tinting).
+
+Usage: QT_QPA_PLATFORM=offscreen python benchmarks/bench_theme.py [switches]
+"""
+import os
+import sys
+import time
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QThreadPool
+
+from ui.theme import ThemeEngine, engine
+from ui.main_window import MainWindow
+from ui.floating_window import FloatingWindow
+from logic.timer import PomodoroTimer
+
+
+def main():
+    switches = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    app = QApplication(sys.argv)
+    # Keep the benchmark's data files out of the working directory
+    os.chdir(tempfile.mkdtemp())
+
+    start = time.perf_counter()
+    ThemeEngine()
+    print(f"Compile all palettes:   {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+    window = MainWindow(PomodoroTimer())
+    window.data_manager.save_data = lambda: None
+    floating = FloatingWindow(window.timer)
+    window.show()
+    floating.show()
+    app.processEvents()
+
+    totals, sheets = [], []
+    for i in range(switches):
+        start = time.perf_counter()
+        window.apply_theme("dark" if i % 2 == 0 else "light")
+        app.processEvents()
+        totals.append((time.perf_counter() - start) * 1000)
+        sheets.append(engine.last_switch_ms)
+    print(f"Switches:               {switches}")
+    print(f"setStyleSheet (mean):   {sum(sheets) / len(sheets):8.2f} ms")
+    print(f"Full switch (mean):     {sum(totals) / len(totals):8.2f} ms")
+    print(f"Full switch (max):      {max(totals):8.2f} ms")
+
+    QThreadPool.globalInstance().waitForDone()
+    floating.close()
+    window.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Compare two startup profiles.
+
+Reads reports written with FANQIE_STARTUP_PROFILE set (see
+src/logic/startup_profile.py), for example from two releases, and prints
+time to first paint, time to interactive, total import time and every
+phase side by side with the change.
+
+Usage: python benchmarks/compare_startup.py <old.json> <new.json>
+"""
+import sys
+import json
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def phase_times(report):
+    # Page builds and the like can repeat; compare their sums
+    times = {}
+    for phase in report.get("phases", []):
+        key = "  " * phase["depth"] + phase["name"]
+        times[key] = times.get(key, 0) + (phase["duration_ms"] or 0)
+    return times
+
+
+def row(name, old, new):
+    if old is None or new is None:
+        change = ""
+    else:
+        change = f"{new - old:+9.1f} ms" + (f" ({(new - old) / old:+.0%})" if old else "")
+    fmt = lambda value: "       -" if value is None else f"{value:8.1f}"
+    print(f"{name:32} {fmt(old)} {fmt(new)}   {change}")
+
+
+def main():
+    if len(sys.argv) != 3:
+        print(__doc__.strip().splitlines()[-1])
+        return 2
+    old, new = load(sys.argv[1]), load(sys.argv[2])
+    print(f"{'':32} {'old ms':>8} {'new ms':>8}")
+    for key in ("time_to_first_paint_ms", "time_to_interactive_ms", "import_total_ms", "total_ms"):
+        row(key, old.get(key), new.get(key))
+    print()
+    old_phases, new_phases = phase_times(old), phase_times(new)
+    for name in list(old_phases) + [n for n in new_phases if n not in old_phases]:
+        row(name, old_phases.get(name), new_phases.get(name))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -35,6 +35,7 @@ if not exist FanqieClock.spec (
         --add-data "src/styles;styles" ^
         --hidden-import "PyQt6" ^
         --hidden-import "PyQt6.QtSvg" ^
+        --hidden-import "PyQt6.QtMultimedia" ^
         --hidden-import "requests" ^
         src/main.py
 ) else (
@@ -0,0 +1,185 @@
+import datetime
+from itertools import accumulate
+
+METRICS = ("minutes", "count", "interruptions")
+# Derived metric: interruptions per pomodoro
+INTERRUPTION_RATE = "interruption_rate"
+GRANULARITIES = ("day", "week", "month")
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+def _add_months(date, months):
+    month = date.month - 1 + months
+    return datetime.date(date.year + month // 12, month % 12 + 1, 1)
+
+
+def bucket_starts(granularity, periods, today):
+    """Start dates of `periods` consecutive buckets ending with the one holding `today`, plus the end bound."""
+    if granularity == "day":
+        first = today - datetime.timedelta(days=periods - 1)
+        return [first + datetime.timedelta(days=k) for k in range(periods + 1)]
+    if granularity == "week":
+        first = today - datetime.timedelta(days=today.weekday(), weeks=periods - 1)
+        return [first + datetime.timedelta(weeks=k) for k in range(periods + 1)]
+    if granularity == "month":
+        first = _add_months(today.replace(day=1), -(periods - 1))
+        return [_add_months(first, k) for k in range(periods + 1)]
+    raise ValueError(f"Unknown granularity: {granularity}")
+
+
+def bucket_label(granularity, start):
+    if granularity == "month":
+        return start.strftime("%Y-%m")
+    return start.strftime("%m-%d")
+
+
+class StatsAggregator:
+    """
+    Dense day-indexed arrays of focus minutes, pomodoros and interruptions.
+
+    History and interruptions are converted once into one array per metric,
+    starting at the earliest recorded day, together with prefix sums. A bucket
+    total is then the difference of two prefix sums, so daily, weekly and
+    monthly rollups and their moving averages never rescan the raw records.
+    Updating a day only shifts the prefix sums after it, which for today's
+    entry is the last element. NumPy is used when available, plain lists
+    otherwise.
+    """
+
+    def __init__(self, use_numpy=True):
+        self.np = _numpy() if use_numpy else None
+        self.start = None
+        self.length = 0
+        self._daily = {}
+        self._prefix = {}
+        self.rebuilds = 0
+        self.day_updates = 0
+
+    def rebuild(self, history, interruptions, today=None):
+        self.rebuilds += 1
+        today = today or datetime.date.today()
+        days = list(history)
+        interruption_days = [str(i.get("timestamp", ""))[:10] for i in interruptions]
+        interruption_days = [day for day in interruption_days if len(day) == 10]
+        all_days = sorted(set(days) | set(interruption_days))
+        first = datetime.date.fromisoformat(all_days[0]) if all_days else today
+        last = datetime.date.fromisoformat(all_days[-1]) if all_days else today
+        self.start = min(first, today)
+        self.length = (max(last, today) - self.start).days + 1
+
+        values = {
+            "minutes": [history[day].get("minutes", 0) for day in days],
+            "count": [history[day].get("count", 0) for day in days],
+        }
+        if self.np is not None:
+            np = self.np
+            origin = np.datetime64(self.start.isoformat(), "D")
+            offsets = (np.array(days, dtype="datetime64[D]") - origin).astype(np.int64)
+            for metric in ("minutes", "count"):
+                daily = np.zeros(self.length, dtype=np.int64)
+                np.add.at(daily, offsets, np.array(values[metric], dtype=np.int64))
+                self._daily[metric] = daily
+            daily = np.zeros(self.length, dtype=np.int64)
+            offsets = (np.array(interruption_days, dtype="datetime64[D]") - origin).astype(np.int64)
+            np.add.at(daily, offsets, 1)
+            self._daily["interruptions"] = daily
+            for metric in METRICS:
+                self._prefix[metric] = np.concatenate(([0], np.cumsum(self._daily[metric])))
+        else:
+            for metric in METRICS:
+                self._daily[metric] = [0] * self.length
+            for day, minutes, count in zip(days, values["minutes"], values["count"]):
+                offset = self._offset(day)
+                self._daily["minutes"][offset] += minutes
+                self._daily["count"][offset] += count
+            for day in interruption_days:
+                self._daily["interruptions"][self._offset(day)] += 1
+            for metric in METRICS:
+                self._prefix[metric] = [0] + list(accumulate(self._daily[metric]))
+
+    def _offset(self, day):
+        return (datetime.date.fromisoformat(day) - self.start).days
+
+    def _extend_to(self, offset):
+        # Days are appended at most once a day, so a copy here is cheap
+        grow = offset + 1 - self.length
+        for metric in METRICS:
+            if self.np is not None:
+                np = self.np
+                self._daily[metric] = np.concatenate((self._daily[metric], np.zeros(grow, dtype=np.int64)))
+                self._prefix[metric] = np.concatenate((self._prefix[metric], np.full(grow, self._prefix[metric][-1])))
+            else:
+                self._daily[metric].extend([0] * grow)
+                self._prefix[metric].extend([self._prefix[metric][-1]] * grow)
+        self.length += grow
+
+    def set_day(self, day, **values):
+        """Set a day's totals, e.g. set_day("2026-01-01", minutes=50, count=2)."""
+        if self.start is None:
+            raise RuntimeError("rebuild() must be called before set_day()")
+        offset = self._offset(day)
+        if offset < 0:
+            raise ValueError(f"{day} is before the first aggregated day; rebuild instead")
+        if offset >= self.length:
+            self._extend_to(offset)
+        self.day_updates += 1
+        for metric, value in values.items():
+            daily = self._daily[metric]
+            delta = value - int(daily[offset])
+            if not delta:
+                continue
+            daily[offset] = value
+            prefix = self._prefix[metric]
+            if self.np is not None:
+                prefix[offset + 1:] += delta
+            else:
+                for i in range(offset + 1, len(prefix)):
+                    prefix[i] += delta
+
+    def daily(self, metric):
+        return list(self._daily[metric])
+
+    def _bucket_sums(self, metric, starts):
+        # Bucket k covers [starts[k], starts[k + 1]); days outside the arrays count as zero
+        offsets = [min(max((start - self.start).days, 0), self.length) for start in starts]
+        prefix = self._prefix[metric]
+        if self.np is not None:
+            totals = prefix[self.np.array(offsets)]
+            return (totals[1:] - totals[:-1]).tolist()
+        return [prefix[b] - prefix[a] for a, b in zip(offsets, offsets[1:])]
+
+    def _moving_sums(self, sums, window):
+        if self.np is not None:
+            np = self.np
+            cumulative = np.concatenate(([0], np.cumsum(np.array(sums, dtype=np.float64))))
+            return (cumulative[window:] - cumulative[:-window]).tolist()
+        cumulative = [0] + list(accumulate(sums))
+        return [cumulative[k + window] - cumulative[k] for k in range(len(sums) - window + 1)]
+
+    def series(self, metric, granularity="day", periods=30, window=7, today=None):
+        """
+        (labels, values, moving_averages) for the last `periods` buckets. The
+        average covers the last `window` buckets ending at each one, including
+        buckets before the visible range.
+        """
+        today = today or datetime.date.today()
+        starts = bucket_starts(granularity, periods + window - 1, today)
+        labels = [bucket_label(granularity, start) for start in starts[window - 1:-1]]
+        if metric == INTERRUPTION_RATE:
+            interruptions = self._bucket_sums("interruptions", starts)
+            counts = self._bucket_sums("count", starts)
+            values = [i / c if c else 0.0 for i, c in zip(interruptions, counts)]
+            window_i = self._moving_sums(interruptions, window)
+            window_c = self._moving_sums(counts, window)
+            averages = [i / c if c else 0.0 for i, c in zip(window_i, window_c)]
+        else:
+            values = self._bucket_sums(metric, starts)
+            averages = [total / window for total in self._moving_sums(values, window)]
+        return labels, values[window - 1:], averages
@@ -0,0 +1,131 @@
+import os
+import json
+import time
+from PyQt6.QtCore import QObject, QTimer
+
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path_for(data_filename):
+    """data.json -> data.session.json, kept next to the main data file."""
+    base, _ = os.path.splitext(os.path.abspath(data_filename))
+    return f"{base}.session.json"
+
+
+def load_checkpoint(path):
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != CHECKPOINT_VERSION:
+            return None
+        return state
+    except Exception as e:
+        print(f"Failed to read session checkpoint: {e}")
+        return None
+
+
+def reconcile(state, now=None):
+    """
+    Work out where a checkpointed session stands now.
+    Returns (remaining_seconds, away_seconds): remaining is 0 if a running
+    session ended while the app was not running.
+    """
+    now = now if now is not None else time.time()
+    away = max(0, int(now - state.get("saved_at", now)))
+    if state.get("is_running") and state.get("end_at") is not None:
+        remaining = max(0, int(round(state["end_at"] - now)))
+    else:
+        remaining = state.get("remaining_seconds", 0)
+    return remaining, away
+
+
+class SessionCheckpoint(QObject):
+    """
+    Persists the running session to a tiny dedicated file so it survives crashes.
+
+    Writes happen on state transitions only (start, pause, reset, mode switch, task
+    change), never on ticks, and are coalesced to at most one per `min_interval_ms`.
+    This deliberately bypasses DataManager.save_data, which rewrites the whole store.
+    """
+
+    def __init__(self, timer, path, task_provider=None, min_interval_ms=1000):
+        super().__init__()
+        self.timer = timer
+        self.path = path
+        self.task_provider = task_provider
+        self.min_interval_ms = min_interval_ms
+        self.write_count = 0
+        self._last_write = None
+
+        self._pending = QTimer()
+        self._pending.setSingleShot(True)
+        self._pending.timeout.connect(self.flush)
+
+        timer.running_changed.connect(self.mark_dirty)
+        timer.mode_changed.connect(self.mark_dirty)
+        timer.session_reset.connect(self.mark_dirty)
+
+    def mark_dirty(self, *args):
+        if self._pending.isActive():
+            return
+        now = time.monotonic()
+        if self._last_write is None or (now - self._last_write) * 1000 >= self.min_interval_ms:
+            self.flush()
+        else:
+            wait = self.min_interval_ms - int((now - self._last_write) * 1000)
+            self._pending.start(max(0, wait))
+
+    def snapshot(self):
+        timer = self.timer
+        now = time.time()
+        task = self.task_provider() if self.task_provider else None
+        return {
+            "version": CHECKPOINT_VERSION,
+            "saved_at": now,
+            "mode": timer.current_mode,
+            "plan_index": timer.plan_index,
+            "remaining_seconds": timer.remaining_seconds,
+            "is_running": timer.is_running,
+            "end_at": now + timer.remaining_seconds if timer.is_running else None,
+            "pomodoros_completed": timer.pomodoros_completed,
+            "task": task
+        }
+
+    def is_idle(self):
+        # Nothing worth resuming: stopped at the start of a work block with no task
+        timer = self.timer
+        task = self.task_provider() if self.task_provider else None
+        return (not timer.is_running and timer.current_mode == 'work'
+                and timer.remaining_seconds == timer.session_seconds and not task)
+
+    def flush(self):
+        self._pending.stop()
+        self._last_write = time.monotonic()
+        try:
+            if self.is_idle():
+                self.clear()
+                return
+            dir_path = os.path.dirname(self.path)
+            os.makedirs(dir_path, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self.snapshot(), f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            self.write_count += 1
+        except Exception as e:
+            print(f"Error writing session checkpoint: {e}")
+
+    def load(self):
+        return load_checkpoint(self.path)
+
+    def clear(self):
+        self._pending.stop()
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            print(f"Error removing session checkpoint: {e}")
@@ -1,9 +1,12 @@
 import json
 import os
 import base64
+import bisect
 import datetime
+from collections import Counter
 from itertools import cycle
 from PyQt6.QtCore import QObject, pyqtSignal, QRunnable, QThreadPool
+from logic.note_store import NoteStore, DraftStore, note_store_dir_for, drafts_dir_for, note_summary
 
 class SaveWorker(QRunnable):
     def __init__(self, filename, data, key, error_signal):
@@ -41,13 +44,28 @@ class SaveWorker(QRunnable):
 
 class DataManager(QObject):
     save_error = pyqtSignal(str)
+    stats_changed = pyqtSignal(int) # new stats_version
     
     def __init__(self, filename="data.json"):
         super().__init__()
         self.filename = filename
         self.key = "Fanqie_Secure_Key_2026" 
         self.thread_pool = QThreadPool.globalInstance()
+        # Note bodies live in their own files; the notes list keeps title, date, summary and digest
+        self.note_store = NoteStore(note_store_dir_for(filename), self.key)
+        self.note_drafts = DraftStore(drafts_dir_for(filename), self.key)
         self.data = self.load_data()
+        # Task id -> (category, position, record), kept in sync by the task delta methods
+        self._task_index = {}
+        self.rebuild_task_index()
+        # Note id -> record, oldest first; data["notes"] is only rebuilt from it for saving
+        self._notes = {}
+        self._note_order = None # Newest-first ids, rebuilt lazily after inserts and deletes
+        self._notes_dirty = False
+        self.rebuild_note_index()
+        # Bumped on every stats change so views can skip re-rendering unchanged stats
+        self.stats_version = 0
+        self.rebuild_stats_index()
 
     def _xor_cipher(self, text):
         # Legacy method for backward compatibility with old string-based encrypted data
@@ -103,6 +121,11 @@ class DataManager(QObject):
                             new_tasks["completed"].append(self._ensure_task_obj(t))
                         data["tasks"] = new_tasks
                 
+                notes = data.get("notes", [])
+                self._ensure_note_ids(notes)
+                self._externalize_note_bodies(notes)
+                self.note_store.prune({note.get("body") for note in notes if isinstance(note, dict)})
+                
                 default_data = self.get_default_data()
                 if "interruptions" not in data:
                     data["interruptions"] = []
@@ -126,6 +149,33 @@ class DataManager(QObject):
             }
         return task
 
+    def _ensure_note_ids(self, notes):
+        # Stable ids let the search index and the UI follow a note across edits and reordering
+        import uuid
+        seen = set()
+        for note in notes:
+            if isinstance(note, dict):
+                if not note.get("id") or note["id"] in seen:
+                    note["id"] = uuid.uuid4().hex
+                seen.add(note["id"])
+
+    def _externalize_note_bodies(self, notes):
+        # Moves inline bodies (older data files, freshly edited notes) into the note store
+        for note in notes:
+            if isinstance(note, dict) and "content" in note:
+                content = note.pop("content") or ""
+                note["body"] = self.note_store.put(content)
+                note["summary"] = note_summary(content)
+
+    def note_body(self, note):
+        """Full text of a note, read from the note store on demand."""
+        if "content" in note:
+            return note["content"]
+        if not note.get("body"):
+            return ""
+        content = self.note_store.get(note["body"])
+        return content if content is not None else ""
+
     def get_default_data(self):
         return {
             "tasks": {
@@ -147,8 +197,12 @@ class DataManager(QObject):
                 "work_mins": 25,
                 "break_mins": 5,
                 "long_break_mins": 15,
+                "schedule": "", # Custom cycle spec, e.g. "50/10x3 then 30"
+                "schedule_profiles": {}, # Weekday key ('mon'..'sun') -> cycle spec
+                "daily_goal": 8,
                 "sound_enabled": True,
                 "white_noise_enabled": False,
+                "white_noise_type": "pink", # 'white', 'pink', 'brown'
                 "auto_hide_sidebar": True,
                 "sidebar_manual_state": None, # None=Auto, 'collapsed', 'expanded'
                 "theme": "light"
@@ -156,14 +210,100 @@ class DataManager(QObject):
         }
 
     def save_data(self):
+        if self._notes_dirty:
+            # The file keeps notes as a newest-first list, as older versions expect
+            self.data["notes"] = self.notes()
+            self._notes_dirty = False
         # Fire and forget
         worker = SaveWorker(self.filename, self.data, self.key, self.save_error)
         self.thread_pool.start(worker)
 
     def update_tasks(self, tasks_dict):
         self.data["tasks"] = tasks_dict
+        self.rebuild_task_index()
+        self.save_data()
+
+    # Task id index
+    def rebuild_task_index(self):
+        self._task_index = {}
+        for category in list(self.data.get("tasks", {})):
+            self._reindex(category, 0)
+
+    def _reindex(self, category, start):
+        # Only positions from `start` onwards can have shifted
+        tasks = self.get_tasks(category)
+        for position in range(max(0, start), len(tasks)):
+            task = tasks[position]
+            if isinstance(task, dict) and task.get("id"):
+                self._task_index[task["id"]] = (category, position, task)
+
+    def find_task(self, task_id):
+        """(category, position, record) for a task id, or None."""
+        return self._task_index.get(task_id)
+
+    def get_task(self, task_id):
+        entry = self._task_index.get(task_id)
+        return entry[2] if entry else None
+
+    # Incremental task edits: each call is one delta and one save, whatever the board size
+    def get_tasks(self, category):
+        return self.data["tasks"].setdefault(category, [])
+
+    def set_category_tasks(self, category, tasks):
+        for task in self.get_tasks(category):
+            if isinstance(task, dict):
+                self._task_index.pop(task.get("id"), None)
+        self.data["tasks"][category] = list(tasks)
+        self._reindex(category, 0)
         self.save_data()
-                            
+
+    def add_task(self, category, task, row=None):
+        tasks = self.get_tasks(category)
+        row = len(tasks) if row is None else max(0, min(row, len(tasks)))
+        tasks.insert(row, self._ensure_task_obj(task))
+        self._reindex(category, row)
+        self.save_data()
+        return row
+
+    def remove_task(self, category, row):
+        task = self.get_tasks(category).pop(row)
+        if isinstance(task, dict):
+            self._task_index.pop(task.get("id"), None)
+        self._reindex(category, row)
+        self.save_data()
+        return task
+
+    def delete_task(self, task_id):
+        entry = self._task_index.get(task_id)
+        if entry is None:
+            return None
+        category, position, _ = entry
+        return self.remove_task(category, position)
+
+    def move_task(self, src_category, src_row, dest_category, dest_row):
+        """Move one task; dest_row is its final position in the destination list."""
+        task = self.get_tasks(src_category).pop(src_row)
+        dest = self.get_tasks(dest_category)
+        dest_row = max(0, min(dest_row, len(dest)))
+        dest.insert(dest_row, task)
+        if src_category == dest_category:
+            self._reindex(src_category, min(src_row, dest_row))
+        else:
+            self._reindex(src_category, src_row)
+            self._reindex(dest_category, dest_row)
+        self.save_data()
+        return task
+
+    def increment_task_pomodoros(self, task_id):
+        """Add a pomodoro to a task. Returns (category, position) or None if unknown."""
+        entry = self._task_index.get(task_id)
+        if entry is None:
+            return None
+        category, position, task = entry
+        task["pomodoros"] = task.get("pomodoros", 0) + 1
+        self.save_data()
+        return category, position
+
     def update_settings(self, settings_dict):
         current = self.data.get("settings", {})
         current.update(settings_dict)
@@ -171,15 +311,84 @@ class DataManager(QObject):
         self.save_data()
 
     def update_notes(self, notes_list):
+        self._ensure_note_ids(notes_list)
+        self._externalize_note_bodies(notes_list)
         self.data["notes"] = notes_list
+        self.rebuild_note_index()
         self.save_data()
 
+    # Note id map: lookups, inserts, edits and deletes are O(1); display order is a separate view
+    def rebuild_note_index(self):
+        notes = [note for note in self.data.get("notes", []) if isinstance(note, dict)]
+        self._ensure_note_ids(notes)
+        self._notes = {note["id"]: note for note in reversed(notes)}
+        self._note_order = None
+        self._notes_dirty = False
+
+    def get_note(self, note_id):
+        return self._notes.get(note_id)
+
+    def note_ids(self):
+        """Note ids newest first. Edits keep a note's place; new notes go first."""
+        if self._note_order is None:
+            self._note_order = list(reversed(self._notes))
+        return self._note_order
+
+    def notes(self):
+        """Notes newest first."""
+        return [self._notes[note_id] for note_id in self.note_ids()]
+
+    def save_note(self, note):
+        """Insert a new note or replace the note with the same id."""
+        self._ensure_note_ids([note])
+        self._externalize_note_bodies([note])
+        if note["id"] not in self._notes:
+            self._note_order = None
+        self._notes[note["id"]] = note # Replacing keeps the key's position
+        self._notes_dirty = True
+        self.save_data()
+        return note
+
+    def delete_note(self, note_id):
+        note = self._notes.pop(note_id, None)
+        if note is not None:
+            self._note_order = None
+            self._notes_dirty = True
+            self.save_data()
+        return note
+
+    # Stats index: history days in order and interruptions per day, kept current by the recorders
+    def rebuild_stats_index(self):
+        history = self.data.get("stats", {}).get("history", {})
+        self._history_dates = sorted(history)
+        self._interruption_days = Counter(str(i.get("timestamp", ""))[:10]
+                                          for i in self.data.get("interruptions", []))
+        self._touch_stats()
+
+    def _touch_stats(self, day=None):
+        # Views that cache per-day renders only need to redraw `last_stats_day` (None = everything)
+        self.last_stats_day = day
+        self.stats_version += 1
+        self.stats_changed.emit(self.stats_version)
+
+    def recent_history_dates(self, count):
+        """The `count` most recent days with recorded sessions, newest first."""
+        return self._history_dates[:-count - 1:-1]
+
+    def first_history_day(self):
+        return self._history_dates[0] if self._history_dates else None
+
+    def interruptions_on(self, day):
+        return self._interruption_days.get(day, 0)
+
     def record_interruption(self, type_name):
         entry = {
             "type": type_name,
             "timestamp": datetime.datetime.now().isoformat()
         }
         self.data["interruptions"].append(entry)
+        self._interruption_days[entry["timestamp"][:10]] += 1
+        self._touch_stats(entry["timestamp"][:10])
         self.save_data()
 
     def record_session(self, minutes, is_work=True):
@@ -190,6 +399,8 @@ class DataManager(QObject):
         
         if "history" not in stats: stats["history"] = {}
         
+        if today not in stats["history"]:
+            bisect.insort(self._history_dates, today)
         day_stats = stats["history"].get(today, {"minutes": 0, "count": 0})
         day_stats["minutes"] += minutes
         day_stats["count"] += 1
@@ -200,4 +411,5 @@ class DataManager(QObject):
         stats["total_days"] = len(stats["history"])
         
         self.data["stats"] = stats
+        self._touch_stats(today)
         self.save_data()
@@ -0,0 +1,51 @@
+import bisect
+import datetime
+
+# Focus minutes at which a day reaches heatmap levels 1-4 (level 0 = no focus)
+LEVEL_THRESHOLDS = (1, 25, 75, 150)
+LEVEL_COUNT = len(LEVEL_THRESHOLDS) + 1
+
+
+def days_in_year(year):
+    return (datetime.date(year + 1, 1, 1) - datetime.date(year, 1, 1)).days
+
+
+def level_for(minutes):
+    return bisect.bisect_right(LEVEL_THRESHOLDS, minutes)
+
+
+def year_levels(history, year):
+    """
+    Heatmap level of every day of `year` (index 0 = Jan 1), from a stats
+    history dict ({"YYYY-MM-DD": {"minutes": ..}}).
+
+    Days are bucketed in one pass: with NumPy the dates are parsed, scattered
+    into a dense per-day array and bucketed as whole arrays.
+    """
+    prefix = f"{year:04d}-"
+    days = [day for day in history if day.startswith(prefix)]
+    minutes = [history[day].get("minutes", 0) for day in days]
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        return _year_levels_numpy(np, year, days, minutes)
+    return _year_levels_python(year, days, minutes)
+
+
+def _year_levels_numpy(np, year, days, minutes):
+    dense = np.zeros(days_in_year(year), dtype=np.int64)
+    if days:
+        offsets = (np.array(days, dtype="datetime64[D]") - np.datetime64(f"{year:04d}-01-01", "D")).astype(np.int64)
+        np.add.at(dense, offsets, np.array(minutes, dtype=np.int64))
+    return np.searchsorted(np.array(LEVEL_THRESHOLDS), dense, side="right").tolist()
+
+
+def _year_levels_python(year, days, minutes):
+    dense = [0] * days_in_year(year)
+    start = datetime.date(year, 1, 1)
+    for day, value in zip(days, minutes):
+        dense[(datetime.date.fromisoformat(day) - start).days] += value
+    return [level_for(value) for value in dense]
@@ -0,0 +1,248 @@
+import sys
+import array
+import math
+import random
+import logging
+import importlib.util
+from PyQt6.QtCore import QObject, QThread, QIODevice, pyqtSignal
+
+_multimedia_module = None # Imported on first playback; False once the import failed
+
+SAMPLE_RATE = 44100
+LOOP_SECONDS = 8
+NOISE_KINDS = ("white", "pink", "brown")
+
+# Peak amplitude of the generated loop (fraction of int16 full scale)
+PEAK_LEVEL = 0.3
+# Crossfade length used by the pure-Python path to make the loop seamless
+CROSSFADE_SECONDS = 0.5
+
+
+def _multimedia():
+    """PyQt6.QtMultimedia, imported on first use, or None (missing audio backends on some systems)."""
+    global _multimedia_module
+    if _multimedia_module is None:
+        try:
+            from PyQt6 import QtMultimedia
+            _multimedia_module = QtMultimedia
+        except ImportError:
+            _multimedia_module = False
+            logging.error("Failed to import 'PyQt6.QtMultimedia'. White noise will be disabled.")
+    return _multimedia_module or None
+
+
+def multimedia_available():
+    """Whether QtMultimedia can be used, without importing it if it has not been yet."""
+    if _multimedia_module is None:
+        return importlib.util.find_spec("PyQt6.QtMultimedia") is not None
+    return bool(_multimedia_module)
+
+
+def generate_noise(kind="white", seconds=LOOP_SECONDS, sample_rate=SAMPLE_RATE, seed=None):
+    """Return a seamless mono int16 little-endian loop of the given noise colour."""
+    if kind not in NOISE_KINDS:
+        raise ValueError(f"Unknown noise kind: {kind}")
+    n = int(seconds * sample_rate)
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None:
+        return _generate_numpy(np, kind, n, seed)
+    return _generate_python(kind, n, seed)
+
+
+def _generate_numpy(np, kind, n, seed):
+    # Shape a white spectrum and invert it. The inverse real FFT is periodic
+    # over n samples, so the buffer loops without a seam.
+    rng = np.random.default_rng(seed)
+    spectrum = rng.standard_normal(n // 2 + 1) + 1j * rng.standard_normal(n // 2 + 1)
+    freqs = np.arange(n // 2 + 1, dtype=np.float64)
+    freqs[0] = 1.0
+    if kind == "pink":
+        spectrum /= np.sqrt(freqs)
+    elif kind == "brown":
+        spectrum /= freqs
+    spectrum[0] = 0  # Remove DC offset
+    samples = np.fft.irfft(spectrum, n)
+    peak = np.max(np.abs(samples)) or 1.0
+    samples = samples * (PEAK_LEVEL * 32767 / peak)
+    return samples.astype("<i2").tobytes()
+
+
+def _generate_python(kind, n, seed):
+    rng = random.Random(seed)
+    fade = min(int(CROSSFADE_SECONDS * SAMPLE_RATE), n // 4)
+    total = n + fade
+    samples = [0.0] * total
+
+    if kind == "white":
+        for i in range(total):
+            samples[i] = rng.uniform(-1.0, 1.0)
+    elif kind == "pink":
+        # Paul Kellet's economy pink filter
+        b0 = b1 = b2 = 0.0
+        for i in range(total):
+            white = rng.uniform(-1.0, 1.0)
+            b0 = 0.99765 * b0 + white * 0.0990460
+            b1 = 0.96300 * b1 + white * 0.2965164
+            b2 = 0.57000 * b2 + white * 1.0526913
+            samples[i] = b0 + b1 + b2 + white * 0.1848
+    else:
+        # Leaky integrator keeps brown noise from drifting away
+        last = 0.0
+        for i in range(total):
+            last = (last + 0.02 * rng.uniform(-1.0, 1.0)) * 0.998
+            samples[i] = last
+
+    # Equal-power crossfade of the overhang into the head so the loop is seamless
+    for i in range(fade):
+        t = i / fade
+        samples[i] = samples[i] * math.sin(t * math.pi / 2) + samples[n + i] * math.cos(t * math.pi / 2)
+    del samples[n:]
+
+    mean = sum(samples) / n
+    peak = max(abs(s - mean) for s in samples) or 1.0
+    scale = PEAK_LEVEL * 32767 / peak
+    pcm = array.array("h", (int((s - mean) * scale) for s in samples))
+    if sys.byteorder == "big":
+        pcm.byteswap()
+    return pcm.tobytes()
+
+
+class LoopDevice(QIODevice):
+    """Sequential device that endlessly replays a precomputed PCM buffer."""
+
+    def __init__(self, pcm, parent=None):
+        super().__init__(parent)
+        self._pcm = memoryview(pcm)
+        self._pos = 0
+
+    def isSequential(self):
+        return True
+
+    def bytesAvailable(self):
+        return len(self._pcm) + super().bytesAvailable()
+
+    def readData(self, maxlen):
+        # Only slices the shared buffer; no per-sample work happens here
+        size = len(self._pcm)
+        if size == 0:
+            return b""
+        maxlen -= maxlen % 2
+        end = self._pos + maxlen
+        if end <= size:
+            chunk = self._pcm[self._pos:end].tobytes()
+        else:
+            chunk = self._pcm[self._pos:].tobytes() + self._pcm[:end - size].tobytes()
+        self._pos = end % size
+        return chunk
+
+    def writeData(self, data):
+        return -1
+
+
+class NoiseThread(QThread):
+    """Dedicated audio thread that owns the QAudioSink and pulls from a LoopDevice."""
+    playback_error = pyqtSignal(str)
+
+    def __init__(self, pcm_source, volume=0.5, parent=None):
+        super().__init__(parent)
+        # Callable returning the loop buffer, so generation never blocks the GUI thread
+        self.pcm_source = pcm_source
+        self.volume = volume
+
+    def run(self):
+        try:
+            # Imported by NoisePlayer.start on the GUI thread
+            multimedia = _multimedia()
+            pcm = self.pcm_source()
+            fmt = multimedia.QAudioFormat()
+            fmt.setSampleRate(SAMPLE_RATE)
+            fmt.setChannelCount(1)
+            fmt.setSampleFormat(multimedia.QAudioFormat.SampleFormat.Int16)
+
+            device = LoopDevice(pcm)
+            device.open(QIODevice.OpenModeFlag.ReadOnly)
+            sink = multimedia.QAudioSink(multimedia.QMediaDevices.defaultAudioOutput(), fmt)
+            sink.setVolume(self.volume)
+            sink.start(device)
+        except Exception as e:
+            print(f"White noise playback error: {e}")
+            self.playback_error.emit(str(e))
+            return
+
+        self.exec()
+
+        sink.stop()
+        device.close()
+
+
+class NoisePlayer(QObject):
+    """
+    Plays background noise while a work session is running.
+    Loop buffers are generated once per kind and reused for every session.
+    """
+
+    def __init__(self, timer, kind="pink", enabled=False, volume=0.5):
+        super().__init__()
+        self.timer = timer
+        self.kind = kind
+        self.enabled = enabled
+        self.volume = volume
+        self._buffers = {}
+        self._thread = None
+
+        self.timer.mode_changed.connect(self._sync)
+        self.timer.running_changed.connect(self._sync)
+
+    @property
+    def available(self):
+        return multimedia_available()
+
+    @property
+    def is_playing(self):
+        return self._thread is not None and self._thread.isRunning()
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self._sync()
+
+    def set_kind(self, kind):
+        if kind not in NOISE_KINDS or kind == self.kind:
+            return
+        self.kind = kind
+        # Restart with the new buffer if currently playing
+        if self._thread is not None:
+            self.stop()
+        self._sync()
+
+    def get_buffer(self, kind):
+        if kind not in self._buffers:
+            self._buffers[kind] = generate_noise(kind)
+        return self._buffers[kind]
+
+    def should_play(self):
+        return self.enabled and self.timer.is_running and self.timer.current_mode == 'work'
+
+    def _sync(self, *args):
+        if self.should_play():
+            self.start()
+        else:
+            self.stop()
+
+    def start(self):
+        # QtMultimedia is only loaded once noise is actually played
+        if self._thread is not None or not self.available or _multimedia() is None:
+            return
+        kind = self.kind
+        self._thread = NoiseThread(lambda: self.get_buffer(kind), self.volume)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._thread.quit()
+        self._thread.wait()
+        self._thread = None
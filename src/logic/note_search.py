@@ -0,0 +1,147 @@
+from collections import OrderedDict
+from functools import partial
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from logic.search_index import SearchIndex, query_terms
+
+# Number of recent queries whose result sets are kept
+CACHE_SIZE = 64
+
+
+class SearchSignals(QObject):
+    # generation, version, lowercased query, ranked keys
+    finished = pyqtSignal(int, int, str, object)
+
+
+class SearchWorker(QRunnable):
+    def __init__(self, generation, version, query, index, kind, docs, candidates, signals):
+        super().__init__()
+        self.generation = generation
+        self.version = version
+        self.query = query
+        self.index = index
+        self.kind = kind
+        self.docs = docs
+        self.candidates = candidates
+        self.signals = signals
+
+    def run(self):
+        try:
+            if self.docs is not None:
+                # Only documents that changed since the last sync are re-tokenized
+                self.index.sync(self.kind, self.docs)
+            ranked = self.index.search(self.query, kind=self.kind, candidates=self.candidates)
+            keys = tuple(key for key, score in ranked)
+            self.signals.finished.emit(self.generation, self.version, self.query, keys)
+        except Exception as e:
+            print(f"Search error: {e}")
+
+
+class NoteSearcher(QObject):
+    """
+    Debounced full-text search over one kind of document ("note" or "task")
+    in a shared SearchIndex. Indexing and searching run off the GUI thread.
+
+    Results are document ids in BM25 order. Recent result sets are cached per
+    query, and a query that extends a cached one only searches the cached
+    matches, since typing more can only narrow the result.
+    """
+    results_ready = pyqtSignal(str, object) # query, tuple of ids (None = no filter)
+
+    def __init__(self, index=None, kind="note", debounce_ms=250, thread_pool=None):
+        super().__init__()
+        self.index = index if index is not None else SearchIndex()
+        self.kind = kind
+        if thread_pool is None:
+            # One worker at a time, so index syncs and searches run in request order
+            thread_pool = QThreadPool(self)
+            thread_pool.setMaxThreadCount(1)
+        self.thread_pool = thread_pool
+        self.query = ""
+        self.version = 0
+        self.cache_hits = 0
+        self.narrowed_searches = 0
+        self._pending_docs = None
+        self._cache = OrderedDict()
+        self._generation = 0
+
+        self._signals = SearchSignals()
+        self._signals.finished.connect(self._on_finished)
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce_ms)
+        self._debounce.timeout.connect(lambda: self.search_now(self.query))
+
+    def set_docs(self, docs):
+        """Replace the searchable documents, a list of (id, title, text), and rerun the query."""
+        self.version += 1
+        self._pending_docs = docs
+        self._cache.clear()
+        if self.query:
+            self.search_now(self.query)
+
+    def set_notes(self, notes, body=None):
+        """
+        Index notes. `body(note)` returns a note's full text; it runs in the
+        worker thread and only for notes whose title or body digest changed.
+        """
+        if body is None:
+            body = lambda note: note.get("content", "")
+        self.set_docs([(note.get("id"), note.get("title", ""), partial(body, note),
+                        (note.get("title", ""), note.get("body"), note.get("content")))
+                       for note in notes])
+
+    def search(self, query):
+        """Debounced: only the last query typed within the interval is run."""
+        self.query = query
+        self._debounce.start()
+
+    def search_now(self, query):
+        self._debounce.stop()
+        self.query = query
+        self._generation += 1
+        if not query.strip():
+            # Nothing to search for: show everything
+            self.results_ready.emit(query, None)
+            return
+
+        # Matching is case-insensitive, so results are cached per lowercased query
+        key = query.lower()
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            self.results_ready.emit(query, cached)
+            return
+
+        candidates = self._narrowing_candidates(key)
+        if candidates is not None:
+            self.narrowed_searches += 1
+        docs, self._pending_docs = self._pending_docs, None
+        worker = SearchWorker(self._generation, self.version, key, self.index, self.kind,
+                              docs, candidates, self._signals)
+        self.thread_pool.start(worker)
+
+    def _narrowing_candidates(self, query):
+        # Smallest cached result among queries this one extends. A query without
+        # terms matched by substring, which a query with terms need not contain.
+        has_terms = bool(query_terms(query))
+        best = None
+        for previous, ids in self._cache.items():
+            if not query.startswith(previous) or (has_terms and not query_terms(previous)):
+                continue
+            if best is None or len(ids) < len(best):
+                best = ids
+        if best is None:
+            return None
+        return {(self.kind, doc_id) for doc_id in best}
+
+    def _on_finished(self, generation, version, key, keys):
+        if version != self.version:
+            return # Documents changed while the worker ran
+        ids = tuple(doc_id for kind, doc_id in keys)
+        self._cache[key] = ids
+        while len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+        if generation == self._generation:
+            self.results_ready.emit(self.query, ids)
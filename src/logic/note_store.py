@@ -0,0 +1,169 @@
+import os
+import json
+import time
+import hashlib
+from itertools import cycle
+from collections import OrderedDict
+
+# Characters of the body kept inline as the table summary
+SUMMARY_LENGTH = 60
+# Number of recently read bodies kept decrypted in memory
+BODY_CACHE_SIZE = 16
+
+
+def note_store_dir_for(data_filename):
+    """data.json -> data.notes/, kept next to the main data file."""
+    base, _ = os.path.splitext(os.path.abspath(data_filename))
+    return f"{base}.notes"
+
+
+def drafts_dir_for(data_filename):
+    """data.json -> data.drafts/, kept next to the main data file."""
+    base, _ = os.path.splitext(os.path.abspath(data_filename))
+    return f"{base}.drafts"
+
+
+def xor_bytes(data_bytes, key_bytes):
+    return bytes(a ^ b for a, b in zip(data_bytes, cycle(key_bytes)))
+
+
+def write_atomic(path, data_bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data_bytes)
+    os.replace(temp_path, path)
+
+
+def note_summary(content):
+    summary = content[:SUMMARY_LENGTH].replace("\n", " ")
+    if len(content) > SUMMARY_LENGTH:
+        summary += "..."
+    return summary
+
+
+class NoteStore:
+    """
+    Content-addressed note bodies, one encrypted file per distinct body.
+
+    A body is named by the SHA-256 of its text, so saving an unchanged body
+    writes nothing and the main data file only carries the digest. Bodies are
+    read on demand and the most recent ones are cached.
+    """
+
+    def __init__(self, directory, key):
+        self.directory = directory
+        self.key_bytes = key.encode('utf-8')
+        self.reads = 0
+        self._cache = OrderedDict()
+
+    @staticmethod
+    def digest(text):
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def path_for(self, digest):
+        return os.path.join(self.directory, digest)
+
+    def put(self, text):
+        """Store a body and return its digest. Existing bodies are not rewritten."""
+        digest = self.digest(text)
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            write_atomic(path, xor_bytes(text.encode('utf-8'), self.key_bytes))
+        self._remember(digest, text)
+        return digest
+
+    def get(self, digest):
+        """The body for a digest, or None if it is missing or unreadable."""
+        text = self._cache.get(digest)
+        if text is not None:
+            self._cache.move_to_end(digest)
+            return text
+        try:
+            with open(self.path_for(digest), "rb") as f:
+                text = xor_bytes(f.read(), self.key_bytes).decode('utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Failed to read note body {digest}: {e}")
+            return None
+        self.reads += 1
+        self._remember(digest, text)
+        return text
+
+    def prune(self, keep):
+        """Delete stored bodies whose digest is not in `keep`. Returns how many were removed."""
+        if not os.path.isdir(self.directory):
+            return 0
+        removed = 0
+        for name in os.listdir(self.directory):
+            if name in keep:
+                continue
+            try:
+                os.remove(os.path.join(self.directory, name))
+                removed += 1
+            except OSError as e:
+                print(f"Failed to remove note body {name}: {e}")
+            self._cache.pop(name, None)
+        return removed
+
+    def _remember(self, digest, text):
+        self._cache[digest] = text
+        self._cache.move_to_end(digest)
+        while len(self._cache) > BODY_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+
+class DraftStore:
+    """
+    Unsaved note editor state, one small encrypted file per note being edited.
+
+    The editor writes here while the user types; the main data file is only
+    touched when the note is saved, after which the draft is discarded. Drafts
+    left behind by a crash are found again with `pending()`.
+    """
+
+    def __init__(self, directory, key):
+        self.directory = directory
+        self.key_bytes = key.encode('utf-8')
+        self.writes = 0
+
+    def path_for(self, note_id):
+        return os.path.join(self.directory, f"{note_id}.draft")
+
+    def save(self, note_id, title, content):
+        draft = {"note_id": note_id, "title": title, "content": content, "saved_at": time.time()}
+        data_bytes = json.dumps(draft, ensure_ascii=False).encode('utf-8')
+        write_atomic(self.path_for(note_id), xor_bytes(data_bytes, self.key_bytes))
+        self.writes += 1
+        return draft
+
+    def load(self, note_id):
+        """The draft for a note, or None."""
+        path = self.path_for(note_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                return json.loads(xor_bytes(f.read(), self.key_bytes).decode('utf-8'))
+        except (OSError, ValueError) as e:
+            print(f"Failed to read note draft {note_id}: {e}")
+            return None
+
+    def discard(self, note_id):
+        try:
+            os.remove(self.path_for(note_id))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Failed to remove note draft {note_id}: {e}")
+
+    def pending(self):
+        """Drafts on disk, oldest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        drafts = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".draft"):
+                draft = self.load(name[:-len(".draft")])
+                if draft is not None:
+                    drafts.append(draft)
+        return sorted(drafts, key=lambda draft: draft.get("saved_at", 0))
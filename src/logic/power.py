@@ -0,0 +1,73 @@
+from PyQt6.QtCore import QObject, QTimer, QEvent, Qt, pyqtSignal
+
+class PowerManager(QObject):
+    """
+    Enters a low-power state while none of the watched windows is visible.
+
+    In low power the countdown display timer and tick fan-out are suspended, as are
+    any registered UI timers (hover polls and the like). Only the scheduler deadline
+    stays armed, so a session still ends on time but an idle app does not wake up.
+    Showing any window leaves low power and refreshes every display immediately.
+    """
+    low_power_changed = pyqtSignal(bool)
+
+    def __init__(self, timer, windows=()):
+        super().__init__()
+        self.timer = timer
+        self.low_power = False
+        self._windows = []
+        self._ui_timers = []
+        self._resume_timers = []
+
+        # Show/Hide pairs (e.g. main window -> floating window) settle within one
+        # event loop pass, so evaluate once afterwards instead of on every event
+        self._evaluate_timer = QTimer(self)
+        self._evaluate_timer.setSingleShot(True)
+        self._evaluate_timer.setInterval(0)
+        self._evaluate_timer.timeout.connect(self.evaluate)
+
+        for window in windows:
+            self.watch(window)
+
+    def watch(self, window):
+        self._windows.append(window)
+        window.installEventFilter(self)
+        self._evaluate_timer.start()
+
+    def register_timer(self, qtimer):
+        """A repeating UI timer that is paused in low power and restarted afterwards."""
+        self._ui_timers.append(qtimer)
+        if self.low_power and qtimer.isActive():
+            qtimer.stop()
+            self._resume_timers.append(qtimer)
+
+    def any_window_visible(self):
+        return any(w.isVisible() and not (w.windowState() & Qt.WindowState.WindowMinimized)
+                   for w in self._windows)
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Type.Show, QEvent.Type.Hide, QEvent.Type.WindowStateChange):
+            self._evaluate_timer.start()
+        return super().eventFilter(obj, event)
+
+    def evaluate(self):
+        self.set_low_power(not self.any_window_visible())
+
+    def set_low_power(self, enabled):
+        if enabled == self.low_power:
+            return
+        self.low_power = enabled
+        if enabled:
+            self.timer.suspend_display()
+            self.timer.dispatcher.set_suspended(True)
+            self._resume_timers = [t for t in self._ui_timers if t.isActive()]
+            for qtimer in self._resume_timers:
+                qtimer.stop()
+        else:
+            for qtimer in self._resume_timers:
+                qtimer.start()
+            self._resume_timers = []
+            # Catch up the remaining time first so resuming delivers it in one pass
+            self.timer.resume_display()
+            self.timer.dispatcher.set_suspended(False)
+        self.low_power_changed.emit(enabled)
@@ -1,17 +1,16 @@
 from PyQt6.QtCore import QThread, pyqtSignal
 import logging
 
-# Defensive import for requests
-try:
-    import requests
-except ImportError:
-    requests = None
-    logging.error("Failed to import 'requests' module. Network features will be disabled.")
-
 class QuoteWorker(QThread):
     quote_fetched = pyqtSignal(str, str) # content, author
 
     def run(self):
+        # Imported here, on the worker thread, so the networking stack never weighs on startup
+        try:
+            import requests
+        except ImportError:
+            logging.error("Failed to import 'requests' module. Network features will be disabled.")
+            requests = None
         if requests is None:
             self.quote_fetched.emit("生活原本沉闷，但跑起来就有风。", "—— 佚名")
             return
@@ -0,0 +1,176 @@
+import re
+import bisect
+import datetime
+from collections import namedtuple
+
+MODES = ("work", "break", "long_break")
+WEEKDAY_KEYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+WEEKDAY_NAMES = ("周一", "周二", "周三", "周四", "周五", "周六", "周日")
+
+MAX_MINUTES = 240
+MAX_REPEAT = 20
+
+Step = namedtuple("Step", "mode seconds")
+
+_SEGMENT_RE = re.compile(r"^(\d+(?:\.\d+)?)\s*/\s*(\d+(?:\.\d+)?)(?:\s*x\s*(\d+))?$")
+
+
+def _minutes(value, spec):
+    minutes = float(value)
+    if minutes <= 0 or minutes > MAX_MINUTES:
+        raise ValueError(f"时长必须在 1-{MAX_MINUTES} 分钟之间: {spec}")
+    return int(round(minutes * 60))
+
+
+def parse_schedule(spec):
+    """
+    Parse a cycle spec into steps.
+
+    Segments are "work/break" with an optional "xN" repeat, separated by "," or "+".
+    A trailing "then N" turns the last break of the cycle into an N minute long break:
+        "25/5x4 then 15"   classic pomodoro
+        "50/10x3 then 30"  three 50/10 blocks, long break after the third
+        "90/20"            ultradian blocks
+    """
+    text = spec.strip().lower().replace("×", "x").replace("，", ",").replace("然后", "then")
+    if not text:
+        raise ValueError("计划不能为空")
+
+    long_break = None
+    if "then" in text:
+        text, _, tail = text.partition("then")
+        tail = tail.strip()
+        if not re.fullmatch(r"\d+(?:\.\d+)?", tail):
+            raise ValueError(f"无法识别的长休息时长: {tail}")
+        long_break = _minutes(tail, spec)
+
+    steps = []
+    for segment in re.split(r"[,+]", text):
+        segment = segment.strip()
+        if not segment:
+            continue
+        match = _SEGMENT_RE.match(segment)
+        if not match:
+            raise ValueError(f"无法识别的计划片段: {segment}")
+        work, brk, repeat = match.groups()
+        repeat = int(repeat) if repeat else 1
+        if not 1 <= repeat <= MAX_REPEAT:
+            raise ValueError(f"重复次数必须在 1-{MAX_REPEAT} 之间: {segment}")
+        for _ in range(repeat):
+            steps.append(Step("work", _minutes(work, spec)))
+            steps.append(Step("break", _minutes(brk, spec)))
+
+    if not steps:
+        raise ValueError("计划不能为空")
+    if long_break is not None:
+        steps[-1] = Step("long_break", long_break)
+    return steps
+
+
+class SessionPlan:
+    """
+    A compiled, repeating sequence of steps.
+    Everything a mode switch or prediction needs is precomputed, so lookups are O(1)
+    (predictions are O(log n) in the number of work steps per cycle).
+    """
+
+    def __init__(self, steps, spec=""):
+        if not steps:
+            raise ValueError("Plan needs at least one step")
+        self.steps = tuple(Step(mode, int(seconds)) for mode, seconds in steps)
+        self.spec = spec
+        n = len(self.steps)
+
+        # End offset of every step relative to the cycle start
+        self._ends = []
+        total = 0
+        for step in self.steps:
+            total += step.seconds
+            self._ends.append(total)
+        self.cycle_seconds = total
+
+        # Cycle offsets at which work steps end, used for end-time prediction
+        self._work_ends = [self._ends[i] for i, step in enumerate(self.steps) if step.mode == "work"]
+        self.work_per_cycle = len(self._work_ends)
+
+        # next_of_mode[i][mode]: first index >= i (cyclically) with that mode
+        self._next_of_mode = [dict() for _ in range(n)]
+        for mode in MODES:
+            upcoming = None
+            for i in range(2 * n - 1, -1, -1):
+                if self.steps[i % n].mode == mode:
+                    upcoming = i % n
+                if i < n and upcoming is not None:
+                    self._next_of_mode[i][mode] = upcoming
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __eq__(self, other):
+        return isinstance(other, SessionPlan) and self.steps == other.steps
+
+    def step(self, index):
+        return self.steps[index]
+
+    def next_index(self, index):
+        return (index + 1) % len(self.steps)
+
+    def find(self, mode, start=0):
+        """Index of the first step with `mode` at or after `start`, or None."""
+        return self._next_of_mode[start % len(self.steps)].get(mode)
+
+    def first_seconds(self, mode, default=0):
+        index = self.find(mode)
+        return self.steps[index].seconds if index is not None else default
+
+    def seconds_until_sessions(self, index, remaining, sessions):
+        """
+        Seconds until `sessions` more work steps are completed, starting from step
+        `index` with `remaining` seconds left in it. Returns None if the plan has no work.
+        """
+        if sessions <= 0:
+            return 0
+        if not self._work_ends:
+            return None
+        position = self._ends[index] - remaining
+        first = bisect.bisect_right(self._work_ends, position)
+        cycles, k = divmod(first + sessions - 1, self.work_per_cycle)
+        return cycles * self.cycle_seconds + self._work_ends[k] - position
+
+    def predict_finish(self, index, remaining, sessions, now=None):
+        seconds = self.seconds_until_sessions(index, remaining, sessions)
+        if seconds is None:
+            return None
+        now = now or datetime.datetime.now()
+        return now + datetime.timedelta(seconds=seconds)
+
+
+def default_plan(work_mins=25, break_mins=5, long_break_mins=15, every=4):
+    work, brk, long_break = (int(m * 60) for m in (work_mins, break_mins, long_break_mins))
+    steps = [Step("work", work), Step("break", brk)] * every
+    steps[-1] = Step("long_break", long_break)
+    spec = f"{work_mins:g}/{break_mins:g}x{every} then {long_break_mins:g}"
+    return SessionPlan(steps, spec)
+
+
+def compile_schedule(spec):
+    return SessionPlan(parse_schedule(spec), spec.strip())
+
+
+def plan_for_day(settings, day=None):
+    """
+    Pick the plan for a date: weekday profile, then the custom schedule,
+    then the classic plan built from the duration settings.
+    """
+    day = day or datetime.date.today()
+    profiles = settings.get("schedule_profiles") or {}
+    candidates = (profiles.get(WEEKDAY_KEYS[day.weekday()]), settings.get("schedule"))
+    for spec in candidates:
+        if spec:
+            try:
+                return compile_schedule(spec)
+            except ValueError as e:
+                print(f"Invalid schedule '{spec}': {e}")
+    return default_plan(settings.get("work_mins", 25),
+                        settings.get("break_mins", 5),
+                        settings.get("long_break_mins", 15))
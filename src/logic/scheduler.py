@@ -0,0 +1,174 @@
+import math
+import time
+import heapq
+import itertools
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+
+class NamedTimer:
+    __slots__ = ("name", "label", "duration", "deadline", "remaining", "generation", "internal")
+
+    def __init__(self, name, seconds, label=None, internal=False):
+        self.name = name
+        self.label = label or name
+        self.duration = seconds
+        self.deadline = None     # Monotonic deadline while running, None while paused
+        self.remaining = seconds # Remaining seconds while paused
+        self.generation = 0      # Bumped on every (re)arm so stale heap entries are skipped
+        self.internal = internal # Internal timers (e.g. the pomodoro session) are not listed
+
+    @property
+    def is_running(self):
+        return self.deadline is not None
+
+
+class TimerScheduler(QObject):
+    """
+    Owns any number of named countdowns.
+
+    Deadlines live in a min-heap and a single QTimer is armed for the earliest one,
+    so N timers cost no more wakeups than one. An optional display heartbeat is folded
+    into the same wakeup and only runs while a listed timer is counting down.
+    """
+    timer_finished = pyqtSignal(str, str) # name, label
+    timers_changed = pyqtSignal()
+    heartbeat = pyqtSignal()
+
+    def __init__(self, clock=time.monotonic):
+        super().__init__()
+        self._clock = clock
+        self._timers = {}
+        self._heap = []
+        self._seq = itertools.count()
+        self._heartbeat_ms = 0
+        self._next_heartbeat = None
+        self.wakeups = 0
+
+        self._wakeup = QTimer(self)
+        self._wakeup.setSingleShot(True)
+        self._wakeup.setTimerType(Qt.TimerType.PreciseTimer)
+        self._wakeup.timeout.connect(self._on_wakeup)
+
+    # Public API
+    def add(self, name, seconds, label=None, internal=False, start=True):
+        """Create (or replace) a countdown of `seconds` called `name`."""
+        existing = self._timers.get(name)
+        generation = existing.generation + 1 if existing else 0
+        entry = NamedTimer(name, seconds, label, internal)
+        entry.generation = generation
+        self._timers[name] = entry
+        if start:
+            self._arm(entry)
+        self._reschedule()
+        self.timers_changed.emit()
+        return entry
+
+    def pause(self, name):
+        entry = self._timers.get(name)
+        if entry is None or not entry.is_running:
+            return
+        entry.remaining = max(0.0, entry.deadline - self._clock())
+        entry.deadline = None
+        entry.generation += 1
+        self._reschedule()
+        self.timers_changed.emit()
+
+    def resume(self, name):
+        entry = self._timers.get(name)
+        if entry is None or entry.is_running:
+            return
+        self._arm(entry)
+        self._reschedule()
+        self.timers_changed.emit()
+
+    def cancel(self, name):
+        if self._timers.pop(name, None) is None:
+            return
+        self._reschedule()
+        self.timers_changed.emit()
+
+    def clear(self, include_internal=False):
+        for name in [n for n, t in self._timers.items() if include_internal or not t.internal]:
+            del self._timers[name]
+        self._reschedule()
+        self.timers_changed.emit()
+
+    def has_timer(self, name):
+        return name in self._timers
+
+    def remaining(self, name):
+        entry = self._timers.get(name)
+        if entry is None:
+            return 0.0
+        if entry.is_running:
+            return max(0.0, entry.deadline - self._clock())
+        return entry.remaining
+
+    def timers(self, include_internal=False):
+        """Timers sorted by time left."""
+        entries = [t for t in self._timers.values() if include_internal or not t.internal]
+        return sorted(entries, key=lambda t: self.remaining(t.name))
+
+    def set_heartbeat(self, interval_ms):
+        """Emit `heartbeat` every interval while a listed timer runs (0 disables)."""
+        self._heartbeat_ms = max(0, int(interval_ms))
+        self._next_heartbeat = None
+        self._reschedule()
+
+    # Internals
+    def _arm(self, entry):
+        entry.deadline = self._clock() + entry.remaining
+        entry.generation += 1
+        heapq.heappush(self._heap, (entry.deadline, next(self._seq), entry.name, entry.generation))
+
+    def _is_stale(self, item):
+        entry = self._timers.get(item[2])
+        return entry is None or entry.generation != item[3] or not entry.is_running
+
+    def _reschedule(self):
+        while self._heap and self._is_stale(self._heap[0]):
+            heapq.heappop(self._heap)
+
+        now = self._clock()
+        candidates = []
+        if self._heap:
+            candidates.append(self._heap[0][0])
+
+        wants_heartbeat = self._heartbeat_ms and any(
+            t.is_running and not t.internal for t in self._timers.values())
+        if wants_heartbeat:
+            if self._next_heartbeat is None:
+                self._next_heartbeat = now + self._heartbeat_ms / 1000
+            candidates.append(self._next_heartbeat)
+        else:
+            self._next_heartbeat = None
+
+        if not candidates:
+            self._wakeup.stop()
+            return
+        delay_ms = max(0, math.ceil((min(candidates) - now) * 1000))
+        self._wakeup.start(delay_ms)
+
+    def _on_wakeup(self):
+        self.wakeups += 1
+        now = self._clock()
+
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            item = heapq.heappop(self._heap)
+            if self._is_stale(item):
+                continue
+            entry = self._timers.pop(item[2])
+            due.append(entry)
+
+        beat = self._next_heartbeat is not None and self._next_heartbeat <= now
+        if beat:
+            self._next_heartbeat = now + self._heartbeat_ms / 1000
+
+        self._reschedule()
+
+        for entry in due:
+            self.timer_finished.emit(entry.name, entry.label)
+        if due:
+            self.timers_changed.emit()
+        if beat:
+            self.heartbeat.emit()
@@ -0,0 +1,277 @@
+import re
+import math
+import bisect
+import threading
+import unicodedata
+from collections import Counter
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# Title terms count this many times towards a document's term frequency
+TITLE_WEIGHT = 2
+
+# Scripts written without spaces between words: kana, CJK ideographs and Hangul
+_NGRAM_CHARS = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af"
+_NGRAM_RE = re.compile(f"[{_NGRAM_CHARS}]")
+# N-gram runs, or words: letters and digits of any other script
+_RUN_RE = re.compile(f"[{_NGRAM_CHARS}]+|[^\\W_{_NGRAM_CHARS}]+")
+
+
+def _is_cjk(run):
+    return _NGRAM_RE.match(run) is not None
+
+
+def _normalize(text):
+    # Composed characters (so a decomposed accent does not split its word) and
+    # full-width/half-width forms folded to the usual ones
+    return unicodedata.normalize("NFKC", text.lower())
+
+
+def _fold(word):
+    # "Café" and "cafe" are the same word
+    return "".join(c for c in unicodedata.normalize("NFD", word) if not unicodedata.combining(c))
+
+
+def _runs(text):
+    return _RUN_RE.findall(_normalize(text))
+
+
+def haystack(text, title=""):
+    """Text searched for queries that have no terms (e.g. punctuation only)."""
+    return _normalize(f"{title}\x00{text}")
+
+
+def tokenize(text):
+    """
+    Index terms for a text.
+
+    CJK runs (including kana and Hangul) have no word boundaries, so they are
+    indexed as overlapping character n-grams (unigrams, bigrams and
+    trigrams). Other runs are indexed as lowercase words with accents removed.
+    """
+    terms = []
+    for run in _runs(text):
+        if _is_cjk(run):
+            for n in (1, 2, 3):
+                terms.extend(run[i:i + n] for i in range(len(run) - n + 1))
+        else:
+            terms.append(_fold(run))
+    return terms
+
+
+def query_terms(query):
+    """
+    Terms a query must match, as (term, is_prefix) pairs.
+
+    CJK runs use the longest n-gram that fits: a single character looks up the
+    unigram, two characters the bigram, longer runs every trigram. Words
+    match as prefixes so results appear while a word is being typed.
+    """
+    terms = []
+    for run in _runs(query):
+        if _is_cjk(run):
+            n = min(len(run), 3)
+            terms.extend((run[i:i + n], False) for i in range(len(run) - n + 1))
+        else:
+            terms.append((_fold(run), True))
+    return list(dict.fromkeys(terms))
+
+
+class SearchIndex:
+    """
+    Inverted index over notes and tasks with BM25 ranking.
+
+    Documents are keyed by (kind, id). Adding, replacing and removing a document
+    only touches that document's postings. All methods are thread-safe so
+    searches can run in a worker thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Postings use small integer document numbers, which hash much faster than keys
+        self._docnos = {}     # key -> docno
+        self._keys = {}       # docno -> key
+        self._next_docno = 0
+        self._kind_docs = {}  # kind -> set of docnos
+        self._postings = {}   # term -> {docno: tf}
+        self._doc_terms = {}  # docno -> Counter of terms
+        self._doc_len = {}    # docno -> number of terms
+        self._sources = {}    # key -> stamp of the version last indexed, for change detection
+        self._total_len = 0
+        self._haystacks = {}  # docno -> haystack(), for queries without terms
+        self._word_terms = None  # Sorted word (non n-gram) vocabulary for prefix lookups, rebuilt lazily
+        self.docs_examined = 0   # Document numbers looked at while intersecting, for tests and profiling
+
+    def __len__(self):
+        return len(self._docnos)
+
+    def __contains__(self, key):
+        return key in self._docnos
+
+    def add(self, key, text, title=""):
+        with self._lock:
+            self._add(key, text, title)
+
+    def remove(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def sync(self, kind, docs):
+        """
+        Make the documents of `kind` match `docs`, an iterable of (id, title, text)
+        or (id, title, text, stamp). Unchanged documents are skipped, so this
+        costs one comparison per document plus tokenizing whatever actually changed.
+
+        Documents are compared by `stamp` when given, else by (title, text). With
+        a stamp, `text` may be a callable that is only called for changed documents.
+        """
+        with self._lock:
+            seen = set()
+            for doc in docs:
+                doc_id, title, text = doc[:3]
+                stamp = doc[3] if len(doc) > 3 else (title, text)
+                key = (kind, doc_id)
+                seen.add(key)
+                if self._sources.get(key) != stamp:
+                    self._add(key, text() if callable(text) else text, title, stamp)
+            stale = [self._keys[docno] for docno in self._kind_docs.get(kind, ())
+                     if self._keys[docno] not in seen]
+            for key in stale:
+                self._remove(key)
+
+    def search(self, query, kind=None, candidates=None, limit=None):
+        """
+        BM25-ranked [(key, score)] for documents containing every query term.
+
+        A query without terms (punctuation, symbols) matches documents that
+        contain it as a substring, in document order with a score of 0.
+        """
+        terms = query_terms(query)
+        if not terms:
+            return self._search_substring(query, kind, candidates, limit)
+        with self._lock:
+            n_docs = len(self._docnos)
+            if n_docs == 0:
+                return []
+            avg_len = self._total_len / n_docs
+
+            # Each query term becomes the union of the index terms it stands for
+            groups = []
+            for term, is_prefix in terms:
+                expanded = self._expand_prefix(term) if is_prefix else [term]
+                postings = [self._postings[t] for t in expanded if t in self._postings]
+                if not postings:
+                    return []
+                groups.append(postings)
+
+            # Intersect starting from the candidates, else from the rarest term, so
+            # a narrowed search only looks up the documents that can still match
+            groups.sort(key=lambda g: sum(len(p) for p in g))
+            docs = None
+            if candidates is not None:
+                docs = {self._docnos[key] for key in candidates if key in self._docnos}
+            for postings in groups:
+                docs = self._intersect(docs, postings)
+                if not docs:
+                    return []
+            if kind is not None:
+                docs &= self._kind_docs.get(kind, set())
+
+            # Length normalisation only depends on the document, so compute it once
+            doc_len = self._doc_len
+            norms = {docno: K1 * (1 - B + B * doc_len[docno] / avg_len) for docno in docs}
+            scores = dict.fromkeys(docs, 0.0)
+            for postings in groups:
+                for posting in postings:
+                    idf = math.log(1 + (n_docs - len(posting) + 0.5) / (len(posting) + 0.5))
+                    weight = idf * (K1 + 1)
+                    # Walk whichever side is smaller
+                    if len(posting) < len(docs):
+                        hits = [(docno, tf) for docno, tf in posting.items() if docno in norms]
+                    else:
+                        hits = [(docno, posting[docno]) for docno in docs if docno in posting]
+                    for docno, tf in hits:
+                        scores[docno] += weight * tf / (tf + norms[docno])
+
+            # Ties keep document order, i.e. older documents first
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+            if limit:
+                ranked = ranked[:limit]
+            keys = self._keys
+            return [(keys[docno], score) for docno, score in ranked]
+
+    def _search_substring(self, query, kind, candidates, limit):
+        needle = _normalize(query.strip())
+        if not needle:
+            return []
+        with self._lock:
+            docs = self._keys if kind is None else self._kind_docs.get(kind, set())
+            if candidates is not None:
+                docs = [docno for docno in map(self._docnos.get, candidates) if docno in docs]
+            self.docs_examined += len(docs)
+            matches = sorted(docno for docno in docs if needle in self._haystacks[docno])
+            if limit:
+                matches = matches[:limit]
+            return [(self._keys[docno], 0.0) for docno in matches]
+
+    # Internals (callers hold the lock)
+    def _intersect(self, docs, postings):
+        # Documents in `docs` (all documents if None) that appear in any of `postings`
+        size = sum(len(p) for p in postings)
+        if docs is None:
+            self.docs_examined += size
+            return set(postings[0]) if len(postings) == 1 else set().union(*postings)
+        if len(docs) * len(postings) <= size:
+            self.docs_examined += len(docs)
+            return {docno for docno in docs if any(docno in posting for posting in postings)}
+        self.docs_examined += size
+        return docs.intersection(postings[0] if len(postings) == 1 else set().union(*postings))
+
+    def _add(self, key, text, title, stamp=None):
+        self._remove(key)
+        terms = Counter(tokenize(text))
+        for term in tokenize(title):
+            terms[term] += TITLE_WEIGHT
+        docno = self._next_docno
+        self._next_docno += 1
+        for term, tf in terms.items():
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = {}
+                if not _is_cjk(term):
+                    self._word_terms = None
+            posting[docno] = tf
+        length = sum(terms.values())
+        self._docnos[key] = docno
+        self._keys[docno] = key
+        self._kind_docs.setdefault(key[0], set()).add(docno)
+        self._doc_terms[docno] = terms
+        self._doc_len[docno] = length
+        self._haystacks[docno] = haystack(text, title)
+        self._sources[key] = stamp if stamp is not None else (title, text)
+        self._total_len += length
+
+    def _remove(self, key):
+        docno = self._docnos.pop(key, None)
+        if docno is None:
+            return
+        for term in self._doc_terms.pop(docno):
+            posting = self._postings[term]
+            del posting[docno]
+            if not posting:
+                del self._postings[term]
+                if not _is_cjk(term):
+                    self._word_terms = None
+        del self._keys[docno]
+        self._kind_docs[key[0]].discard(docno)
+        self._total_len -= self._doc_len.pop(docno)
+        del self._haystacks[docno]
+        del self._sources[key]
+
+    def _expand_prefix(self, prefix):
+        if self._word_terms is None:
+            self._word_terms = sorted(t for t in self._postings if not _is_cjk(t))
+        start = bisect.bisect_left(self._word_terms, prefix)
+        end = bisect.bisect_left(self._word_terms, prefix + "\U0010ffff")
+        return self._word_terms[start:end]
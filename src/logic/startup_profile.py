@@ -0,0 +1,155 @@
+import builtins
+import datetime
+import importlib.util
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+# Set to a file path (or "1" for startup_profile.json in the working directory)
+# to record a startup report
+ENV_VAR = "FANQIE_STARTUP_PROFILE"
+DEFAULT_REPORT = "startup_profile.json"
+# Slowest imports listed in the report
+IMPORT_REPORT_LIMIT = 30
+# Bump when the report layout changes, so old reports can still be compared
+REPORT_VERSION = 1
+
+
+class StartupProfiler:
+    """
+    Timestamps the phases of application startup and the imports behind them.
+
+    Phases are nested `with profiler.phase(name)` blocks, marks are single
+    moments such as the first paint; both are in milliseconds since the
+    profiler was created. While import tracking is on, every import that
+    actually loads modules is timed, inclusive and exclusive of the imports
+    it triggers (like `python -X importtime`). finish() writes everything as
+    one JSON report. A disabled profiler does nothing and costs a method call.
+    """
+
+    def __init__(self, report_path=None, clock=time.perf_counter):
+        self.enabled = report_path is not None
+        self.report_path = report_path
+        self.clock = clock
+        self.origin = clock()
+        self.phases = []   # {"name", "start_ms", "duration_ms", "depth"} in start order
+        self.marks = {}    # name -> ms, first occurrence wins
+        self.imports = []  # {"module", "cumulative_ms", "self_ms"}
+        self.finished = False
+        self._depth = 0
+        self._import_stack = []
+        self._original_import = None
+
+    @classmethod
+    def from_environment(cls, environ=os.environ):
+        value = environ.get(ENV_VAR, "").strip()
+        if not value or value == "0":
+            return cls()
+        return cls(DEFAULT_REPORT if value.lower() in ("1", "true", "yes") else value)
+
+    def elapsed_ms(self):
+        return (self.clock() - self.origin) * 1000
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        record = {"name": name, "start_ms": round(self.elapsed_ms(), 3), "duration_ms": None, "depth": self._depth}
+        self.phases.append(record)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            record["duration_ms"] = round(self.elapsed_ms() - record["start_ms"], 3)
+
+    def mark(self, name):
+        if self.enabled and name not in self.marks:
+            self.marks[name] = round(self.elapsed_ms(), 3)
+
+    def track_imports(self):
+        """Time imports from now until finish() (or stop_tracking_imports())."""
+        if not self.enabled or self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def stop_tracking_imports(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        if original is None:
+            return builtins.__import__(name, globals, locals, fromlist, level)
+        # Already loaded: the common case stays cheap
+        if level == 0 and name in sys.modules and not fromlist:
+            return original(name, globals, locals, fromlist, level)
+        loaded = len(sys.modules)
+        start = self.clock()
+        self._import_stack.append(0.0)
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = self.clock() - start
+            children = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += elapsed
+            if len(sys.modules) > loaded:
+                self.imports.append({"module": self._module_name(name, globals, fromlist, level),
+                                     "cumulative_ms": round(elapsed * 1000, 3),
+                                     "self_ms": round((elapsed - children) * 1000, 3)})
+
+    @staticmethod
+    def _module_name(name, globals, fromlist, level):
+        if level:
+            package = (globals or {}).get("__package__") or ""
+            try:
+                name = importlib.util.resolve_name("." * level + name, package)
+            except (ImportError, ValueError):
+                name = "." * level + name
+        # `from pkg import sub` can load pkg.sub without naming it
+        if fromlist and len(fromlist) == 1 and f"{name}.{fromlist[0]}" in sys.modules:
+            name = f"{name}.{fromlist[0]}"
+        return name
+
+    def report(self):
+        imports = sorted(self.imports, key=lambda i: i["cumulative_ms"], reverse=True)
+        return {
+            "report_version": REPORT_VERSION,
+            "generated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "frozen": hasattr(sys, "frozen"),
+            "time_to_first_paint_ms": self.marks.get("first_paint"),
+            "time_to_interactive_ms": self.marks.get("interactive"),
+            "total_ms": round(self.elapsed_ms(), 3),
+            "marks": dict(self.marks),
+            "phases": list(self.phases),
+            # Exclusive times add up to the whole time spent importing
+            "import_total_ms": round(sum(i["self_ms"] for i in self.imports), 3),
+            "imports": imports[:IMPORT_REPORT_LIMIT],
+        }
+
+    def finish(self):
+        """Write the report once; later calls (and a disabled profiler) do nothing."""
+        if not self.enabled or self.finished:
+            return None
+        self.finished = True
+        self.stop_tracking_imports()
+        report = self.report()
+        try:
+            with open(self.report_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            logging.info(f"Startup profile written to {self.report_path}")
+        except OSError as e:
+            logging.error(f"Failed to write startup profile: {e}")
+        return report
+
+
+profiler = StartupProfiler.from_environment()
@@ -0,0 +1,112 @@
+from PyQt6.QtCore import QObject, QEvent
+
+class TickSubscriber:
+    __slots__ = ("name", "callback", "resolution", "render", "widget",
+                 "last_value", "stale", "deliveries", "skipped")
+
+    def __init__(self, name, callback, resolution=1, render=None, widget=None):
+        self.name = name
+        self.callback = callback
+        self.resolution = max(1, int(resolution))
+        self.render = render
+        self.widget = widget
+        self.last_value = None
+        self.stale = True
+        self.deliveries = 0
+        self.skipped = 0
+
+    def rendered_value(self, seconds):
+        if self.render is not None:
+            return self.render(seconds)
+        # Countdown values round up so "00:59" style displays flip on time
+        return -(-seconds // self.resolution)
+
+    def is_visible(self):
+        return self.widget is None or self.widget.isVisible()
+
+
+class TickDispatcher(QObject):
+    """
+    Fans PomodoroTimer.tick out to display subscribers.
+
+    Each subscriber declares a resolution (in seconds) and optionally the widget
+    whose visibility gates delivery. A subscriber is only called when its rendered
+    value changes; hidden subscribers are skipped and refreshed once on Show.
+    """
+
+    def __init__(self, timer):
+        super().__init__()
+        self.timer = timer
+        self.last_seconds = timer.remaining_seconds
+        self._subscribers = {}
+        self.suspended = False
+        timer.tick.connect(self.dispatch)
+        timer.mode_changed.connect(self.invalidate)
+
+    def subscribe(self, name, callback, resolution=1, render=None, widget=None):
+        self.unsubscribe(name)
+        sub = TickSubscriber(name, callback, resolution, render, widget)
+        self._subscribers[name] = sub
+        if widget is not None:
+            widget.installEventFilter(self)
+        return sub
+
+    def unsubscribe(self, name):
+        sub = self._subscribers.pop(name, None)
+        if sub is not None and sub.widget is not None:
+            if not any(s.widget is sub.widget for s in self._subscribers.values()):
+                sub.widget.removeEventFilter(self)
+
+    def invalidate(self, *args):
+        # Force the next dispatch to reach every subscriber (e.g. after a mode switch)
+        for sub in self._subscribers.values():
+            sub.stale = True
+
+    def set_suspended(self, suspended):
+        """While suspended ticks are only recorded; resuming redelivers to everyone."""
+        self.suspended = suspended
+        if suspended:
+            self.invalidate()
+        else:
+            self.dispatch(self.last_seconds)
+
+    def dispatch(self, seconds):
+        self.last_seconds = seconds
+        if self.suspended:
+            return
+        for sub in self._subscribers.values():
+            self._deliver(sub, seconds)
+
+    def refresh(self, name):
+        sub = self._subscribers.get(name)
+        if sub is not None:
+            sub.stale = True
+            self._deliver(sub, self.last_seconds)
+
+    def _deliver(self, sub, seconds):
+        if not sub.is_visible():
+            sub.stale = True
+            sub.skipped += 1
+            return
+        value = sub.rendered_value(seconds)
+        if not sub.stale and value == sub.last_value:
+            sub.skipped += 1
+            return
+        sub.last_value = value
+        sub.stale = False
+        sub.deliveries += 1
+        sub.callback(seconds)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Show:
+            for sub in self._subscribers.values():
+                if sub.widget is obj and sub.stale:
+                    self._deliver(sub, self.last_seconds)
+        return super().eventFilter(obj, event)
+
+    def repaint_counts(self):
+        """Number of callbacks delivered per subscriber, for verification."""
+        return {name: sub.deliveries for name, sub in self._subscribers.items()}
+
+    def skip_counts(self):
+        return {name: sub.skipped for name, sub in self._subscribers.items()}
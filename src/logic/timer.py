@@ -1,5 +1,8 @@
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal, QDateTime, QRunnable, QThreadPool
 import winsound
+from logic.tick_dispatcher import TickDispatcher
+from logic.schedule import default_plan
+from logic.scheduler import TimerScheduler
 
 class SoundWorker(QRunnable):
     def run(self):
@@ -12,12 +15,17 @@ class PomodoroTimer(QObject):
     tick = pyqtSignal(int)  # Sends remaining seconds
     finished = pyqtSignal()
     mode_changed = pyqtSignal(str) # 'work', 'break', 'long_break'
+    running_changed = pyqtSignal(bool)
+    session_reset = pyqtSignal()
 
-    def __init__(self, work_minutes=25, break_minutes=5, long_break_minutes=15):
+    # Name of the session deadline inside the shared TimerScheduler
+    SESSION_TIMER = "pomodoro"
+
+    def __init__(self, work_minutes=25, break_minutes=5, long_break_minutes=15, scheduler=None):
         super().__init__()
-        self.work_seconds = int(work_minutes * 60)
-        self.break_seconds = int(break_minutes * 60)
-        self.long_break_seconds = int(long_break_minutes * 60)
+        self.plan = default_plan(work_minutes, break_minutes, long_break_minutes)
+        self.plan_index = 0
+        self._update_mode_durations()
         
         self.current_mode = 'work' # 'work', 'break', 'long_break'
         self.remaining_seconds = self.work_seconds
@@ -26,46 +34,88 @@ class PomodoroTimer(QObject):
         self.sound_enabled = True
         
         self.pomodoros_completed = 0
-        self.pomodoros_until_long_break = 4
+        
+        # The session deadline is owned by the shared scheduler; this QTimer only
+        # refreshes the countdown display
+        self.scheduler = scheduler or TimerScheduler()
+        self.scheduler.timer_finished.connect(self._handle_deadline)
         
         self.timer = QTimer()
         self.timer.timeout.connect(self._handle_tick)
         self.timer.setInterval(200) # Check more frequently for smoothness
         self.end_time = None
+        # Set while no window is visible; the session deadline stays armed in the scheduler
+        self.display_suspended = False
         
         self.thread_pool = QThreadPool.globalInstance()
+        
+        # Display subscribers register here instead of connecting to tick directly
+        self.dispatcher = TickDispatcher(self)
 
     def set_durations(self, work_mins, break_mins, long_break_mins=15):
-        self.work_seconds = int(work_mins * 60)
-        self.break_seconds = int(break_mins * 60)
-        self.long_break_seconds = int(long_break_mins * 60)
+        self.set_plan(default_plan(work_mins, break_mins, long_break_mins))
+
+    def set_plan(self, plan):
+        """Switch to a compiled SessionPlan, keeping the current mode where possible."""
+        self.plan = plan
+        index = plan.find(self.current_mode, self.plan_index % len(plan))
+        self.plan_index = index if index is not None else 0
+        self._update_mode_durations()
         
         # If currently stopped, reset to apply new duration to current mode if applicable
         if not self.is_running:
             self.reset()
 
+    def _update_mode_durations(self):
+        # Representative durations per mode, used for labels
+        self.work_seconds = self.plan.first_seconds('work')
+        self.break_seconds = self.plan.first_seconds('break', self.plan.first_seconds('long_break'))
+        self.long_break_seconds = self.plan.first_seconds('long_break', self.break_seconds)
+
+    @property
+    def session_seconds(self):
+        """Planned length of the current step."""
+        return self.plan.step(self.plan_index).seconds
+
     def start(self):
         if not self.is_running:
             self.is_running = True
             # Calculate expected end time
             self.end_time = QDateTime.currentDateTime().addSecs(self.remaining_seconds)
-            self.timer.start()
+            self.scheduler.add(self.SESSION_TIMER, self.remaining_seconds, label="番茄钟", internal=True)
+            if not self.display_suspended:
+                self.timer.start()
             self._play_sound()
+            self.running_changed.emit(True)
 
     def pause(self):
         if self.is_running:
             self.is_running = False
             self.timer.stop()
-            # remaining_seconds is already up to date from _handle_tick logic
+            # Ticks may have been suspended, so read the remaining time from the deadline
+            if self.scheduler.has_timer(self.SESSION_TIMER):
+                self.remaining_seconds = int(self.scheduler.remaining(self.SESSION_TIMER))
+            self.scheduler.cancel(self.SESSION_TIMER)
+            self.running_changed.emit(False)
 
     def reset(self):
         self.pause()
-        if self.current_mode == 'work':
-            self.remaining_seconds = self.work_seconds
-        elif self.current_mode == 'break':
-            self.remaining_seconds = self.break_seconds
-        else: # long_break
-            self.remaining_seconds = self.long_break_seconds
+        self.remaining_seconds = self.session_seconds
+        self.tick.emit(self.remaining_seconds)
+        self.session_reset.emit()
+
+    def restore_state(self, mode, plan_index, remaining_seconds, pomodoros_completed=0):
+        """Restore a checkpointed session (the timer is left paused)."""
+        self.pause()
+        if not (0 <= plan_index < len(self.plan)) or self.plan.step(plan_index).mode != mode:
+            # The schedule changed since the checkpoint; land on the same kind of step
+            index = self.plan.find(mode)
+            plan_index = index if index is not None else 0
+        self.plan_index = plan_index
+        self.current_mode = self.plan.step(plan_index).mode
+        self.remaining_seconds = max(0, min(int(remaining_seconds), self.session_seconds))
+        self.pomodoros_completed = pomodoros_completed
+        self.mode_changed.emit(self.current_mode)
         self.tick.emit(self.remaining_seconds)
 
     def skip(self):
@@ -82,20 +132,29 @@ class PomodoroTimer(QObject):
     def switch_mode(self):
         if self.current_mode == 'work':
             self.pomodoros_completed += 1
-            if self.pomodoros_completed % self.pomodoros_until_long_break == 0:
-                self.current_mode = 'long_break'
-                self.remaining_seconds = self.long_break_seconds
-            else:
-                self.current_mode = 'break'
-                self.remaining_seconds = self.break_seconds
-        else:
-            # After any break, go back to work
-            self.current_mode = 'work'
-            self.remaining_seconds = self.work_seconds
+        
+        # The plan is precompiled, so the next step is a constant-time lookup
+        self.plan_index = self.plan.next_index(self.plan_index)
+        step = self.plan.step(self.plan_index)
+        self.current_mode = step.mode
+        self.remaining_seconds = step.seconds
             
         self.mode_changed.emit(self.current_mode)
         self.tick.emit(self.remaining_seconds)
 
+    def suspend_display(self):
+        """Stop the display refresh timer; the session still ends on time."""
+        self.display_suspended = True
+        self.timer.stop()
+
+    def resume_display(self):
+        self.display_suspended = False
+        if self.is_running:
+            self.remaining_seconds = int(self.scheduler.remaining(self.SESSION_TIMER))
+            self.timer.start()
+        # Immediate tick so every display catches up without waiting for the next interval
+        self.tick.emit(self.remaining_seconds)
+
     def set_sound_enabled(self, enabled):
         self.sound_enabled = enabled
 
@@ -103,23 +162,27 @@ class PomodoroTimer(QObject):
         if not self.is_running:
             return
             
-        now = QDateTime.currentDateTime()
-        seconds_left = now.secsTo(self.end_time)
-        
-        if seconds_left >= 0:
-            if seconds_left != self.remaining_seconds:
-                self.remaining_seconds = seconds_left
-                self.tick.emit(self.remaining_seconds)
-        else:
-            self.remaining_seconds = 0
-            self.tick.emit(0)
-            self._finish_session()
+        seconds_left = int(self.scheduler.remaining(self.SESSION_TIMER))
+        if seconds_left != self.remaining_seconds:
+            self.remaining_seconds = seconds_left
+            self.tick.emit(self.remaining_seconds)
+
+    def _handle_deadline(self, name, label):
+        if name != self.SESSION_TIMER or not self.is_running:
+            return
+        self.remaining_seconds = 0
+        self.tick.emit(0)
+        self._finish_session()
 
     def _play_sound(self):
         if self.sound_enabled:
             worker = SoundWorker()
             self.thread_pool.start(worker)
     
+    def predict_finish(self, sessions, now=None):
+        """Wall-clock time at which `sessions` more work sessions would be done."""
+        return self.plan.predict_finish(self.plan_index, self.remaining_seconds, sessions, now)
+
     @property
     def is_working(self):
         return self.current_mode == 'work'
@@ -1,12 +1,20 @@
 import sys
 import os
-import ctypes
-from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
-from PyQt6.QtCore import Qt, QSharedMemory
-from PyQt6.QtGui import QIcon
-from logic.timer import PomodoroTimer
-from ui.main_window import MainWindow
-from ui.floating_window import FloatingWindow
+# Imported first so a startup profile (see logic.startup_profile) can time the imports below
+from logic.startup_profile import profiler
+profiler.track_imports()
+with profiler.phase("imports"):
+    import ctypes
+    from PyQt6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
+    from PyQt6.QtCore import Qt, QSharedMemory, QTimer, QDateTime
+    from PyQt6.QtGui import QIcon
+    from logic.timer import PomodoroTimer
+    from logic.scheduler import TimerScheduler
+    from logic.power import PowerManager
+    from ui.main_window import MainWindow
+    from ui.floating_window import FloatingWindow
+    from ui.paint_debug import PaintProfiler
+    from ui import icons
 
 def get_resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
@@ -27,11 +35,12 @@ def get_resource_path(relative_path):
 class PomodoroApp:
     def __init__(self):
         # Single instance check using QSharedMemory
-        self.shared_memory = QSharedMemory("FanqieClock_SingleInstance")
-        if not self.shared_memory.create(1):
-            # Another instance is already running
-            print("番茄钟已经在运行中")
-            sys.exit(1)
+        with profiler.phase("single_instance"):
+            self.shared_memory = QSharedMemory("FanqieClock_SingleInstance")
+            if not self.shared_memory.create(1):
+                # Another instance is already running
+                print("番茄钟已经在运行中")
+                sys.exit(1)
         
         # Set AppUserModelID for Windows Taskbar Icon
         myappid = 'Trae.FanqieClock.App.1.0' # arbitrary string
@@ -41,32 +50,53 @@ class PomodoroApp:
         except Exception:
             pass # Fails on non-Windows
 
-        self.app = QApplication(sys.argv)
+        with profiler.phase("qapplication"):
+            self.app = QApplication(sys.argv)
         
-        # Load stylesheet
-        style_path = get_resource_path(os.path.join("styles", "style.qss"))
-        if os.path.exists(style_path):
-            with open(style_path, "r", encoding="utf-8") as f:
-                self.app.setStyleSheet(f.read())
+        # The stylesheet is applied by MainWindow once the saved theme is known
         
         # Set App Icon
         icon_path = get_resource_path(os.path.join("resources", "icon_app.svg"))
         if os.path.exists(icon_path):
-            app_icon = QIcon(icon_path)
+            app_icon = icons.icon("icon_app.svg")
             self.app.setWindowIcon(app_icon)
         
-        self.timer = PomodoroTimer()
-        self.main_window = MainWindow(self.timer)
-        self.floating_window = FloatingWindow(self.timer)
+        # One scheduler owns the pomodoro deadline and every extra named timer
+        self.scheduler = TimerScheduler()
+        self.timer = PomodoroTimer(scheduler=self.scheduler)
+        with profiler.phase("main_window"):
+            self.main_window = MainWindow(self.timer)
+        with profiler.phase("floating_window"):
+            self.floating_window = FloatingWindow(self.timer)
         
-        self.setup_tray()
+        # Repaint counts, timings and flashes when FANQIE_PAINT_DEBUG is set (see ui.paint_debug)
+        self.paint_profiler = PaintProfiler.from_environment()
+        if self.paint_profiler is not None:
+            self.paint_profiler.start()
+            self.paint_profiler.watch(self.main_window)
+            self.paint_profiler.watch(self.floating_window)
+        
+        with profiler.phase("tray"):
+            self.setup_tray()
         
         # Connect mode switching
         self.main_window.switch_to_compact.connect(self.show_compact)
         self.floating_window.switch_to_main.connect(self.show_main)
         self.timer.finished.connect(self.notify_finished)
+        self.scheduler.timer_finished.connect(self.notify_named_timer)
+        # Tray tooltip only needs minute resolution
+        self.timer.dispatcher.subscribe("tray", self.update_tray_tooltip, resolution=60)
         
-        self.main_window.show()
+        # Suspend display ticks and UI polling while no window is visible
+        self.power_manager = PowerManager(self.timer, [self.main_window, self.floating_window])
+        self.power_manager.low_power_changed.connect(self.update_low_power_tooltip)
+        self.timer.running_changed.connect(self.update_low_power_tooltip)
+        self.timer.mode_changed.connect(self.update_low_power_tooltip)
+        
+        with profiler.phase("show"):
+            self.main_window.show()
+        # Offer to resume an interrupted session once the window is up
+        QTimer.singleShot(0, self.main_window.offer_resume)
 
     def setup_tray(self):
         self.tray_icon = QSystemTrayIcon(self.app)
@@ -74,7 +104,7 @@ class PomodoroApp:
         # Use our custom icon
         icon_path = get_resource_path(os.path.join("resources", "icon_app.svg"))
         if os.path.exists(icon_path):
-            self.tray_icon.setIcon(QIcon(icon_path))
+            self.tray_icon.setIcon(icons.icon("icon_app.svg"))
         else:
             self.tray_icon.setIcon(QIcon.fromTheme("appointment-new"))
         
@@ -93,6 +123,21 @@ class PomodoroApp:
         if reason == QSystemTrayIcon.ActivationReason.Trigger:
             self.show_main()
 
+    def update_tray_tooltip(self, seconds):
+        mins = -(-seconds // 60)
+        self.tray_icon.setToolTip(f"番茄钟 - 剩余 {mins} 分钟")
+
+    def update_low_power_tooltip(self, *args):
+        # Ticks are suspended in low power, so show the end time, which does not go stale
+        if not self.power_manager.low_power:
+            return
+        if self.timer.is_running:
+            remaining = self.timer.scheduler.remaining(PomodoroTimer.SESSION_TIMER)
+            end = QDateTime.currentDateTime().addSecs(int(remaining))
+            self.tray_icon.setToolTip(f"番茄钟 - {end.toString('HH:mm')} 结束")
+        else:
+            self.update_tray_tooltip(self.timer.remaining_seconds)
+
     def notify_finished(self):
         # self.timer.current_mode is the mode that JUST finished (signal emitted before switch)
         if self.timer.current_mode == 'work':
@@ -113,6 +158,16 @@ class PomodoroApp:
         )
         # Sound feedback is already handled in Timer class thread
 
+    def notify_named_timer(self, name, label):
+        if name == PomodoroTimer.SESSION_TIMER:
+            return # Handled by notify_finished
+        self.tray_icon.showMessage(
+            f"{label} 时间到！",
+            "计时器已结束。",
+            QSystemTrayIcon.MessageIcon.Information,
+            5000
+        )
+
     def show_compact(self):
         self.main_window.hide()
         # Position floating window near the top right of the screen
@@ -126,12 +181,17 @@ class PomodoroApp:
         # Ensure window is not minimized and bring to front
         self.main_window.setWindowState(Qt.WindowState.WindowNoState)
         self.main_window.show()
+        # No resume offer here: a checkpoint left at this point is the session still running
         self.main_window.activateWindow()
 
     def run(self):
         try:
             sys.exit(self.app.exec())
         finally:
+            # Normally written once startup settles; this covers quitting before that
+            profiler.finish()
+            if self.paint_profiler is not None:
+                self.paint_profiler.stop()
             # Clean up shared memory
             self.shared_memory.detach()
 
@@ -1,8 +1,15 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QGraphicsOpacityEffect
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame, QGraphicsOpacityEffect,
+                             QMenu, QInputDialog)
 from PyQt6.QtCore import Qt, pyqtSignal, QPoint, QPropertyAnimation, QEasingCurve, QSequentialAnimationGroup, QParallelAnimationGroup, QSize
-from PyQt6.QtGui import QIcon
 from logic.timer import PomodoroTimer
-from ui.widgets import get_resource_path
+from ui import icons
+from ui.theme import engine as theme_engine, tint_icons
+
+# (label, minutes) presets offered in the context menu
+TIMER_PRESETS = [("泡茶", 3), ("休息眼睛", 20), ("会议", 30), ("午休", 45)]
+
+BASE_HEIGHT = 160
+TIMER_ROW_HEIGHT = 24
 
 class FloatingWindow(QWidget):
     switch_to_main = pyqtSignal()
@@ -10,6 +17,8 @@ class FloatingWindow(QWidget):
     def __init__(self, timer: PomodoroTimer):
         super().__init__()
         self.timer = timer
+        self.scheduler = timer.scheduler
+        self.timer_rows = {}
         self.init_ui()
         self.setup_connections()
         self.old_pos = None
@@ -27,7 +36,7 @@ class FloatingWindow(QWidget):
         self.setObjectName("FloatingWindow")
         self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.Tool)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-        self.setFixedSize(220, 160)
+        self.setFixedSize(220, BASE_HEIGHT)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
@@ -43,14 +52,15 @@ class FloatingWindow(QWidget):
         header.setContentsMargins(0, 0, 0, 0)
         
         self.mode_dot = QLabel("●")
-        self.mode_dot.setStyleSheet("color: #000000; font-size: 14px;")
+        self.mode_dot.setProperty("role", "mode_dot")
         
         self.mode_text = QLabel("专注中")
         self.mode_text.setProperty("class", "FloatingLabel")
-        self.mode_text.setStyleSheet("color: #666; font-size: 11px; margin-left: 5px;")
+        self.mode_text.setObjectName("FloatingModeText")
         
         self.return_btn = QPushButton()
-        self.return_btn.setIcon(QIcon(get_resource_path("resources/icon_restore.svg")))
+        self.return_btn.setIcon(icons.icon("icon_restore.svg"))
+        self.return_btn.setProperty("icon_name", "icon_restore.svg")
         self.return_btn.setIconSize(QSize(18, 18))
         self.return_btn.setProperty("class", "FloatingControlBtn")
         self.return_btn.setFixedSize(28, 28)
@@ -65,22 +75,16 @@ class FloatingWindow(QWidget):
         # Timer Display
         self.timer_label = QLabel("25:00")
         self.timer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.timer_label.setStyleSheet("""
-            font-size: 36px; 
-            font-weight: bold; 
-            font-family: 'Consolas', 'Segoe UI'; 
-            color: #1A1A1A;
-            margin: 2px 0;
-        """)
+        self.timer_label.setObjectName("FloatingTimer")
         
         # Controls Row
         controls_layout = QHBoxLayout()
         controls_layout.setSpacing(10)
         
         # Create control items (Icon + Text)
-        self.stop_btn = self.create_control_btn(get_resource_path("resources/icon_stop.svg"), "重置", "FloatingStop")
-        self.play_btn = self.create_control_btn(get_resource_path("resources/icon_play.svg"), "开始", "FloatingPlay")
-        self.skip_btn = self.create_control_btn(get_resource_path("resources/icon_skip.svg"), "跳过", "FloatingSkip")
+        self.stop_btn = self.create_control_btn("icon_stop.svg", "重置", "FloatingStop")
+        self.play_btn = self.create_control_btn("icon_play.svg", "开始", "FloatingPlay")
+        self.skip_btn = self.create_control_btn("icon_skip.svg", "跳过", "FloatingSkip")
         
         controls_layout.addWidget(self.stop_btn)
         controls_layout.addWidget(self.play_btn)
@@ -90,11 +94,17 @@ class FloatingWindow(QWidget):
         container_layout.addWidget(self.timer_label)
         container_layout.addLayout(controls_layout)
         
+        # Compact list of extra named timers (tea, meeting, ...)
+        self.timers_layout = QVBoxLayout()
+        self.timers_layout.setContentsMargins(0, 4, 0, 0)
+        self.timers_layout.setSpacing(0)
+        container_layout.addLayout(self.timers_layout)
+        
         layout.addWidget(self.container)
 
-    def create_control_btn(self, icon_path, text, object_name):
+    def create_control_btn(self, icon_name, text, object_name):
         btn = QPushButton()
-        btn.setIcon(QIcon(icon_path))
+        btn.setIcon(icons.icon(icon_name))
         btn.setObjectName(object_name)
         
         # Determine styling based on type
@@ -102,12 +112,12 @@ class FloatingWindow(QWidget):
             btn.setIconSize(QSize(20, 20))
             btn.setFixedSize(45, 45) # Main button stays larger
             btn.setProperty("class", "CircleControlBtn")
-            btn.setStyleSheet("border-radius: 22px;") # Force radius for circle
         else:
             btn.setIconSize(QSize(14, 14)) # Even smaller icon for secondary actions
             btn.setFixedSize(32, 32) # Even smaller button size (32px)
             btn.setProperty("class", "SecondaryControlBtn") # New class for styling
-            btn.setStyleSheet("border-radius: 16px;") # Force radius for circle
+            # Dark grey icons follow the theme tint; the play button keeps its white ones
+            btn.setProperty("icon_name", icon_name)
             
         btn.setToolTip(text)
         
@@ -119,30 +129,118 @@ class FloatingWindow(QWidget):
         
 
     def setup_connections(self):
-        self.timer.tick.connect(self.update_timer_display)
+        self.timer.dispatcher.subscribe("floating_window", self.update_timer_display, widget=self)
         self.timer.mode_changed.connect(self.update_mode_display)
+        theme_engine.theme_changed.connect(self.on_theme_changed)
+        self.on_theme_changed(theme_engine.theme)
         
         # Play button connected in create_control_btn
         self.stop_btn.clicked.connect(self.timer.reset)
         self.skip_btn.clicked.connect(self.timer.skip)
+        
+        self.scheduler.timers_changed.connect(self.rebuild_timer_list)
+        self.scheduler.heartbeat.connect(self.update_timer_list)
+
+    def rebuild_timer_list(self):
+        # Structural changes only (add / cancel / finish); per-second updates go through update_timer_list
+        while self.timers_layout.count():
+            item = self.timers_layout.takeAt(0)
+            if item.widget():
+                item.widget().deleteLater()
+        self.timer_rows = {}
+        
+        for entry in self.scheduler.timers():
+            row = QWidget()
+            row.setFixedHeight(TIMER_ROW_HEIGHT)
+            row_layout = QHBoxLayout(row)
+            row_layout.setContentsMargins(2, 0, 0, 0)
+            row_layout.setSpacing(4)
+            
+            name_label = QLabel(entry.label)
+            name_label.setProperty("class", "FloatingLabel")
+            
+            time_label = QLabel()
+            time_label.setProperty("role", "timer_row_time")
+            
+            cancel_btn = QPushButton("×")
+            cancel_btn.setFixedSize(18, 18)
+            cancel_btn.setToolTip("取消计时器")
+            cancel_btn.setProperty("role", "timer_cancel")
+            cancel_btn.clicked.connect(lambda checked, name=entry.name: self.scheduler.cancel(name))
+            
+            row_layout.addWidget(name_label)
+            row_layout.addStretch()
+            row_layout.addWidget(time_label)
+            row_layout.addWidget(cancel_btn)
+            
+            self.timers_layout.addWidget(row)
+            self.timer_rows[entry.name] = time_label
+        
+        self.setFixedSize(220, BASE_HEIGHT + TIMER_ROW_HEIGHT * len(self.timer_rows))
+        self.update_timer_list()
+
+    def update_timer_list(self):
+        for name, time_label in self.timer_rows.items():
+            mins, secs = divmod(int(-(-self.scheduler.remaining(name) // 1)), 60)
+            time_label.setText(f"{mins:02d}:{secs:02d}")
+
+    def add_named_timer(self, label, minutes):
+        # Same label twice gets a numbered name so both can run
+        name, n = label, 2
+        while self.scheduler.has_timer(name):
+            name, n = f"{label} {n}", n + 1
+        self.scheduler.add(name, minutes * 60, label=name)
+
+    def add_custom_timer(self):
+        label, ok = QInputDialog.getText(self, "添加计时器", "名称：", text="计时器")
+        if not ok or not label.strip():
+            return
+        minutes, ok = QInputDialog.getInt(self, "添加计时器", "时长 (分钟)：", 10, 1, 600)
+        if ok:
+            self.add_named_timer(label.strip(), minutes)
+
+    def contextMenuEvent(self, event):
+        menu = QMenu(self)
+        add_menu = menu.addMenu("添加计时器")
+        for label, minutes in TIMER_PRESETS:
+            action = add_menu.addAction(f"{label} ({minutes} 分钟)")
+            action.triggered.connect(lambda checked, l=label, m=minutes: self.add_named_timer(l, m))
+        add_menu.addSeparator()
+        add_menu.addAction("自定义...").triggered.connect(self.add_custom_timer)
+        
+        if self.timer_rows:
+            menu.addAction("清除全部计时器").triggered.connect(lambda: self.scheduler.clear())
+        menu.exec(event.globalPos())
+
+    def showEvent(self, event):
+        # The list only needs a once-per-second heartbeat while it is on screen
+        self.scheduler.set_heartbeat(1000)
+        self.update_timer_list()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.scheduler.set_heartbeat(0)
+        super().hideEvent(event)
 
     def update_timer_display(self, seconds):
         mins, secs = divmod(seconds, 60)
         self.timer_label.setText(f"{mins:02d}:{secs:02d}")
 
+    def on_theme_changed(self, theme):
+        tint_icons(self)
+
     def update_mode_display(self, mode):
         is_work = mode == 'work'
         self.mode_text.setText("专注中" if is_work else "休息中")
-        self.mode_dot.setStyleSheet(f"color: #000000; font-size: 14px;")
 
     def toggle_timer(self):
         if self.timer.is_running:
             self.timer.pause()
-            self.play_btn.setIcon(QIcon(get_resource_path("resources/icon_play.svg")))
+            self.play_btn.setIcon(icons.icon("icon_play.svg"))
             self.play_btn.setToolTip("开始")
         else:
             self.timer.start()
-            self.play_btn.setIcon(QIcon(get_resource_path("resources/icon_pause.svg")))
+            self.play_btn.setIcon(icons.icon("icon_pause.svg"))
             self.play_btn.setToolTip("暂停")
         
         # Simple scale animation for feedback
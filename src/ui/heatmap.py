@@ -0,0 +1,186 @@
+import datetime
+from collections import OrderedDict
+from PyQt6.QtWidgets import QWidget, QToolTip
+from PyQt6.QtCore import Qt, QRect, QRectF, QSize, QEvent, pyqtSignal
+from PyQt6.QtGui import QPainter, QPixmap, QColor, QFont
+from logic.heatmap import year_levels, level_for, days_in_year, LEVEL_COUNT
+from ui.theme import engine as theme_engine
+
+CELL = 11
+GAP = 2
+STEP = CELL + GAP
+LEFT = 28  # Weekday labels
+TOP = 18   # Month labels
+LEGEND_HEIGHT = 22
+WEEKS = 54 # A year touches at most 54 Monday-first week columns
+# Rendered years kept as pixmaps (each theme counts separately)
+PIXMAP_CACHE_SIZE = 16
+
+WEEKDAY_LABELS = {0: "一", 2: "三", 4: "五"}
+
+
+class YearHeatmap(QWidget):
+    """
+    GitHub-style calendar of daily focus minutes for one year.
+
+    Each (year, theme) is rendered once into a cached QPixmap and paintEvent
+    only blits it, so flipping between years is cheap. A recorded session
+    repaints just that day's cell, in the cached pixmaps and on screen.
+    Colours are the heatmap_* tokens of the current theme.
+    """
+    year_changed = pyqtSignal(int)
+
+    def __init__(self, data_manager, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.year = datetime.date.today().year
+        self.pixmap_builds = 0
+        self.cell_updates = 0
+        self._pixmaps = OrderedDict() # (year, theme, dpr) -> QPixmap
+        self.setMouseTracking(True)
+        self.setFixedSize(self.sizeHint())
+        data_manager.stats_changed.connect(self.on_stats_changed)
+        # The cache is keyed by theme, so a switch only has to repaint
+        theme_engine.theme_changed.connect(self.update)
+
+    def sizeHint(self):
+        return QSize(LEFT + WEEKS * STEP, TOP + 7 * STEP + LEGEND_HEIGHT)
+
+    # Navigation
+    def year_range(self):
+        first_day = self.data_manager.first_history_day()
+        last_year = datetime.date.today().year
+        first_year = int(first_day[:4]) if first_day else last_year
+        return min(first_year, last_year), last_year
+
+    def set_year(self, year):
+        first_year, last_year = self.year_range()
+        year = max(first_year, min(year, last_year))
+        if year != self.year:
+            self.year = year
+            self.update()
+            self.year_changed.emit(year)
+
+    def wheelEvent(self, event):
+        steps = event.angleDelta().y() // 120
+        if steps:
+            self.set_year(self.year - steps) # Scrolling up goes back in time
+            event.accept()
+        else:
+            super().wheelEvent(event)
+
+    # Geometry
+    def cell_rect(self, year, day_index):
+        slot = day_index + datetime.date(year, 1, 1).weekday()
+        return QRect(LEFT + (slot // 7) * STEP, TOP + (slot % 7) * STEP, CELL, CELL)
+
+    def day_at(self, pos):
+        x, y = pos.x() - LEFT, pos.y() - TOP
+        if x < 0 or y < 0 or x % STEP >= CELL or y % STEP >= CELL or y // STEP >= 7:
+            return None
+        day_index = (x // STEP) * 7 + y // STEP - datetime.date(self.year, 1, 1).weekday()
+        if 0 <= day_index < days_in_year(self.year):
+            return datetime.date(self.year, 1, 1) + datetime.timedelta(days=day_index)
+        return None
+
+    # Rendering
+    def _cached_pixmap(self):
+        dpr = self.devicePixelRatioF()
+        theme = theme_engine.theme or "light"
+        key = (self.year, theme, dpr)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._pixmaps[key] = self._build_pixmap(self.year, theme, dpr)
+            while len(self._pixmaps) > PIXMAP_CACHE_SIZE:
+                self._pixmaps.popitem(last=False)
+        self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def _build_pixmap(self, year, theme, dpr):
+        self.pixmap_builds += 1
+        size = self.sizeHint()
+        pixmap = QPixmap(int(size.width() * dpr), int(size.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        text_color = QColor(theme_engine.color("heatmap_text", theme))
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        levels = year_levels(self.data_manager.data.get("stats", {}).get("history", {}), year)
+        colors = [QColor(theme_engine.color(f"heatmap_level_{level}", theme)) for level in range(LEVEL_COUNT)]
+        for day_index, level in enumerate(levels):
+            painter.setBrush(colors[level])
+            painter.drawRoundedRect(QRectF(self.cell_rect(year, day_index)), 2, 2)
+
+        font = QFont(self.font())
+        font.setPixelSize(10)
+        painter.setFont(font)
+        painter.setPen(text_color)
+        for month in range(1, 13):
+            day_index = (datetime.date(year, month, 1) - datetime.date(year, 1, 1)).days
+            rect = self.cell_rect(year, day_index)
+            painter.drawText(rect.left(), TOP - 5, f"{month}月")
+        for row, label in WEEKDAY_LABELS.items():
+            painter.drawText(QRect(0, TOP + row * STEP, LEFT - 6, CELL),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, label)
+
+        # Legend, bottom right
+        x = LEFT + WEEKS * STEP - LEVEL_COUNT * STEP - 20
+        y = TOP + 7 * STEP + 8
+        painter.drawText(QRect(x - 24, y, 20, CELL), Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, "少")
+        painter.setPen(Qt.PenStyle.NoPen)
+        for level, color in enumerate(colors):
+            painter.setBrush(color)
+            painter.drawRoundedRect(QRectF(x + level * STEP, y, CELL, CELL), 2, 2)
+        painter.setPen(text_color)
+        painter.drawText(QRect(x + LEVEL_COUNT * STEP + 4, y, 20, CELL),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, "多")
+        painter.end()
+        return pixmap
+
+    def _patch_cell(self, pixmap, theme, year, day_index, level):
+        rect = QRectF(self.cell_rect(year, day_index))
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(rect, Qt.GlobalColor.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(theme_engine.color(f"heatmap_level_{level}", theme)))
+        painter.drawRoundedRect(rect, 2, 2)
+        painter.end()
+
+    def on_stats_changed(self, version):
+        day = self.data_manager.last_stats_day
+        if day is None:
+            # Stats were replaced wholesale
+            self._pixmaps.clear()
+            self.update()
+            return
+        date = datetime.date.fromisoformat(day)
+        day_index = (date - datetime.date(date.year, 1, 1)).days
+        minutes = self.data_manager.data.get("stats", {}).get("history", {}).get(day, {}).get("minutes", 0)
+        level = level_for(minutes)
+        for (year, theme, dpr), pixmap in self._pixmaps.items():
+            if year == date.year:
+                self._patch_cell(pixmap, theme, year, day_index, level)
+        self.cell_updates += 1
+        if date.year == self.year:
+            self.update(self.cell_rect(date.year, day_index))
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cached_pixmap())
+
+    def event(self, event):
+        if event.type() == QEvent.Type.ToolTip:
+            date = self.day_at(event.pos())
+            if date is not None:
+                day = date.isoformat()
+                minutes = self.data_manager.data.get("stats", {}).get("history", {}).get(day, {}).get("minutes", 0)
+                QToolTip.showText(event.globalPos(), f"{day}：{minutes} 分钟", self)
+            else:
+                QToolTip.hideText()
+            return True
+        return super().event(event)
@@ -0,0 +1,134 @@
+from collections import OrderedDict
+from PyQt6.QtWidgets import QApplication, QStyleOption
+from PyQt6.QtCore import Qt, QSize, QRectF
+from PyQt6.QtGui import QIcon, QIconEngine, QPainter, QPixmap, QColor
+import sys, os
+
+try:
+    from PyQt6.QtSvg import QSvgRenderer
+except ImportError:
+    # Without QtSvg, QIcon's own SVG plugin (if any) does the parsing
+    QSvgRenderer = None
+
+# Rasterized pixmaps kept across all icons, sizes, DPRs and tints
+PIXMAP_CACHE_SIZE = 128
+
+
+def get_resource_path(relative_path):
+    if hasattr(sys, 'frozen'):
+        if hasattr(sys, '_MEIPASS'):
+            base_path = sys._MEIPASS
+        else:
+            base_path = os.path.dirname(sys.executable)
+    else:
+        # src/ui/icons.py -> src
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, relative_path)
+
+
+class RegistryIconEngine(QIconEngine):
+    """Draws an icon from the registry's shared pixmap cache at whatever size Qt asks for."""
+
+    def __init__(self, registry, name, color=None):
+        super().__init__()
+        self.registry = registry
+        self.name = name
+        self.color = color
+
+    def clone(self):
+        return RegistryIconEngine(self.registry, self.name, self.color)
+
+    def scaledPixmap(self, size, mode, state, scale):
+        return self.registry.pixmap(self.name, size, scale, self.color, mode == QIcon.Mode.Disabled)
+
+    def pixmap(self, size, mode, state):
+        return self.scaledPixmap(size, mode, state, 1.0)
+
+    def paint(self, painter, rect, mode, state):
+        dpr = painter.device().devicePixelRatioF() if painter.device() else 1.0
+        painter.drawPixmap(rect, self.scaledPixmap(rect.size(), mode, state, dpr))
+
+
+class IconRegistry:
+    """
+    Process-wide cache of the SVG resources.
+
+    Each SVG is parsed once into a QSvgRenderer, and rasterized on demand
+    into pixmaps keyed by (name, size, device pixel ratio, tint, disabled),
+    which are evicted least recently used first. Icons are handed out as
+    shared QIcon objects backed by that cache, so swapping the play and
+    pause icons or painting a thousand kanban rows never touches the file
+    again. A tint recolors every opaque pixel, for icons drawn in a single
+    colour that must follow the theme.
+    """
+
+    def __init__(self, cache_size=PIXMAP_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.parses = 0
+        self.rasterizations = 0
+        self._renderers = {}          # name -> QSvgRenderer (or QIcon without QtSvg)
+        self._icons = {}              # (name, tint) -> QIcon
+        self._pixmaps = OrderedDict() # (name, w, h, dpr, tint, disabled) -> QPixmap
+
+    def path_for(self, name):
+        return get_resource_path(f"resources/{name}")
+
+    def renderer(self, name):
+        renderer = self._renderers.get(name)
+        if renderer is None:
+            self.parses += 1
+            path = self.path_for(name)
+            renderer = self._renderers[name] = QSvgRenderer(path) if QSvgRenderer else QIcon(path)
+        return renderer
+
+    def icon(self, name, color=None):
+        key = (name, color)
+        icon = self._icons.get(key)
+        if icon is None:
+            icon = self._icons[key] = QIcon(RegistryIconEngine(self, name, color))
+        return icon
+
+    def pixmap(self, name, size, dpr=1.0, color=None, disabled=False):
+        if isinstance(size, int):
+            size = QSize(size, size)
+        key = (name, size.width(), size.height(), dpr, color, disabled)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._pixmaps[key] = self._rasterize(name, size, dpr, color, disabled)
+            while len(self._pixmaps) > self.cache_size:
+                self._pixmaps.popitem(last=False)
+        self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def _rasterize(self, name, size, dpr, color, disabled):
+        self.rasterizations += 1
+        renderer = self.renderer(name)
+        pixmap = QPixmap(max(round(size.width() * dpr), 1), max(round(size.height() * dpr), 1))
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        target = QRectF(0, 0, pixmap.width(), pixmap.height())
+        if isinstance(renderer, QIcon):
+            renderer.paint(painter, target.toRect())
+        elif renderer.isValid():
+            renderer.render(painter, target)
+        if color is not None:
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+            painter.fillRect(target, QColor(color))
+        painter.end()
+        pixmap.setDevicePixelRatio(dpr)
+        if disabled:
+            pixmap = QApplication.style().generatedIconPixmap(QIcon.Mode.Disabled, pixmap, QStyleOption())
+        return pixmap
+
+    def clear(self):
+        self._pixmaps.clear()
+
+
+registry = IconRegistry()
+
+
+def icon(name, color=None):
+    """Shared QIcon for resources/<name>, optionally tinted with `color`."""
+    return registry.icon(name, color)
@@ -1,18 +1,29 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QLabel, QPushButton, QStackedWidget, QTextEdit, 
+                             QLabel, QPushButton, QStackedWidget, 
                              QLineEdit, QListWidget, QFrame, QListWidgetItem,
                              QAbstractItemView, QDialog, QFormLayout, QSpinBox,
-                             QTableWidget, QTableWidgetItem, QHeaderView, 
+                             QTableView, QHeaderView, 
                              QGraphicsOpacityEffect, QProgressBar, QSizePolicy,
-                             QCheckBox, QGridLayout, QMessageBox, QFileDialog, QMenu)
+                             QCheckBox, QGridLayout, QMessageBox, QFileDialog, QMenu, QComboBox,
+                             QScrollArea, QDialogButtonBox)
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtGui import QAction
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPropertyAnimation, QEasingCurve, QDate, QEvent, QParallelAnimationGroup, QLocale, QSizeF, QTimer, QPoint
-from PyQt6.QtGui import QColor, QFont, QIcon, QTextDocument, QPageSize, QPdfWriter, QCursor, QPixmap
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPropertyAnimation, QEasingCurve, QDate, QDateTime, QTime, QEvent, QParallelAnimationGroup, QLocale, QSizeF, QTimer, QPoint
+from PyQt6.QtGui import QColor, QFont, QCursor, QPixmap
 from logic.timer import PomodoroTimer
 from logic.data_manager import DataManager
-from logic.quote_worker import QuoteWorker
-from ui.widgets import CircularProgressBar, KanbanItemWidget, KanbanList, LongBreakOverlay, SmoothButton, NumberControl
+from logic.noise import NoisePlayer
+from logic.checkpoint import SessionCheckpoint, checkpoint_path_for, reconcile
+from logic.schedule import plan_for_day, compile_schedule, WEEKDAY_KEYS, WEEKDAY_NAMES
+from logic.note_search import NoteSearcher
+from logic.search_index import SearchIndex
+from logic.startup_profile import profiler
+# Modules used by a single page or dialog (notes model, note editor, heatmap,
+# trend chart, quote fetching, PDF export) are imported where they are first
+# needed, keeping them off the startup path
+from ui import icons
+from ui.theme import engine as theme_engine, tint_icons
+from ui.widgets import CircularProgressBar, KanbanList, LongBreakOverlay, SmoothButton, NumberControl, SidebarHotZone
 import sys, os
 
 def get_resource_path(relative_path):
@@ -30,27 +41,63 @@ def get_resource_path(relative_path):
         base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     return os.path.join(base_path, relative_path)
 
+def set_text_if_changed(label, text):
+    # setText relayouts the label even when the text is the same
+    if label.text() != text:
+        label.setText(text)
+
+# (builder, loader) per content_stack index. Only the timer page is built up
+# front; the others start as placeholders and are built on first use, the
+# loader then filling the fresh page from the saved data.
+PAGES = (
+    ("create_timer_page", None),
+    ("create_kanban_page", "load_kanban_page"),
+    ("create_notes_page", "load_notes_page"),
+    ("create_stats_page", "load_stats_page"),
+    ("create_settings_page", "load_settings_page"),
+)
+
+# Width of the left window edge that reveals a collapsed sidebar on hover
+SIDEBAR_HOT_ZONE_WIDTH = 50
+
+# Internal scheduler countdown to the next midnight, when the weekday plan may change
+DAY_CHANGE_TIMER = "day_change"
+
 class MainWindow(QMainWindow):
     switch_to_compact = pyqtSignal()
 
     def __init__(self, timer: PomodoroTimer):
         super().__init__()
         self.timer = timer
-        self.data_manager = DataManager()
+        with profiler.phase("load_data"):
+            self.data_manager = DataManager()
         self.current_task = None
-        self.init_ui()
-        self.load_saved_data()
+        self.pages = {} # content_stack index -> built page
+        self._prebuild_scheduled = False
+        self._stats_rendered = None # (stats_version, day) of the last stats page render
+        self._plan_day = None # Date whose weekday plan the timer follows
+        self.stats_renders = 0
+        # One full-text index shared by the notes and task searches
+        self.search_index = SearchIndex()
+        self.checkpoint = SessionCheckpoint(self.timer, checkpoint_path_for(self.data_manager.filename),
+                                            task_provider=lambda: self.current_task)
+        self.noise_player = NoisePlayer(self.timer)
+        with profiler.phase("init_ui"):
+            self.init_ui()
+        with profiler.phase("load_saved_data"):
+            self.load_saved_data()
         self.setup_connections()
-        
-        # Fetch Daily Quote
+
+    def fetch_daily_quote(self):
+        # The quote card is on the notes page, so the fetch (and networking) starts with it
+        from logic.quote_worker import QuoteWorker
         self.quote_worker = QuoteWorker()
         self.quote_worker.quote_fetched.connect(self.update_daily_quote)
         self.quote_worker.start()
 
     def update_daily_quote(self, content, author):
-        if hasattr(self, 'quote_label') and hasattr(self, 'quote_author'):
-            self.quote_label.setText(content)
-            self.quote_author.setText(author)
+        self.quote_label.setText(content)
+        self.quote_author.setText(author)
 
     def changeEvent(self, event):
         if event.type() == QEvent.Type.WindowStateChange:
@@ -66,6 +113,7 @@ class MainWindow(QMainWindow):
             self.hide()
         else:
             # If triggered by app.quit(), let it close
+            self.noise_player.stop()
             event.accept()
 
     def keyPressEvent(self, event):
@@ -101,25 +149,20 @@ class MainWindow(QMainWindow):
         self.sidebar_hide_timer.setInterval(300) # 300ms delay
         self.sidebar_hide_timer.timeout.connect(self.check_and_hide_sidebar)
         
-        # Sidebar Hover Polling Timer (For wider trigger area)
-        self.sidebar_hover_timer = QTimer()
-        self.sidebar_hover_timer.setInterval(50) # Check every 50ms
-        self.sidebar_hover_timer.timeout.connect(self.check_sidebar_hover)
-        self.sidebar_hover_timer.start() # Always run, check logic inside
-        
         self.nav_btns = []
         
         nav_items = [
-            (get_resource_path("resources/icon_focus.svg"), "专注"),
-            (get_resource_path("resources/icon_tasks.svg"), "任务"),
-            (get_resource_path("resources/icon_notes.svg"), "笔记"),
-            (get_resource_path("resources/icon_stats.svg"), "统计"),
-            (get_resource_path("resources/icon_settings.svg"), "设置")
+            ("icon_focus.svg", "专注"),
+            ("icon_tasks.svg", "任务"),
+            ("icon_notes.svg", "笔记"),
+            ("icon_stats.svg", "统计"),
+            ("icon_settings.svg", "设置")
         ]
         
-        for i, (icon_path, label) in enumerate(nav_items):
+        for i, (icon_name, label) in enumerate(nav_items):
             btn = QPushButton()
-            btn.setIcon(QIcon(icon_path))
+            btn.setIcon(icons.icon(icon_name))
+            btn.setProperty("icon_name", icon_name)
             btn.setIconSize(QSize(24, 24))
             btn.setProperty("class", "SidebarButton")
             btn.setToolTip(label)
@@ -141,15 +184,21 @@ class MainWindow(QMainWindow):
         # 2. Main Content Stack
         self.content_stack = QStackedWidget()
         
-        # Pages
-        self.content_stack.addWidget(self.create_timer_page())
-        self.content_stack.addWidget(self.create_kanban_page())
-        self.content_stack.addWidget(self.create_notes_page())
-        self.content_stack.addWidget(self.create_stats_page())
-        self.content_stack.addWidget(self.create_settings_page())
+        # Pages: the timer page now, placeholders for the rest (see ensure_page)
+        self.pages[0] = self.create_timer_page()
+        self.content_stack.addWidget(self.pages[0])
+        for _ in PAGES[1:]:
+            self.content_stack.addWidget(QWidget())
+        # The remaining pages are prebuilt once the first frame is on screen
+        self.pages[0].installEventFilter(self)
         
         self.main_layout.addWidget(self.content_stack)
         
+        # Hover strip over the left edge, shown while the sidebar is collapsed
+        self.sidebar_hot_zone = SidebarHotZone(central_widget)
+        self.sidebar_hot_zone.entered.connect(self.on_hot_zone_entered)
+        self.update_hot_zone()
+        
         # Long Break Overlay
         self.long_break_overlay = LongBreakOverlay(self)
         self.long_break_overlay.hide()
@@ -160,6 +209,7 @@ class MainWindow(QMainWindow):
     def resizeEvent(self, event):
         if hasattr(self, 'long_break_overlay'):
             self.long_break_overlay.resize(self.size())
+            self.update_hot_zone()
             
         # Responsive Sidebar Logic
         # Only trigger if timer is NOT running (timer auto-hide takes precedence)
@@ -222,7 +272,7 @@ class MainWindow(QMainWindow):
         # header_layout.addWidget(self.menu_btn)
         
         logo = QLabel("番茄钟")
-        logo.setStyleSheet("font-size: 20px; font-weight: bold; color: #333; margin-left: 10px;")
+        logo.setProperty("role", "logo")
         
         header_layout.addWidget(logo)
         header_layout.addStretch()
@@ -231,37 +281,24 @@ class MainWindow(QMainWindow):
         icon_btns_layout.setSpacing(20)
         
         # Header Icons including Compact Mode
-        # (key, tooltip, icon_path)
+        # (key, tooltip, icon_name)
         header_btns_data = [
-            ("compact", "切换小窗模式", get_resource_path("resources/icon_compact.svg")),
-            ("theme", "深色模式", get_resource_path("resources/icon_theme.svg"))
+            ("compact", "切换小窗模式", "icon_compact.svg"),
+            ("theme", "深色模式", "icon_theme.svg")
         ]
 
-        for key, tooltip, icon_path in header_btns_data:
+        for key, tooltip, icon_name in header_btns_data:
             btn = QPushButton()
             btn.setFixedSize(35, 35)
-            btn.setIcon(QIcon(icon_path))
+            btn.setIcon(icons.icon(icon_name))
+            btn.setProperty("icon_name", icon_name)
             btn.setIconSize(QSize(20, 20))
             
-            # WCAG 2.1 Compliant Style
+            # WCAG 2.1 Compliant Style (header_btn tokens)
             # High contrast: Dark Grey (#333) on Light Background
             # Border: 1px Solid #CCC for clear boundary
             # Hover/Pressed states for feedback
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #F8F9FA;
-                    border: 1px solid #CCCCCC;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #E9ECEF;
-                    border-color: #999999;
-                }
-                QPushButton:pressed {
-                    background-color: #DEE2E6;
-                    border-color: #666666;
-                }
-            """)
+            btn.setProperty("role", "header_icon")
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             btn.setToolTip(tooltip)
             
@@ -287,6 +324,12 @@ class MainWindow(QMainWindow):
         self.mode_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         container_layout.addWidget(self.mode_label)
         
+        # Daily plan forecast
+        self.plan_label = QLabel("")
+        self.plan_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.plan_label.setProperty("role", "plan")
+        container_layout.addWidget(self.plan_label)
+        
         # Circular Progress Bar
         progress_container = QWidget()
         progress_layout = QVBoxLayout(progress_container)
@@ -294,15 +337,14 @@ class MainWindow(QMainWindow):
         
         self.progress_bar = CircularProgressBar(progress_container)
         self.progress_bar.setMinimumSize(360, 360) 
-        self.progress_bar.set_color("#000000") 
-        self.progress_bar.set_bg_color("#F0F0F0")
+        self.progress_bar.set_color(theme_engine.color("ring"))
+        self.progress_bar.set_bg_color(theme_engine.color("ring_track"))
         self.progress_bar.show()
         
         # Overlay Timer Label
         self.timer_label = QLabel("25:00")
         self.timer_label.setObjectName("TimerLabel")
         self.timer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.timer_label.setStyleSheet("font-size: 96px; font-weight: bold; color: #1A1A1A; font-family: 'Segoe UI', sans-serif; background: transparent;")
         
         self.progress_bar.layout.addWidget(self.timer_label)
         progress_layout.addWidget(self.progress_bar)
@@ -317,12 +359,12 @@ class MainWindow(QMainWindow):
         
         btn_int_in = QPushButton("🧠 内部冲动")
         btn_int_in.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_int_in.setStyleSheet("background: #FFF3E0; color: #E65100; border: none; padding: 5px 15px; border-radius: 15px;")
+        btn_int_in.setProperty("role", "interrupt_internal")
         btn_int_in.clicked.connect(lambda: self.record_interruption("internal"))
         
         btn_int_ex = QPushButton("🔔 外部打扰")
         btn_int_ex.setCursor(Qt.CursorShape.PointingHandCursor)
-        btn_int_ex.setStyleSheet("background: #FFEBEE; color: #C62828; border: none; padding: 5px 15px; border-radius: 15px;")
+        btn_int_ex.setProperty("role", "interrupt_external")
         btn_int_ex.clicked.connect(lambda: self.record_interruption("external"))
         
         int_layout.addWidget(btn_int_in)
@@ -337,31 +379,34 @@ class MainWindow(QMainWindow):
         
         # Stop Button
         self.stop_btn = SmoothButton()
-        self.stop_btn.setIcon(QIcon(get_resource_path("resources/icon_stop.svg")))
+        self.stop_btn.setIcon(icons.icon("icon_stop.svg"))
         self.stop_btn.setIconSize(QSize(24, 24))
         self.stop_btn.setFixedSize(50, 50)
         # Use methods instead of property for SmoothButton
-        self.stop_btn.set_colors("#000000", "#333333", "#555555")
+        self.stop_btn.set_colors(theme_engine.color("control"), theme_engine.color("control_hover"),
+                                     theme_engine.color("control_pressed"))
         self.stop_btn.set_border_radius(25)
         self.stop_btn.setToolTip("停止 / 重置")
         self.stop_btn.clicked.connect(self.stop_timer)
         
         # Play/Pause Button
         self.start_btn = SmoothButton()
-        self.start_btn.setIcon(QIcon(get_resource_path("resources/icon_play.svg")))
+        self.start_btn.setIcon(icons.icon("icon_play.svg"))
         self.start_btn.setIconSize(QSize(32, 32))
         self.start_btn.setFixedSize(72, 72)
         # Main button style
-        self.start_btn.set_colors("#000000", "#333333", "#555555")
+        self.start_btn.set_colors(theme_engine.color("control"), theme_engine.color("control_hover"),
+                                      theme_engine.color("control_pressed"))
         self.start_btn.set_border_radius(36)
         self.start_btn.setToolTip("开始 / 暂停")
         
         # Abandon Button
         self.abandon_btn = SmoothButton()
-        self.abandon_btn.setIcon(QIcon(get_resource_path("resources/icon_abandon.svg")))
+        self.abandon_btn.setIcon(icons.icon("icon_abandon.svg"))
         self.abandon_btn.setIconSize(QSize(24, 24))
         self.abandon_btn.setFixedSize(50, 50)
-        self.abandon_btn.set_colors("#000000", "#333333", "#555555")
+        self.abandon_btn.set_colors(theme_engine.color("control"), theme_engine.color("control_hover"),
+                                        theme_engine.color("control_pressed"))
         self.abandon_btn.set_border_radius(25)
         self.abandon_btn.setToolTip("放弃当前番茄")
         self.abandon_btn.clicked.connect(self.abandon_timer)
@@ -385,17 +430,7 @@ class MainWindow(QMainWindow):
         self.progress_line = QProgressBar()
         self.progress_line.setTextVisible(False)
         self.progress_line.setFixedHeight(4)
-        self.progress_line.setStyleSheet("""
-            QProgressBar {
-                background-color: #F0F0F0;
-                border: none;
-                border-radius: 2px;
-            }
-            QProgressBar::chunk {
-                background-color: #000000;
-                border-radius: 2px;
-            }
-        """)
+        self.progress_line.setObjectName("ProgressLine")
         
         self.break_info = QLabel("休息 05:00")
         self.break_info.setProperty("class", "InfoLabel")
@@ -412,7 +447,7 @@ class MainWindow(QMainWindow):
     def abandon_timer(self):
         self.timer.reset()
         self.mode_label.setText("已放弃")
-        if self.auto_hide_sidebar_toggle.isChecked():
+        if self.auto_hide_sidebar:
             self.animate_sidebar(85)
 
     def record_interruption(self, type_name):
@@ -432,6 +467,15 @@ class MainWindow(QMainWindow):
         title.setProperty("class", "KanbanTitle")
         header_layout.addWidget(title)
         header_layout.addStretch()
+        
+        self.task_search = QLineEdit()
+        self.task_search.setPlaceholderText("🔍 搜索任务...")
+        self.task_search.setFixedWidth(260)
+        header_layout.addWidget(self.task_search)
+        
+        self.task_searcher = NoteSearcher(self.search_index, kind="task")
+        self.task_search.textChanged.connect(self.task_searcher.search)
+        self.task_searcher.results_ready.connect(self.apply_task_matches)
         layout.addLayout(header_layout)
         
         # Quadrant Grid
@@ -439,42 +483,35 @@ class MainWindow(QMainWindow):
         grid_layout.setSpacing(15)
         
         self.kanban_cols = {}
-        # Quadrant Config: (key, title, row, col, bg_color)
+        # Quadrant Config: (key, title, row, col); colors are the quadrant_* theme tokens
         quadrants = [
-            ("q1", "🔥 重要且紧急", 0, 0, "#FFEBEE"),
-            ("q2", "📅 重要不紧急", 0, 1, "#E3F2FD"),
-            ("q3", "⚡ 紧急不重要", 1, 0, "#FFF3E0"),
-            ("q4", "☕ 不重要不紧急", 1, 1, "#F3E5F5")
+            ("q1", "🔥 重要且紧急", 0, 0),
+            ("q2", "📅 重要不紧急", 0, 1),
+            ("q3", "⚡ 紧急不重要", 1, 0),
+            ("q4", "☕ 不重要不紧急", 1, 1)
         ]
         
-        for key, title, r, c, bg_color in quadrants:
+        for key, title, r, c in quadrants:
             frame = QFrame()
             frame.setObjectName(f"Quadrant_{key}")
-            frame.setStyleSheet(f"""
-                #Quadrant_{key} {{
-                    background-color: {bg_color};
-                    border-radius: 12px;
-                    border: 1px solid transparent;
-                }}
-            """)
             v_layout = QVBoxLayout(frame)
             v_layout.setContentsMargins(10, 10, 10, 10)
             
             header_lbl = QLabel(title)
-            header_lbl.setStyleSheet("font-weight: bold; font-size: 15px; color: #555; margin-bottom: 5px;")
+            header_lbl.setProperty("role", "quadrant_title")
             v_layout.addWidget(header_lbl)
             
             # Input for this quadrant
             input_field = QLineEdit()
             input_field.setPlaceholderText("＋ 添加任务...")
-            input_field.setStyleSheet("background: rgba(255,255,255,0.7); border: none; border-radius: 5px; padding: 5px;")
+            input_field.setProperty("role", "quadrant_input")
             # Use closure to capture key
             input_field.returnPressed.connect(lambda k=key, f=input_field: self.add_kanban_task(k, f))
             v_layout.addWidget(input_field)
             
+            # Edits are saved by DataManager as single deltas
             list_widget = KanbanList(self.data_manager, key)
-            list_widget.item_deleted.connect(self.save_kanban_state)
-            list_widget.order_changed.connect(self.save_kanban_state)
+            list_widget.item_deleted.connect(self.refresh_task_search)
             list_widget.focus_task.connect(self.start_focus_on_task)
             
             v_layout.addWidget(list_widget)
@@ -486,18 +523,17 @@ class MainWindow(QMainWindow):
         
         # Completed Section (Collapsible-like)
         comp_frame = QFrame()
-        comp_frame.setStyleSheet("background-color: #FAFAFA; border-radius: 10px; border: 1px solid #EEE;")
+        comp_frame.setObjectName("CompletedFrame")
         comp_layout = QVBoxLayout(comp_frame)
         comp_layout.setContentsMargins(10, 10, 10, 10)
         
         comp_header = QLabel("✅ 已完成任务")
-        comp_header.setStyleSheet("font-weight: bold; color: #888;")
+        comp_header.setProperty("role", "completed_title")
         comp_layout.addWidget(comp_header)
         
         self.completed_list = KanbanList(self.data_manager, "completed")
         self.completed_list.setMaximumHeight(150) # Limit height
-        self.completed_list.item_deleted.connect(self.save_kanban_state)
-        self.completed_list.order_changed.connect(self.save_kanban_state)
+        self.completed_list.item_deleted.connect(self.refresh_task_search)
         self.kanban_cols["completed"] = self.completed_list
         
         comp_layout.addWidget(self.completed_list)
@@ -506,32 +542,27 @@ class MainWindow(QMainWindow):
         return page
 
     def create_notes_page(self):
+        from ui.notes_model import NotesModel, NotesFilterProxy
         page = QWidget()
         layout = QVBoxLayout(page)
         layout.setContentsMargins(40, 40, 40, 40)
         
         # Daily Quote Card
         quote_card = QFrame()
-        quote_card.setStyleSheet("""
-            QFrame {
-                background-color: #F8F9FA;
-                border-radius: 15px;
-                border: 1px solid #EEE;
-            }
-        """)
+        quote_card.setObjectName("QuoteCard")
         quote_layout = QVBoxLayout(quote_card)
         quote_layout.setContentsMargins(20, 20, 20, 20)
         
         title = QLabel("每日一句")
-        title.setStyleSheet("font-size: 14px; color: #999; font-weight: bold; margin-bottom: 5px;")
+        title.setProperty("role", "quote_title")
         
         self.quote_label = QLabel("正在获取灵感...")
         self.quote_label.setWordWrap(True)
-        self.quote_label.setStyleSheet("font-size: 18px; color: #333; font-family: 'Kaiti', 'Microsoft YaHei'; line-height: 1.5;")
+        self.quote_label.setProperty("role", "quote")
         
         self.quote_author = QLabel("")
         self.quote_author.setAlignment(Qt.AlignmentFlag.AlignRight)
-        self.quote_author.setStyleSheet("font-size: 14px; color: #666; margin-top: 10px;")
+        self.quote_author.setProperty("role", "quote_author")
         
         quote_layout.addWidget(title)
         quote_layout.addWidget(self.quote_label)
@@ -549,22 +580,34 @@ class MainWindow(QMainWindow):
         self.note_search = QLineEdit()
         self.note_search.setPlaceholderText("🔍 搜索笔记标题或内容...")
         self.note_search.textChanged.connect(self.filter_notes)
+        # Search is debounced and runs in a worker thread; results filter the proxy
+        self.note_searcher = NoteSearcher(self.search_index, kind="note")
+        self.note_searcher.results_ready.connect(self.apply_note_matches)
+        
+        # Drafts left by a crash; hidden when there are none
+        self.recover_draft_btn = QPushButton()
+        self.recover_draft_btn.clicked.connect(self.recover_note_draft)
+        self.update_draft_button()
         
         header.addWidget(self.new_note_btn)
+        header.addWidget(self.recover_draft_btn)
         header.addSpacing(20)
         header.addWidget(self.note_search, 1)
         
         # Notes Table
-        self.notes_table = QTableWidget(0, 2)
+        self.notes_model = NotesModel(self.data_manager, self)
+        self.notes_proxy = NotesFilterProxy(self)
+        self.notes_proxy.setSourceModel(self.notes_model)
+        self.notes_table = QTableView()
         self.notes_table.setObjectName("NotesTable")
-        self.notes_table.setHorizontalHeaderLabels(["标题", "摘要"])
+        self.notes_table.setModel(self.notes_proxy)
         self.notes_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         self.notes_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.notes_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.notes_table.verticalHeader().setVisible(False)
         self.notes_table.setShowGrid(False)
         self.notes_table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.notes_table.itemDoubleClicked.connect(self.edit_note)
+        self.notes_table.doubleClicked.connect(self.edit_note)
         
         # Context Menu
         self.notes_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -575,6 +618,8 @@ class MainWindow(QMainWindow):
         return page
 
     def create_stats_page(self):
+        from ui.heatmap import YearHeatmap
+        from ui.trend_chart import TrendChart
         page = QWidget()
         layout = QVBoxLayout(page)
         layout.setContentsMargins(50, 40, 50, 40)
@@ -587,10 +632,10 @@ class MainWindow(QMainWindow):
         
         title = QLabel("专注统计")
         title.setProperty("class", "KanbanTitle")
-        title.setStyleSheet("font-size: 28px; margin-bottom: 5px;")
+        title.setProperty("role", "page_title")
         
         subtitle = QLabel("查看您的专注历史与数据分析")
-        subtitle.setStyleSheet("color: #888; font-size: 14px;")
+        subtitle.setProperty("role", "subtitle")
         
         title_layout.addWidget(title)
         title_layout.addWidget(subtitle)
@@ -611,10 +656,10 @@ class MainWindow(QMainWindow):
         cards_layout = QHBoxLayout()
         cards_layout.setSpacing(20)
         
-        self.stat_pomos = self.create_stat_card("累计番茄", "0", "🍅", "#FFF0F0")
-        self.stat_time = self.create_stat_card("专注时长", "0 分钟", "⏱️", "#F0F8FF")
-        self.stat_days = self.create_stat_card("累计天数", "0", "📅", "#F5F5F5")
-        self.stat_interrupts = self.create_stat_card("打断次数", "0", "⚡", "#FFF8E1")
+        self.stat_pomos = self.create_stat_card("累计番茄", "0", "🍅", "red")
+        self.stat_time = self.create_stat_card("专注时长", "0 分钟", "⏱️", "blue")
+        self.stat_days = self.create_stat_card("累计天数", "0", "📅", "grey")
+        self.stat_interrupts = self.create_stat_card("打断次数", "0", "⚡", "amber")
         
         cards_layout.addWidget(self.stat_pomos)
         cards_layout.addWidget(self.stat_time)
@@ -626,56 +671,96 @@ class MainWindow(QMainWindow):
         
         # Today's Detail
         self.today_stat_label = QLabel("今日专注：0个番茄")
-        self.today_stat_label.setStyleSheet("font-size: 18px; color: #333333; margin-bottom: 20px; font-weight: bold;")
+        self.today_stat_label.setProperty("role", "today_stat")
         layout.addWidget(self.today_stat_label)
         
+        # Yearly heatmap
+        heatmap_header = QHBoxLayout()
+        heatmap_title = QLabel("年度专注热力图")
+        heatmap_title.setProperty("class", "KanbanTitle")
+        heatmap_title.setProperty("role", "section_title")
+        heatmap_header.addWidget(heatmap_title)
+        heatmap_header.addStretch()
+        
+        self.heatmap = YearHeatmap(self.data_manager)
+        prev_year_btn = QPushButton("◀")
+        next_year_btn = QPushButton("▶")
+        self.heatmap_year_label = QLabel(str(self.heatmap.year))
+        self.heatmap_year_label.setProperty("role", "year")
+        for btn in (prev_year_btn, next_year_btn):
+            btn.setFixedSize(28, 28)
+            btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        prev_year_btn.clicked.connect(lambda: self.heatmap.set_year(self.heatmap.year - 1))
+        next_year_btn.clicked.connect(lambda: self.heatmap.set_year(self.heatmap.year + 1))
+        self.heatmap.year_changed.connect(lambda year: self.heatmap_year_label.setText(str(year)))
+        heatmap_header.addWidget(prev_year_btn)
+        heatmap_header.addWidget(self.heatmap_year_label)
+        heatmap_header.addWidget(next_year_btn)
+        
+        layout.addLayout(heatmap_header)
+        layout.addSpacing(10)
+        layout.addWidget(self.heatmap)
+        layout.addSpacing(30)
+
+        # Trends
+        trend_header = QHBoxLayout()
+        trend_title = QLabel("专注趋势")
+        trend_title.setProperty("class", "KanbanTitle")
+        trend_title.setProperty("role", "section_title")
+        trend_header.addWidget(trend_title)
+        trend_header.addStretch()
+
+        self.trend_chart = TrendChart(self.data_manager)
+        self.trend_metric_combo = QComboBox()
+        self.trend_metric_combo.addItem("专注分钟", "minutes")
+        self.trend_metric_combo.addItem("番茄数", "count")
+        self.trend_metric_combo.addItem("打断率", "interruption_rate")
+        self.trend_granularity_combo = QComboBox()
+        self.trend_granularity_combo.addItem("按日", "day")
+        self.trend_granularity_combo.addItem("按周", "week")
+        self.trend_granularity_combo.addItem("按月", "month")
+        for combo in (self.trend_metric_combo, self.trend_granularity_combo):
+            combo.setFixedWidth(100)
+            trend_header.addWidget(combo)
+        self.trend_metric_combo.currentIndexChanged.connect(
+            lambda: self.trend_chart.set_metric(self.trend_metric_combo.currentData()))
+        self.trend_granularity_combo.currentIndexChanged.connect(
+            lambda: self.trend_chart.set_granularity(self.trend_granularity_combo.currentData()))
+
+        layout.addLayout(trend_header)
+        layout.addSpacing(10)
+        layout.addWidget(self.trend_chart)
+        layout.addSpacing(30)
+        
         # History Section
         history_title = QLabel("最近记录")
         history_title.setProperty("class", "KanbanTitle")
-        history_title.setStyleSheet("font-size: 18px; margin-bottom: 15px;")
+        history_title.setProperty("role", "section_title")
         layout.addWidget(history_title)
         
         self.history_list = QListWidget()
         self.history_list.setProperty("class", "KanbanList")
-        self.history_list.setStyleSheet("""
-            QListWidget { background: transparent; border: none; }
-            QListWidget::item { 
-                background: #FFFFFF; 
-                border-radius: 10px; 
-                margin-bottom: 10px; 
-                padding: 15px; 
-                border: 1px solid #F0F0F0;
-                color: #555;
-            }
-            QListWidget::item:hover { background: #FAFAFA; border-color: #EEE; }
-        """)
+        self.history_list.setObjectName("HistoryList")
         layout.addWidget(self.history_list)
         
         return page
 
-    def create_stat_card(self, title, value, icon, bg_color):
+    def create_stat_card(self, title, value, icon, tone):
+        # tone selects the card's tone_* background token
         card = QFrame()
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {bg_color};
-                border-radius: 20px;
-                border: 1px solid transparent;
-            }}
-            QFrame:hover {{
-                border: 1px solid #DDD;
-            }}
-        """)
+        card.setProperty("class", "StatCard")
+        card.setProperty("tone", tone)
         layout = QVBoxLayout(card)
         layout.setContentsMargins(25, 25, 25, 25)
         
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 32px; background: transparent;")
+        icon_label.setProperty("role", "stat_icon")
         
         val_label = QLabel(value)
-        val_label.setStyleSheet("font-size: 28px; font-weight: bold; color: #333; background: transparent; margin-top: 10px;")
+        val_label.setProperty("role", "stat_value")
         
         title_label = QLabel(title)
-        title_label.setStyleSheet("font-size: 14px; color: #777; background: transparent;")
+        title_label.setProperty("role", "stat_title")
         
         layout.addWidget(icon_label, 0, Qt.AlignmentFlag.AlignRight)
         layout.addWidget(val_label)
@@ -692,29 +777,23 @@ class MainWindow(QMainWindow):
         
         title = QLabel("设置")
         title.setProperty("class", "KanbanTitle")
-        title.setStyleSheet("font-size: 28px; margin-bottom: 20px;")
+        title.setProperty("role", "page_title")
         layout.addWidget(title)
+        layout.addSpacing(15)
         
         # Settings Container
         settings_container = QWidget()
         settings_container.setObjectName("SettingsContainer")
-        settings_container.setStyleSheet("""
-            #SettingsContainer {
-                background-color: #FFFFFF;
-                border: 1px solid #EEEEEE;
-                border-radius: 20px;
-            }
-        """)
         
         # Use GridLayout for better alignment
         container_layout = QGridLayout(settings_container)
         container_layout.setContentsMargins(50, 50, 50, 50)
-        container_layout.setVerticalSpacing(30)
+        container_layout.setVerticalSpacing(20)
         container_layout.setHorizontalSpacing(40)
         
         # Row 1: Work Duration
         work_label = QLabel("专注时长")
-        work_label.setStyleSheet("font-size: 16px; color: #333; font-weight: bold;")
+        work_label.setProperty("role", "setting_label")
         self.work_mins_spin = NumberControl()
         self.work_mins_spin.setRange(1, 120)
         self.work_mins_spin.setSuffix(" 分钟")
@@ -724,7 +803,7 @@ class MainWindow(QMainWindow):
         
         # Row 2: Break Duration
         break_label = QLabel("休息时长")
-        break_label.setStyleSheet("font-size: 16px; color: #333; font-weight: bold;")
+        break_label.setProperty("role", "setting_label")
         self.break_mins_spin = NumberControl()
         self.break_mins_spin.setRange(1, 60)
         self.break_mins_spin.setSuffix(" 分钟")
@@ -732,34 +811,93 @@ class MainWindow(QMainWindow):
         container_layout.addWidget(break_label, 1, 0)
         container_layout.addWidget(self.break_mins_spin, 1, 1, Qt.AlignmentFlag.AlignLeft)
         
-        # Row 3: Sound Toggle
+        # Row 3: Long Break Duration
+        long_break_label = QLabel("长休息时长")
+        long_break_label.setProperty("role", "setting_label")
+        self.long_break_mins_spin = NumberControl()
+        self.long_break_mins_spin.setRange(1, 60)
+        self.long_break_mins_spin.setSuffix(" 分钟")
+        
+        container_layout.addWidget(long_break_label, 2, 0)
+        container_layout.addWidget(self.long_break_mins_spin, 2, 1, Qt.AlignmentFlag.AlignLeft)
+        
+        # Row 4: Custom Cycle Schedule
+        schedule_label = QLabel("循环计划")
+        schedule_label.setProperty("role", "setting_label")
+        self.schedule_edit = QLineEdit()
+        self.schedule_edit.setPlaceholderText("留空使用上方时长，例如 50/10x3 then 30 或 90/20")
+        self.schedule_edit.setMinimumWidth(320)
+        
+        weekday_btn = QPushButton("按星期设置...")
+        weekday_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        weekday_btn.clicked.connect(self.show_schedule_profiles_dialog)
+        
+        schedule_row = QHBoxLayout()
+        schedule_row.setSpacing(10)
+        schedule_row.addWidget(self.schedule_edit)
+        schedule_row.addWidget(weekday_btn)
+        
+        container_layout.addWidget(schedule_label, 3, 0)
+        container_layout.addLayout(schedule_row, 3, 1, Qt.AlignmentFlag.AlignLeft)
+        
+        # Row 5: Daily Goal
+        goal_label = QLabel("每日目标")
+        goal_label.setProperty("role", "setting_label")
+        self.daily_goal_spin = NumberControl()
+        self.daily_goal_spin.setRange(1, 24)
+        self.daily_goal_spin.setSuffix(" 个番茄")
+        
+        container_layout.addWidget(goal_label, 4, 0)
+        container_layout.addWidget(self.daily_goal_spin, 4, 1, Qt.AlignmentFlag.AlignLeft)
+        
+        # Row 6: Sound Toggle
         sound_label = QLabel("提示音")
-        sound_label.setStyleSheet("font-size: 16px; color: #333; font-weight: bold;")
+        sound_label.setProperty("role", "setting_label")
         self.sound_toggle = QCheckBox("开启结束提示音")
-        icon_check_path = get_resource_path("resources/icon_check.svg").replace("\\", "/")
-        self.sound_toggle.setStyleSheet(f"""
-            QCheckBox {{ font-size: 15px; color: #555; spacing: 8px; }}
-            QCheckBox::indicator {{ width: 22px; height: 22px; border-radius: 6px; border: 1px solid #CCC; }}
-            QCheckBox::indicator:checked {{ background-color: #000000; border-color: #000000; image: url('{icon_check_path}'); }}
-        """)
         self.sound_toggle.setCursor(Qt.CursorShape.PointingHandCursor)
         
-        container_layout.addWidget(sound_label, 2, 0)
-        container_layout.addWidget(self.sound_toggle, 2, 1, Qt.AlignmentFlag.AlignLeft)
+        container_layout.addWidget(sound_label, 5, 0)
+        container_layout.addWidget(self.sound_toggle, 5, 1, Qt.AlignmentFlag.AlignLeft)
         
-        # Row 4: Auto-hide Sidebar Toggle
+        # Row 7: Auto-hide Sidebar Toggle
         sidebar_behavior_label = QLabel("行为")
-        sidebar_behavior_label.setStyleSheet("font-size: 16px; color: #333; font-weight: bold;")
+        sidebar_behavior_label.setProperty("role", "setting_label")
         self.auto_hide_sidebar_toggle = QCheckBox("番茄钟开始时自动隐藏侧边栏")
-        self.auto_hide_sidebar_toggle.setStyleSheet(f"""
-            QCheckBox {{ font-size: 15px; color: #555; spacing: 8px; }}
-            QCheckBox::indicator {{ width: 22px; height: 22px; border-radius: 6px; border: 1px solid #CCC; }}
-            QCheckBox::indicator:checked {{ background-color: #000000; border-color: #000000; image: url('{icon_check_path}'); }}
-        """)
         self.auto_hide_sidebar_toggle.setCursor(Qt.CursorShape.PointingHandCursor)
         
-        container_layout.addWidget(sidebar_behavior_label, 3, 0)
-        container_layout.addWidget(self.auto_hide_sidebar_toggle, 3, 1, Qt.AlignmentFlag.AlignLeft)
+        container_layout.addWidget(sidebar_behavior_label, 6, 0)
+        container_layout.addWidget(self.auto_hide_sidebar_toggle, 6, 1, Qt.AlignmentFlag.AlignLeft)
+        
+        # Row 8: Background Noise
+        noise_label = QLabel("白噪音")
+        noise_label.setProperty("role", "setting_label")
+        self.white_noise_toggle = QCheckBox("专注时播放背景噪音")
+        self.white_noise_toggle.setCursor(Qt.CursorShape.PointingHandCursor)
+        if not self.noise_player.available:
+            self.white_noise_toggle.setEnabled(False)
+            self.white_noise_toggle.setToolTip("当前系统不支持音频播放")
+        
+        self.noise_type_combo = QComboBox()
+        for kind, text in (("white", "白噪音"), ("pink", "粉红噪音"), ("brown", "棕噪音")):
+            self.noise_type_combo.addItem(text, kind)
+        self.noise_type_combo.setFixedWidth(120)
+        
+        noise_row = QHBoxLayout()
+        noise_row.setSpacing(20)
+        noise_row.addWidget(self.white_noise_toggle)
+        noise_row.addWidget(self.noise_type_combo)
+        
+        container_layout.addWidget(noise_label, 7, 0)
+        container_layout.addLayout(noise_row, 7, 1, Qt.AlignmentFlag.AlignLeft)
+        
+        # Row 9: Progress Ring Animation
+        progress_label = QLabel("进度环")
+        progress_label.setProperty("role", "setting_label")
+        self.smooth_progress_toggle = QCheckBox("平滑推进 (短时段逐像素移动)")
+        self.smooth_progress_toggle.setCursor(Qt.CursorShape.PointingHandCursor)
+        
+        container_layout.addWidget(progress_label, 8, 0)
+        container_layout.addWidget(self.smooth_progress_toggle, 8, 1, Qt.AlignmentFlag.AlignLeft)
         
         # Add column stretch to push everything to the left
         container_layout.setColumnStretch(2, 1)
@@ -788,24 +926,12 @@ class MainWindow(QMainWindow):
         
         sponsor_text = QLabel("创作不易，喜欢就请我喝杯咖啡吧~ ☕\n--无论是否赞助，感谢遇见你")
         sponsor_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        sponsor_text.setStyleSheet("color: #888; font-size: 14px; font-style: italic;")
+        sponsor_text.setProperty("role", "sponsor_text")
         
         sponsor_btn = QPushButton("我要赞助")
         sponsor_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         sponsor_btn.setFixedWidth(120)
-        sponsor_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #FFEBEE;
-                color: #D32F2F;
-                border: 1px solid #FFCDD2;
-                border-radius: 15px;
-                padding: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #FFCDD2;
-            }
-        """)
+        sponsor_btn.setProperty("role", "sponsor")
         sponsor_btn.clicked.connect(self.show_sponsor_dialog)
         
         sponsor_layout.addWidget(sponsor_text)
@@ -816,11 +942,20 @@ class MainWindow(QMainWindow):
         # Author Info
         author_label = QLabel("作者：饿梦")
         author_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        author_label.setStyleSheet("color: #999; font-size: 14px; margin-top: 10px; font-weight: bold;")
+        author_label.setProperty("role", "author")
         layout.addWidget(author_label)
         
         layout.addStretch()
-        return page
+        
+        # Settings grew beyond the minimum window height, so let the page scroll
+        scroll = QScrollArea()
+        scroll.setWidget(page)
+        scroll.setWidgetResizable(True)
+        scroll.setFrameShape(QFrame.Shape.NoFrame)
+        scroll.setObjectName("SettingsScroll")
+        scroll.viewport().setAutoFillBackground(False)
+        page.setAutoFillBackground(False)
+        return scroll
 
     def show_sponsor_dialog(self):
         dialog = QDialog(self)
@@ -829,7 +964,7 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(dialog)
         
         msg = QLabel("感谢您的认可！❤️")
-        msg.setStyleSheet("font-size: 20px; font-weight: bold; color: #333; margin-bottom: 10px;")
+        msg.setProperty("role", "dialog_title")
         msg.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         qr_label = QLabel()
@@ -842,7 +977,7 @@ class MainWindow(QMainWindow):
             qr_label.setPixmap(pixmap.scaled(250, 250, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
         else:
             qr_label.setText("图片加载失败\n请检查 resources/赞赏码.jpg")
-            qr_label.setStyleSheet("background: #F5F5F5; color: #AAA; border: 2px dashed #DDD; border-radius: 10px; font-size: 14px;")
+            qr_label.setProperty("role", "image_placeholder")
         
         layout.addWidget(msg)
         layout.addWidget(qr_label, 0, Qt.AlignmentFlag.AlignCenter)
@@ -853,17 +988,111 @@ class MainWindow(QMainWindow):
         
         dialog.exec()
 
+    def show_schedule_profiles_dialog(self):
+        settings = self.data_manager.data.get("settings", {})
+        profiles = dict(settings.get("schedule_profiles") or {})
+        
+        dialog = QDialog(self)
+        dialog.setWindowTitle("按星期设置循环计划")
+        layout = QVBoxLayout(dialog)
+        
+        hint = QLabel("留空的日期使用默认循环计划。")
+        hint.setProperty("role", "hint")
+        layout.addWidget(hint)
+        
+        form = QFormLayout()
+        edits = {}
+        for key, name in zip(WEEKDAY_KEYS, WEEKDAY_NAMES):
+            edit = QLineEdit(profiles.get(key, ""))
+            edit.setPlaceholderText("例如 90/20")
+            form.addRow(name, edit)
+            edits[key] = edit
+        layout.addLayout(form)
+        
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel)
+        layout.addWidget(buttons)
+        
+        def save():
+            new_profiles = {}
+            for key, name in zip(WEEKDAY_KEYS, WEEKDAY_NAMES):
+                spec = edits[key].text().strip()
+                if not spec:
+                    continue
+                try:
+                    compile_schedule(spec)
+                except ValueError as e:
+                    QMessageBox.warning(dialog, "计划格式错误", f"{name}: {e}")
+                    return
+                new_profiles[key] = spec
+            self.data_manager.update_settings({"schedule_profiles": new_profiles})
+            self.apply_schedule()
+            dialog.accept()
+        
+        buttons.accepted.connect(save)
+        buttons.rejected.connect(dialog.reject)
+        dialog.exec()
+
+    def apply_schedule(self):
+        today = QDate.currentDate()
+        self._plan_day = today
+        plan = plan_for_day(self.data_manager.data.get("settings", {}), today.toPyDate())
+        if plan != self.timer.plan:
+            self.timer.set_plan(plan)
+        self.update_info_labels()
+        self.update_plan_forecast()
+        # The app usually stays up in the tray, so look again just after midnight
+        now = QDateTime.currentDateTime()
+        midnight = QDateTime(now.date().addDays(1), QTime(0, 0))
+        self.timer.scheduler.add(DAY_CHANGE_TIMER, now.secsTo(midnight) + 1, internal=True)
+
+    def on_scheduler_timer(self, name, label):
+        if name == DAY_CHANGE_TIMER:
+            self.check_plan_day()
+
+    def check_plan_day(self, *args):
+        """Switch to the new day's plan once the date has changed."""
+        if QDate.currentDate() == self._plan_day:
+            return
+        timer = self.timer
+        if not timer.is_running and timer.remaining_seconds != timer.session_seconds:
+            # Paused partway through a step, which a new plan would reset; the
+            # step's end (mode_changed) tries again
+            return
+        self.apply_schedule()
+
+    def update_plan_forecast(self, *args):
+        goal = self.data_manager.data.get("settings", {}).get("daily_goal", 8)
+        today = QDate.currentDate().toString(Qt.DateFormat.ISODate)
+        done = self.data_manager.data.get("stats", {}).get("history", {}).get(today, {}).get("count", 0)
+        
+        if done >= goal:
+            self.plan_label.setText(f"今日目标 {goal} 个番茄已完成 🎉")
+            return
+        finish = self.timer.predict_finish(goal - done)
+        if finish is None:
+            self.plan_label.setText("")
+            return
+        day_note = "" if finish.date() == QDate.currentDate().toPyDate() else "（次日）"
+        self.plan_label.setText(f"今日 {done}/{goal} 个番茄 · 按计划预计 {finish:%H:%M}{day_note} 完成")
+
     def create_separator(self):
         line = QFrame()
         line.setFrameShape(QFrame.Shape.HLine)
         line.setFrameShadow(QFrame.Shadow.Sunken)
-        line.setStyleSheet("background-color: #F0F0F0; border: none; max-height: 1px;")
+        line.setProperty("role", "separator")
         return line
 
     def setup_connections(self):
-        self.timer.tick.connect(self.update_timer_display)
+        self.timer.dispatcher.subscribe(
+            "main_window", self.update_timer_display,
+            render=lambda seconds: (seconds, self.current_total_seconds()),
+            widget=self)
         self.timer.mode_changed.connect(self.update_mode_display)
         self.timer.finished.connect(self.handle_timer_finished)
+        self.timer.mode_changed.connect(self.check_plan_day)
+        self.timer.mode_changed.connect(self.update_plan_forecast)
+        self.timer.running_changed.connect(self.update_plan_forecast)
+        self.timer.scheduler.timer_finished.connect(self.on_scheduler_timer)
         
         self.start_btn.clicked.connect(self.toggle_timer)
         # self.skip_btn removed/replaced by abandon_btn
@@ -874,38 +1103,101 @@ class MainWindow(QMainWindow):
         QMessageBox.warning(self, "数据保存失败", f"无法保存数据，请检查磁盘空间或权限。\n错误信息: {message}")
 
     def load_saved_data(self):
-        data = self.data_manager.data
-        tasks = data.get("tasks", {})
-        for key, items in tasks.items():
-            if key in self.kanban_cols:
-                self.kanban_cols[key].clear()
-                for item_data in items:
-                    # item_data is a dict now
-                    self.kanban_cols[key].add_task_item(item_data)
-        
-        self.refresh_notes_table()
-        self.refresh_stats()
-        
-        settings = data.get("settings", {})
-        self.work_mins_spin.setValue(settings.get("work_mins", 25))
-        self.break_mins_spin.setValue(settings.get("break_mins", 5))
-        self.sound_toggle.setChecked(settings.get("sound_enabled", True))
-        self.auto_hide_sidebar_toggle.setChecked(settings.get("auto_hide_sidebar", True))
+        # Pages other than the timer fill themselves from the data when built (see PAGES)
+        self.data_manager.stats_changed.connect(self.on_stats_changed)
         
-        self.timer.set_durations(self.work_mins_spin.value(), self.break_mins_spin.value())
-        self.timer.set_sound_enabled(self.sound_toggle.isChecked())
+        # Settings take effect from the data, whether or not the settings page exists yet
+        settings = self.data_manager.data.get("settings", {})
+        self.auto_hide_sidebar = settings.get("auto_hide_sidebar", True)
+        self.progress_bar.set_smooth(settings.get("smooth_progress", False))
+        self.apply_schedule()
+        self.timer.set_sound_enabled(settings.get("sound_enabled", True))
+        self.noise_player.set_kind(settings.get("white_noise_type", "pink"))
+        self.noise_player.set_enabled(settings.get("white_noise_enabled", False))
         
         # Apply saved theme preference
         theme = settings.get("theme", "light")
-        self.apply_theme(theme)
+        with profiler.phase("apply_theme"):
+            self.apply_theme(theme)
         if hasattr(self, 'theme_btn'):
             self.theme_btn.blockSignals(True)
             self.theme_btn.setChecked(theme == "dark")
             self.theme_btn.blockSignals(False)
 
+    def load_kanban_page(self):
+        # Columns are views over DataManager's task lists
+        for col in self.kanban_cols.values():
+            col.reload()
+        self.refresh_task_search()
+
+    def load_notes_page(self):
+        self.refresh_notes_table()
+        self.fetch_daily_quote()
+
+    def load_stats_page(self):
+        self.refresh_stats()
+
+    def load_settings_page(self):
+        settings = self.data_manager.data.get("settings", {})
+        self.work_mins_spin.setValue(settings.get("work_mins", 25))
+        self.break_mins_spin.setValue(settings.get("break_mins", 5))
+        self.long_break_mins_spin.setValue(settings.get("long_break_mins", 15))
+        self.schedule_edit.setText(settings.get("schedule", ""))
+        self.daily_goal_spin.setValue(settings.get("daily_goal", 8))
+        self.sound_toggle.setChecked(settings.get("sound_enabled", True))
+        # The checkbox applies as soon as it is toggled, as it always has; it is saved with 保存设置
+        self.auto_hide_sidebar_toggle.setChecked(self.auto_hide_sidebar)
+        self.auto_hide_sidebar_toggle.toggled.connect(self.set_auto_hide_sidebar)
+        self.white_noise_toggle.setChecked(settings.get("white_noise_enabled", False))
+        noise_index = self.noise_type_combo.findData(settings.get("white_noise_type", "pink"))
+        self.noise_type_combo.setCurrentIndex(max(noise_index, 0))
+        self.smooth_progress_toggle.setChecked(self.progress_bar.is_smooth())
+
+    def set_auto_hide_sidebar(self, enabled):
+        self.auto_hide_sidebar = enabled
+
+    def is_page_built(self, index):
+        return index in self.pages
+
+    def ensure_page(self, index):
+        """Build the page at `index` in place of its placeholder, if not built yet."""
+        page = self.pages.get(index)
+        if page is not None:
+            return page
+        builder, loader = PAGES[index]
+        with profiler.phase(builder):
+            page = getattr(self, builder)()
+        self.pages[index] = page
+        
+        current = self.content_stack.currentIndex()
+        placeholder = self.content_stack.widget(index)
+        self.content_stack.insertWidget(index, page)
+        self.content_stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.content_stack.setCurrentIndex(current)
+        
+        if loader:
+            getattr(self, loader)()
+        # The app stylesheet reaches new widgets by itself; icon tints are per button
+        tint_icons(page)
+        return page
+
+    def prebuild_pages(self):
+        """Build the next placeholder page, one per event loop pass so input stays responsive."""
+        for index in range(len(PAGES)):
+            if not self.is_page_built(index):
+                self.ensure_page(index)
+                break
+        if len(self.pages) < len(PAGES):
+            QTimer.singleShot(0, self.prebuild_pages)
+        else:
+            # Startup is over once every page exists
+            profiler.finish()
+
     def switch_page(self, index):
         if self.content_stack.currentIndex() == index: return
         
+        self.ensure_page(index)
         self.content_stack.setCurrentIndex(index)
         
         # Update active state of nav buttons    
@@ -918,8 +1210,19 @@ class MainWindow(QMainWindow):
         if index == 3: self.refresh_stats()
 
     def eventFilter(self, obj, event):
-        if obj == self.sidebar:
-            if event.type() == QEvent.Type.Enter:
+        if event.type() == QEvent.Type.Paint and obj is self.pages.get(0) and not self._prebuild_scheduled:
+            # First frame of the timer page: build the other pages once it is on screen
+            self._prebuild_scheduled = True
+            obj.removeEventFilter(self)
+            profiler.mark("first_paint")
+            # The first zero timer after the frame runs once the queued events are handled
+            QTimer.singleShot(0, lambda: profiler.mark("interactive"))
+            QTimer.singleShot(0, self.prebuild_pages)
+        elif obj == self.sidebar:
+            if event.type() == QEvent.Type.Resize:
+                # Every width step of the animation, so the strip follows collapse and expand
+                self.update_hot_zone()
+            elif event.type() == QEvent.Type.Enter:
                 self.sidebar_hide_timer.stop() # Cancel pending hide
                 if self.sidebar.width() < 85:
                     self.animate_sidebar(85)
@@ -928,7 +1231,7 @@ class MainWindow(QMainWindow):
                 should_hide = False
                 
                 # Condition 1: Timer is running and Auto-Hide preference is On
-                if self.timer.is_running and hasattr(self, 'auto_hide_sidebar_toggle') and self.auto_hide_sidebar_toggle.isChecked():
+                if self.timer.is_running and self.auto_hide_sidebar:
                     should_hide = True
                 # Condition 2: Window is narrow (Responsive mode)
                 elif self.width() < 1200:
@@ -939,22 +1242,22 @@ class MainWindow(QMainWindow):
                     
         return super().eventFilter(obj, event)
 
-    def check_sidebar_hover(self):
-        # Polling for "Hot Zone" trigger
-        # Allow expanding if sidebar is collapsed, regardless of timer state
-        
-        # Check if sidebar is already expanded (or expanding)
-        if self.sidebar.width() > 50:
-            return # Already expanded, let Leave event handle hide
-            
-        cursor_pos = QCursor.pos()
-        local_pos = self.mapFromGlobal(cursor_pos)
-        
-        # Check if cursor is within window bounds and left 50px
-        if self.rect().contains(local_pos):
-            if local_pos.x() <= 50: # Wider trigger zone
-                self.sidebar_hide_timer.stop()
-                self.animate_sidebar(85)
+    def update_hot_zone(self):
+        zone = self.sidebar_hot_zone
+        # Only a collapsed sidebar needs the strip; an expanded one handles Enter/Leave itself
+        collapsed = self.sidebar.width() <= SIDEBAR_HOT_ZONE_WIDTH
+        if collapsed:
+            zone.setGeometry(0, 0, SIDEBAR_HOT_ZONE_WIDTH, self.centralWidget().height())
+            zone.raise_()
+        if collapsed == zone.isHidden():
+            zone.setVisible(collapsed)
+
+    def on_hot_zone_entered(self):
+        # Expands regardless of timer state; the sidebar's Leave event handles hiding again
+        if self.sidebar.width() > SIDEBAR_HOT_ZONE_WIDTH:
+            return
+        self.sidebar_hide_timer.stop()
+        self.animate_sidebar(85)
 
     def check_and_hide_sidebar(self):
         # Verify if cursor is still outside sidebar geometry
@@ -1010,40 +1313,85 @@ class MainWindow(QMainWindow):
     def start_focus_on_task(self, task_data):
         self.switch_page(0) # Switch to Timer page
         self.current_task = task_data
+        self.checkpoint.mark_dirty()
         self.mode_label.setText(f"正在专注：{task_data.get('content', '未知任务')}")
         if not self.timer.is_running:
             self.toggle_timer()
 
+    def offer_resume(self):
+        """Offer to resume a session left behind by a crash or restart."""
+        state = self.checkpoint.load()
+        if not state:
+            return
+        remaining, away = reconcile(state)
+        was_running = state.get("is_running", False)
+        task = state.get("task")
+        mode_names = {'work': "专注", 'break': "休息", 'long_break': "长休息"}
+        mode_name = mode_names.get(state.get("mode"), "专注")
+        task_text = f"\n任务：{task.get('content', '')}" if task else ""
+        
+        if was_running and remaining == 0:
+            message = f"上次的{mode_name}已在程序关闭期间结束（离开 {away // 60} 分钟）。{task_text}\n\n是否按已完成记录？"
+        else:
+            mins, secs = divmod(remaining, 60)
+            message = f"检测到上次未完成的{mode_name}，剩余 {mins:02d}:{secs:02d}（离开 {away // 60} 分钟）。{task_text}\n\n是否恢复？"
+        
+        reply = QMessageBox.question(self, "恢复会话", message,
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                                     QMessageBox.StandardButton.Yes)
+        if reply != QMessageBox.StandardButton.Yes:
+            self.checkpoint.clear()
+            return
+        
+        # Prefer the live record so pomodoro counts land on the board's task
+        self.current_task = (self.data_manager.get_task(task.get('id')) or task) if task else None
+        self.timer.restore_state(state.get("mode", 'work'), state.get("plan_index", 0),
+                                 remaining, state.get("pomodoros_completed", 0))
+        if remaining == 0:
+            if was_running:
+                # Finishes normally, so stats and the task's pomodoro count are recorded
+                self.timer.skip()
+            else:
+                self.timer.switch_mode()
+        else:
+            if task and self.timer.current_mode == 'work':
+                self.mode_label.setText(f"正在专注：{task.get('content', '未知任务')}")
+            if was_running:
+                self.toggle_timer()
+
     def stop_timer(self):
         self.timer.reset()
-        self.start_btn.setIcon(QIcon(get_resource_path("resources/icon_play.svg"))) # Reset start button icon
-        if self.auto_hide_sidebar_toggle.isChecked():
+        self.start_btn.setIcon(icons.icon("icon_play.svg")) # Reset start button icon
+        if self.auto_hide_sidebar:
             self.animate_sidebar(85)
 
     def toggle_timer(self):
         if self.timer.is_running:
             self.timer.pause()
-            self.start_btn.setIcon(QIcon(get_resource_path("resources/icon_play.svg")))
+            self.start_btn.setIcon(icons.icon("icon_play.svg"))
         else:
             self.timer.start()
-            self.start_btn.setIcon(QIcon(get_resource_path("resources/icon_pause.svg")))
-            if self.auto_hide_sidebar_toggle.isChecked():
+            self.start_btn.setIcon(icons.icon("icon_pause.svg"))
+            if self.auto_hide_sidebar:
                 self.animate_sidebar(0)
 
+    def current_total_seconds(self):
+        return self.timer.session_seconds
+
     def update_timer_display(self, seconds):
+        # Called by the tick dispatcher only when visible and the value changed
         mins, secs = divmod(seconds, 60)
         self.timer_label.setText(f"{mins:02d}:{secs:02d}")
         
         # Update progress line
-        if self.timer.current_mode == 'work':
-            total_seconds = self.timer.work_seconds
-        elif self.timer.current_mode == 'long_break':
-            total_seconds = self.timer.long_break_seconds
-        else:
-            total_seconds = self.timer.break_seconds
-            
-        self.progress_line.setMaximum(total_seconds)
+        total_seconds = self.current_total_seconds()
+        if self.progress_line.maximum() != total_seconds:
+            self.progress_line.setMaximum(total_seconds)
         self.progress_line.setValue(total_seconds - seconds)
+        
+        # The ring shows the time left; it only repaints the part of the arc that moved
+        self.progress_bar.set_max_value(total_seconds)
+        self.progress_bar.animate_to(seconds)
 
     def update_mode_display(self, mode):
         if mode == 'work':
@@ -1055,23 +1403,15 @@ class MainWindow(QMainWindow):
             self.mode_label.setText("正在长休息")
             self.work_info.setProperty("class", "InfoLabel")
             self.break_info.setProperty("class", "InfoLabelActive")
-            # Update break info text for long break
-            mins = self.timer.long_break_seconds // 60
-            self.break_info.setText(f"长休 {mins:02d}:00")
             self.long_break_overlay.show()
             self.long_break_overlay.raise_()
         else: # break
             self.mode_label.setText("正在休息")
             self.work_info.setProperty("class", "InfoLabel")
             self.break_info.setProperty("class", "InfoLabelActive")
-            # Update break info text for normal break
-            mins = self.timer.break_seconds // 60
-            self.break_info.setText(f"休息 {mins:02d}:00")
             self.long_break_overlay.hide()
             
-        # Ensure work info text is correct
-        work_mins = self.timer.work_seconds // 60
-        self.work_info.setText(f"工作 {work_mins:02d}:00")
+        self.update_info_labels()
         
         # Refresh style to apply new property classes
         self.work_info.style().unpolish(self.work_info)
@@ -1079,41 +1419,44 @@ class MainWindow(QMainWindow):
         self.break_info.style().unpolish(self.break_info)
         self.break_info.style().polish(self.break_info)
 
+    def update_info_labels(self):
+        # Show the current or upcoming work block and break from the plan
+        plan = self.timer.plan
+        index = self.timer.plan_index
+        work_index = plan.find('work', index)
+        break_candidates = [i for i in (plan.find('break', index), plan.find('long_break', index)) if i is not None]
+        break_index = min(break_candidates, key=lambda i: (i - index) % len(plan)) if break_candidates else None
+        
+        if work_index is not None:
+            mins, secs = divmod(plan.step(work_index).seconds, 60)
+            self.work_info.setText(f"工作 {mins:02d}:{secs:02d}")
+        if break_index is not None:
+            step = plan.step(break_index)
+            mins, secs = divmod(step.seconds, 60)
+            prefix = "长休" if step.mode == 'long_break' else "休息"
+            self.break_info.setText(f"{prefix} {mins:02d}:{secs:02d}")
+
     def handle_timer_finished(self):
-        self.start_btn.setIcon(QIcon(get_resource_path("resources/icon_play.svg")))
-        if self.auto_hide_sidebar_toggle.isChecked():
+        self.start_btn.setIcon(icons.icon("icon_play.svg"))
+        if self.auto_hide_sidebar:
             self.animate_sidebar(85)
             
         if self.timer.is_working:
             if hasattr(self, 'current_task') and self.current_task:
                 self.update_task_pomo_count(self.current_task['id'])
                 
-            self.data_manager.record_session(self.work_mins_spin.value())
-            self.refresh_stats()
+            # The stats page follows DataManager.stats_changed
+            self.data_manager.record_session(self.timer.session_seconds // 60)
+            self.update_plan_forecast()
 
     def update_task_pomo_count(self, task_id):
-        found = False
-        for key, col in self.kanban_cols.items():
-            for i in range(col.count()):
-                item = col.item(i)
-                data = item.data(Qt.ItemDataRole.UserRole)
-                if data and data.get('id') == task_id:
-                    data['pomodoros'] = data.get('pomodoros', 0) + 1
-                    item.setData(Qt.ItemDataRole.UserRole, data)
-                    # Refresh widget display
-                    widget = col.itemWidget(item)
-                    if widget:
-                        widget.pomo_label.setText(f"🍅 {data['pomodoros']}")
-                        # widget.task_data is a reference, but we updated 'data' dict.
-                        # Since widget.task_data = task_data in constructor, they might be same object if we passed it.
-                        # But QListWidgetItem copies data? No, python objects are refs.
-                        # However, let's be safe and update widget.task_data
-                        widget.task_data = data 
-                    found = True
-                    break
-            if found: break
-        if found:
-            self.save_kanban_state()
+        location = self.data_manager.increment_task_pomodoros(task_id)
+        if location:
+            category, row = location
+            # The card is painted from the same record, so only that row repaints
+            # (an unbuilt board reads the new count when it is built)
+            if self.is_page_built(1) and category in self.kanban_cols:
+                self.kanban_cols[category].task_model.task_changed(row)
 
     def add_kanban_task(self, key, input_field):
         text = input_field.text().strip()
@@ -1134,142 +1477,84 @@ class MainWindow(QMainWindow):
             
             self.kanban_cols[key].add_task_item(task_data)
             input_field.clear()
-            self.save_kanban_state()
-
-    def save_kanban_state(self):
-        tasks_dict = {}
-        for key, col in self.kanban_cols.items():
-            tasks = []
-            for i in range(col.count()):
-                item = col.item(i)
-                task_data = item.data(Qt.ItemDataRole.UserRole)
-                if task_data:
-                    tasks.append(task_data)
-            tasks_dict[key] = tasks
-        self.data_manager.update_tasks(tasks_dict)
+            self.refresh_task_search()
+
+    def refresh_task_search(self):
+        docs = [(task.get("id"), "", task.get("content", ""))
+                for col in self.kanban_cols.values() for task in col.tasks()]
+        self.task_searcher.set_docs(docs)
+
+    def apply_task_matches(self, query, task_ids):
+        matches = set(task_ids) if task_ids is not None else None
+        for col in self.kanban_cols.values():
+            col.set_filter(matches)
 
     # Notes Logic
-    def refresh_notes_table(self, filter_text=""):
-        notes = self.data_manager.data.get("notes", [])
-        self.notes_table.setRowCount(0)
-        
-        for i, note in enumerate(notes):
-            # Filtering logic
-            if filter_text and filter_text.lower() not in note['title'].lower() and filter_text.lower() not in note['content'].lower():
-                continue
-                
-            self.notes_table.insertRow(self.notes_table.rowCount())
-            row = self.notes_table.rowCount() - 1
-            
-            # Title item
-            title_item = QTableWidgetItem(note['title'])
-            title_item.setData(Qt.ItemDataRole.UserRole, i) # Store original index
-            self.notes_table.setItem(row, 0, title_item)
-            
-            # Summary item
-            content_summary = note['content'][:60].replace("\n", " ")
-            if len(note['content']) > 60: content_summary += "..."
-            self.notes_table.setItem(row, 1, QTableWidgetItem(content_summary))
+    def refresh_notes_table(self, filter_text=None):
+        self.ensure_page(2)
+        self.notes_model.reload()
+        # Rebuilds the search text once and reapplies the current query
+        self.note_searcher.set_notes(self.notes_model.notes, self.data_manager.note_body)
+        if filter_text is not None:
+            self.note_searcher.search_now(filter_text)
+
+    def apply_note_matches(self, query, matches):
+        self.notes_proxy.set_matches(matches)
+
+    def note_id_at(self, proxy_index):
+        """Id of the note shown in a row of the (filtered) table."""
+        return self.notes_proxy.data(proxy_index, Qt.ItemDataRole.UserRole)
 
     def show_note_context_menu(self, pos):
-        item = self.notes_table.itemAt(pos)
-        if item:
-            row = item.row()
+        index = self.notes_table.indexAt(pos)
+        if index.isValid():
             # Select the row first
-            self.notes_table.selectRow(row)
+            self.notes_table.selectRow(index.row())
             
             # Create menu
             menu = QMenu(self.notes_table)
             
             delete_action = QAction("删除笔记", self)
-            delete_action.setIcon(QIcon("src/resources/icon_delete_new.svg"))
-            # Use closure to capture row index, but delete_note expects logic index
-            # The row index in table might differ from data list if filtered?
-            # Yes, filter logic just skips insertion, so table rows match displayed items.
-            # But `delete_note` uses `self.data_manager.data.get("notes", []).pop(idx)`
-            # This implies `idx` is index in the SOURCE list.
-            
-            # Wait, refresh_notes_table:
-            # title_item.setData(Qt.ItemDataRole.UserRole, i) # Store original index
-            
-            # So we must retrieve the original index from the item!
-            title_item = self.notes_table.item(row, 0)
-            original_index = title_item.data(Qt.ItemDataRole.UserRole)
-            
-            delete_action.triggered.connect(lambda: self.delete_note(original_index))
+            delete_action.setIcon(icons.icon("icon_delete_new.svg"))
+            # Rows may be filtered or reordered, so the note is addressed by id
+            note_id = self.note_id_at(index)
+            delete_action.triggered.connect(lambda: self.delete_note(note_id))
             
             menu.addAction(delete_action)
             menu.exec(self.notes_table.mapToGlobal(pos))
 
-    def show_note_dialog(self, original_index=None):
+    def show_note_dialog(self, note_id=None):
         # Handle signal sending boolean (False) when clicked
-        if isinstance(original_index, bool):
-            original_index = None
-            
-        notes = self.data_manager.data.get("notes", [])
-        note_data = notes[original_index] if original_index is not None else None
-        
-        dialog = QDialog(self)
-        dialog.setWindowTitle("笔记编辑" if note_data else "新建笔记")
-        dialog.setMinimumSize(600, 500)
-        layout = QVBoxLayout(dialog)
-        layout.setSpacing(15)
-        
-        title_edit = QLineEdit()
-        title_edit.setPlaceholderText("💡 这里写标题...")
-        title_edit.setStyleSheet("font-size: 18px; font-weight: bold; padding: 10px;")
-        
-        content_edit = QTextEdit()
-        content_edit.setPlaceholderText("✍️ 记录此刻的想法、灵感或复盘...")
-        content_edit.setStyleSheet("font-size: 15px; line-height: 1.5;")
-        
-        if note_data:
-            title_edit.setText(note_data['title'])
-            content_edit.setPlainText(note_data['content'])
-            
-        btn_layout = QHBoxLayout()
-        cancel_btn = QPushButton("取消")
-        save_btn = QPushButton("保存笔记")
-        save_btn.setObjectName("PrimaryButton")
-        save_btn.setMinimumWidth(120)
-        
-        btn_layout.addStretch()
-        btn_layout.addWidget(cancel_btn)
-        btn_layout.addWidget(save_btn)
-        
-        def save():
-            new_note = {
-                "title": title_edit.text() or "未命名笔记",
-                "content": content_edit.toPlainText(),
-                "date": QDate.currentDate().toString(Qt.DateFormat.ISODate)
-            }
-            if original_index is not None:
-                notes[original_index] = new_note
-            else:
-                notes.insert(0, new_note)
-            
-            self.data_manager.update_notes(notes)
-            self.refresh_notes_table()
-            dialog.accept()
-            
-        save_btn.clicked.connect(save)
-        cancel_btn.clicked.connect(dialog.reject)
-        
-        layout.addWidget(QLabel("标题"))
-        layout.addWidget(title_edit)
-        layout.addWidget(QLabel("正文"))
-        layout.addWidget(content_edit)
-        layout.addLayout(btn_layout)
+        if isinstance(note_id, bool):
+            note_id = None
+        self.open_note_editor(self.data_manager.get_note(note_id) if note_id else None)
+
+    def open_note_editor(self, note_data=None, draft=None):
+        from ui.note_editor import NoteEditorDialog
+        dialog = NoteEditorDialog(self.data_manager, note_data, draft=draft, parent=self)
         dialog.exec()
+        if dialog.saved_note is not None:
+            self.refresh_notes_table()
+        self.update_draft_button()
+
+    def update_draft_button(self):
+        count = len(self.data_manager.note_drafts.pending())
+        self.recover_draft_btn.setText(f"恢复草稿 ({count})")
+        self.recover_draft_btn.setVisible(count > 0)
+
+    def recover_note_draft(self):
+        """Reopen the oldest draft left behind by a crash."""
+        drafts = self.data_manager.note_drafts.pending()
+        if not drafts:
+            self.update_draft_button()
+            return
+        draft = drafts[0]
+        self.open_note_editor(self.data_manager.get_note(draft.get("note_id")), draft=draft)
 
-    def edit_note(self, item):
-        # Get the title item of the row to retrieve the original index
-        row = item.row()
-        title_item = self.notes_table.item(row, 0)
-        original_index = title_item.data(Qt.ItemDataRole.UserRole)
-        self.show_note_dialog(original_index)
+    def edit_note(self, index):
+        self.show_note_dialog(self.note_id_at(index))
 
-    def delete_note(self, idx):
+    def delete_note(self, note_id):
         # Confirmation Dialog
         reply = QMessageBox.question(self, '确认删除', 
                                      '您确定要删除这条笔记吗？此操作无法撤销。',
@@ -1277,57 +1562,87 @@ class MainWindow(QMainWindow):
                                      QMessageBox.StandardButton.No)
                                      
         if reply == QMessageBox.StandardButton.Yes:
-            notes = self.data_manager.data.get("notes", [])
-            if 0 <= idx < len(notes):
-                notes.pop(idx)
-                self.data_manager.update_notes(notes)
+            if self.data_manager.delete_note(note_id) is not None:
                 self.refresh_notes_table()
 
     def filter_notes(self):
-        self.refresh_notes_table(self.note_search.text())
+        self.note_searcher.search(self.note_search.text())
 
     # Stats Logic
+    def on_stats_changed(self, version):
+        # Hidden pages catch up when shown (switch_page calls refresh_stats)
+        if self.content_stack.currentIndex() == 3:
+            self.refresh_stats()
+
     def refresh_stats(self):
+        self.ensure_page(3)
+        # Nothing to do unless the stats or the current day changed since the last render
+        today = QDate.currentDate().toString(Qt.DateFormat.ISODate)
+        render_key = (self.data_manager.stats_version, today)
+        if render_key == self._stats_rendered:
+            return
+        self._stats_rendered = render_key
+        self.stats_renders += 1
+        
         stats = self.data_manager.data.get("stats", {})
         
         # Summary
-        self.stat_pomos.val_label.setText(str(stats.get("total_pomodoros", 0)))
+        set_text_if_changed(self.stat_pomos.val_label, str(stats.get("total_pomodoros", 0)))
         
         total_mins = stats.get("total_minutes", 0)
         if total_mins < 60:
             time_str = f"{total_mins} 分钟"
         else:
             time_str = f"{total_mins/60:.1f} 小时"
-        self.stat_time.val_label.setText(time_str)
+        set_text_if_changed(self.stat_time.val_label, time_str)
         
-        self.stat_days.val_label.setText(str(stats.get("total_days", 0)))
+        set_text_if_changed(self.stat_days.val_label, str(stats.get("total_days", 0)))
         
         # Interruptions
         interrupts = self.data_manager.data.get("interruptions", [])
-        self.stat_interrupts.val_label.setText(str(len(interrupts)))
+        set_text_if_changed(self.stat_interrupts.val_label, str(len(interrupts)))
         
         # Today's detail
-        today = QDate.currentDate().toString(Qt.DateFormat.ISODate)
         history = stats.get("history", {})
         today_data = history.get(today, {"count": 0, "minutes": 0})
+        today_interrupts = self.data_manager.interruptions_on(today)
         
-        # Count today's interruptions
-        today_interrupts = sum(1 for i in interrupts if i['timestamp'].startswith(today))
-        
-        self.today_stat_label.setText(f"🔥 今日专注：{today_data['count']} 个番茄 ({today_data['minutes']} 分钟) | ⚡ 打断：{today_interrupts} 次")
+        set_text_if_changed(self.today_stat_label, f"🔥 今日专注：{today_data['count']} 个番茄 ({today_data['minutes']} 分钟) | ⚡ 打断：{today_interrupts} 次")
         
-        # Update history list
-        self.history_list.clear()
-        sorted_dates = sorted(history.keys(), reverse=True)[:7] # Show last 7 days
-        for date_str in sorted_dates:
+        # Update history list: last 7 days
+        rows = []
+        for date_str in self.data_manager.recent_history_dates(7):
             day_data = history[date_str]
-            item_text = f"📅 {date_str}   |   🍅 {day_data['count']} 个番茄   |   ⏳ {day_data['minutes']} 分钟"
-            self.history_list.addItem(item_text)
+            rows.append((date_str, f"📅 {date_str}   |   🍅 {day_data['count']} 个番茄   |   ⏳ {day_data['minutes']} 分钟"))
+        self.update_history_rows(rows)
+
+    def update_history_rows(self, rows):
+        """
+        Bring history_list in line with `rows` ((date, text), newest first),
+        touching only items whose day was added, dropped or changed.
+        """
+        row = 0
+        for date_str, text in rows:
+            # Drop items for days that are no longer listed
+            while row < self.history_list.count() and self.history_list.item(row).data(Qt.ItemDataRole.UserRole) > date_str:
+                self.history_list.takeItem(row)
+            item = self.history_list.item(row) if row < self.history_list.count() else None
+            if item is not None and item.data(Qt.ItemDataRole.UserRole) == date_str:
+                if item.text() != text:
+                    item.setText(text)
+            else:
+                item = QListWidgetItem(text)
+                item.setData(Qt.ItemDataRole.UserRole, date_str)
+                self.history_list.insertItem(row, item)
+            row += 1
+        while self.history_list.count() > len(rows):
+            self.history_list.takeItem(self.history_list.count() - 1)
 
     def export_stats_pdf(self):
         filename, _ = QFileDialog.getSaveFileName(self, "导出专注报告", "FocusReport.pdf", "PDF Files (*.pdf)")
         if not filename:
             return
+        from PyQt6.QtGui import QTextDocument, QPageSize, QPdfWriter
             
         stats = self.data_manager.data.get("stats", {})
         interrupts = self.data_manager.data.get("interruptions", [])
@@ -1420,18 +1735,39 @@ class MainWindow(QMainWindow):
     def save_settings(self):
         w = self.work_mins_spin.value()
         b = self.break_mins_spin.value()
+        lb = self.long_break_mins_spin.value()
+        schedule = self.schedule_edit.text().strip()
+        if schedule:
+            try:
+                compile_schedule(schedule)
+            except ValueError as e:
+                QMessageBox.warning(self, "计划格式错误", str(e))
+                return
         sound_enabled = self.sound_toggle.isChecked()
         auto_hide = self.auto_hide_sidebar_toggle.isChecked()
+        white_noise = self.white_noise_toggle.isChecked()
+        noise_type = self.noise_type_combo.currentData()
+        smooth_progress = self.smooth_progress_toggle.isChecked()
         
         settings = {
             "work_mins": w,
             "break_mins": b,
+            "long_break_mins": lb,
+            "schedule": schedule,
+            "daily_goal": self.daily_goal_spin.value(),
             "sound_enabled": sound_enabled,
-            "auto_hide_sidebar": auto_hide
+            "auto_hide_sidebar": auto_hide,
+            "white_noise_enabled": white_noise,
+            "white_noise_type": noise_type,
+            "smooth_progress": smooth_progress
         }
         self.data_manager.update_settings(settings)
-        self.timer.set_durations(w, b)
+        self.auto_hide_sidebar = auto_hide
+        self.progress_bar.set_smooth(smooth_progress)
+        self.apply_schedule()
         self.timer.set_sound_enabled(sound_enabled)
+        self.noise_player.set_kind(noise_type)
+        self.noise_player.set_enabled(white_noise)
 
     def on_theme_toggled(self, checked):
         theme = "dark" if checked else "light"
@@ -1439,48 +1775,13 @@ class MainWindow(QMainWindow):
         self.data_manager.update_settings({"theme": theme})
 
     def apply_theme(self, theme):
-        app = QApplication.instance()
-        if theme == "dark":
-            style_path = get_resource_path(os.path.join("styles", "style_dark.qss"))
-            if os.path.exists(style_path):
-                with open(style_path, "r", encoding="utf-8") as f:
-                    app.setStyleSheet(f.read())
-            if hasattr(self, "timer_label"):
-                self.timer_label.setStyleSheet("font-size: 96px; font-weight: bold; color: #E6E6E6; font-family: 'Segoe UI', sans-serif; background: transparent;")
-            if hasattr(self, "progress_bar"):
-                self.progress_bar.set_color("#E6E6E6")
-                self.progress_bar.set_bg_color("#2A2A2A")
-            if hasattr(self, "progress_line"):
-                self.progress_line.setStyleSheet("""
-                    QProgressBar {
-                        background-color: #1E1E1E;
-                        border: none;
-                        border-radius: 2px;
-                    }
-                    QProgressBar::chunk {
-                        background-color: #CFCFCF;
-                        border-radius: 2px;
-                    }
-                """)
-        else:
-            style_path = get_resource_path(os.path.join("styles", "style.qss"))
-            if os.path.exists(style_path):
-                with open(style_path, "r", encoding="utf-8") as f:
-                    app.setStyleSheet(f.read())
-            if hasattr(self, "timer_label"):
-                self.timer_label.setStyleSheet("font-size: 96px; font-weight: bold; color: #1A1A1A; font-family: 'Segoe UI', sans-serif; background: transparent;")
-            if hasattr(self, "progress_bar"):
-                self.progress_bar.set_color("#000000")
-                self.progress_bar.set_bg_color("#F0F0F0")
-            if hasattr(self, "progress_line"):
-                self.progress_line.setStyleSheet("""
-                    QProgressBar {
-                        background-color: #F0F0F0;
-                        border: none;
-                        border-radius: 2px;
-                    }
-                    QProgressBar::chunk {
-                        background-color: #000000;
-                        border-radius: 2px;
-                    }
-                """)
+        # One app-level stylesheet swap restyles every widget; only custom-painted ones need telling
+        theme_engine.apply(QApplication.instance(), theme)
+        # Dark grey SVG icons are tinted to stay visible on dark backgrounds
+        tint_icons(self)
+        if hasattr(self, "progress_bar"):
+            self.progress_bar.set_color(theme_engine.color("ring"))
+            self.progress_bar.set_bg_color(theme_engine.color("ring_track"))
+            for btn in (self.stop_btn, self.start_btn, self.abandon_btn):
+                btn.set_colors(theme_engine.color("control"), theme_engine.color("control_hover"),
+                               theme_engine.color("control_pressed"))
@@ -0,0 +1,131 @@
+import uuid
+from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
+                             QPlainTextEdit, QPushButton, QMessageBox)
+from PyQt6.QtCore import Qt, QDate, QDateTime, QTimer
+
+# Quiet period after the last keystroke before the draft is written
+AUTOSAVE_DELAY_MS = 800
+
+
+class NoteEditorDialog(QDialog):
+    """
+    Note editor that autosaves a draft while the user types.
+
+    Drafts go to DataManager.note_drafts (a small file per note), so typing never
+    rewrites the main data file. Saving commits the note with a single
+    DataManager.save_note call and drops the draft. Cancelling with unsaved
+    changes asks whether to discard them; keeping them leaves the draft for the
+    notes page's "恢复草稿". A draft left behind by a crash is restored the next
+    time the note is opened, or from the notes page for notes that were never
+    saved.
+    """
+
+    def __init__(self, data_manager, note=None, draft=None, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.drafts = data_manager.note_drafts
+        self.note = note
+        self.note_id = note["id"] if note else (draft or {}).get("note_id") or uuid.uuid4().hex
+        self.saved_note = None
+        # Text the note had when opened, to tell whether cancelling loses anything
+        self.original_text = ("", "")
+
+        self.setWindowTitle("笔记编辑" if note else "新建笔记")
+        self.setMinimumSize(600, 500)
+        layout = QVBoxLayout(self)
+        layout.setSpacing(15)
+
+        self.title_edit = QLineEdit()
+        self.title_edit.setPlaceholderText("💡 这里写标题...")
+        self.title_edit.setObjectName("NoteTitleEdit")
+
+        # Notes are plain text; QPlainTextEdit lays out lazily per block and stays
+        # responsive on long documents where QTextEdit does not
+        self.content_edit = QPlainTextEdit()
+        self.content_edit.setPlaceholderText("✍️ 记录此刻的想法、灵感或复盘...")
+        self.content_edit.setObjectName("NoteContentEdit")
+
+        self.draft_label = QLabel()
+        self.draft_label.setProperty("role", "draft_status")
+
+        if draft is None:
+            draft = self.drafts.load(self.note_id)
+        if draft is not None:
+            self.title_edit.setText(draft.get("title", ""))
+            self.content_edit.setPlainText(draft.get("content", ""))
+            saved_at = QDateTime.fromSecsSinceEpoch(int(draft.get("saved_at", 0)))
+            self.draft_label.setText(f"已恢复 {saved_at.toString('MM-dd HH:mm')} 的草稿")
+        elif note:
+            self.title_edit.setText(note.get("title", ""))
+            # The body is read from the note store only when the note is opened
+            self.content_edit.setPlainText(data_manager.note_body(note))
+        if note:
+            if draft is None:
+                self.original_text = (self.title_edit.text(), self.content_edit.toPlainText())
+            else:
+                self.original_text = (note.get("title", ""), data_manager.note_body(note))
+
+        btn_layout = QHBoxLayout()
+        cancel_btn = QPushButton("取消")
+        save_btn = QPushButton("保存笔记")
+        save_btn.setObjectName("PrimaryButton")
+        save_btn.setMinimumWidth(120)
+
+        btn_layout.addWidget(self.draft_label)
+        btn_layout.addStretch()
+        btn_layout.addWidget(cancel_btn)
+        btn_layout.addWidget(save_btn)
+
+        save_btn.clicked.connect(self.save)
+        cancel_btn.clicked.connect(self.reject)
+
+        layout.addWidget(QLabel("标题"))
+        layout.addWidget(self.title_edit)
+        layout.addWidget(QLabel("正文"))
+        layout.addWidget(self.content_edit)
+        layout.addLayout(btn_layout)
+
+        # Text is only pulled out of the editor once typing pauses
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(AUTOSAVE_DELAY_MS)
+        self.autosave_timer.timeout.connect(self.write_draft)
+        self.title_edit.textEdited.connect(self.autosave_timer.start)
+        self.content_edit.textChanged.connect(self.autosave_timer.start)
+
+    def write_draft(self):
+        self.autosave_timer.stop()
+        try:
+            self.drafts.save(self.note_id, self.title_edit.text(), self.content_edit.toPlainText())
+            self.draft_label.setText(f"草稿已自动保存 {QDateTime.currentDateTime().toString('HH:mm:ss')}")
+        except OSError as e:
+            print(f"Failed to save note draft: {e}")
+
+    def save(self):
+        self.autosave_timer.stop()
+        new_note = {
+            "id": self.note_id,
+            "title": self.title_edit.text() or "未命名笔记",
+            "content": self.content_edit.toPlainText(),
+            "date": QDate.currentDate().toString(Qt.DateFormat.ISODate)
+        }
+        self.saved_note = self.data_manager.save_note(new_note)
+        self.drafts.discard(self.note_id)
+        self.accept()
+
+    def has_unsaved_changes(self):
+        return (self.title_edit.text(), self.content_edit.toPlainText()) != self.original_text
+
+    def reject(self):
+        self.autosave_timer.stop()
+        if self.has_unsaved_changes():
+            reply = QMessageBox.question(self, "放弃修改",
+                                         "笔记有未保存的修改，确定放弃吗？\n选择“否”将保留草稿，稍后可在笔记页恢复。",
+                                         QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                                         QMessageBox.StandardButton.No)
+            if reply != QMessageBox.StandardButton.Yes:
+                self.write_draft()
+                super().reject()
+                return
+        self.drafts.discard(self.note_id)
+        super().reject()
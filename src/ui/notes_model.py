@@ -0,0 +1,85 @@
+from PyQt6.QtCore import Qt, QAbstractTableModel, QSortFilterProxyModel, QModelIndex
+from logic.note_store import note_summary
+
+class NotesModel(QAbstractTableModel):
+    """Title/summary table over DataManager's notes, newest first (no per-cell items)."""
+    HEADERS = ("标题", "摘要")
+
+    def __init__(self, data_manager, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+
+    @property
+    def note_ids(self):
+        return self.data_manager.note_ids()
+
+    @property
+    def notes(self):
+        return self.data_manager.notes()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.note_ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        note_id = self.note_ids[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            note = self.data_manager.get_note(note_id)
+            if index.column() == 0:
+                return note.get("title", "")
+            return self.summary(note)
+        if role == Qt.ItemDataRole.UserRole:
+            return note_id
+        return None
+
+    @staticmethod
+    def summary(note):
+        # Stored notes carry a precomputed summary, so the body is never loaded here
+        if "summary" in note:
+            return note["summary"]
+        return note_summary(note.get("content", ""))
+
+    def reload(self):
+        self.beginResetModel()
+        self.endResetModel()
+
+
+class NotesFilterProxy(QSortFilterProxyModel):
+    """Shows only the rows of the current search result, in rank order."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Keyed by note id, so it stays valid when notes are added, deleted or reloaded
+        self._rank = None # note id -> rank; None shows every row in list order
+
+    def set_matches(self, note_ids):
+        if note_ids is None:
+            if self._rank is None:
+                return
+            self._rank = None
+            self.invalidateFilter()
+            self.sort(-1) # Back to source order
+            return
+        self._rank = {note_id: rank for rank, note_id in enumerate(note_ids)}
+        self.invalidateFilter()
+        self.sort(0)
+
+    def _note_id(self, source_row):
+        return self.sourceModel().note_ids[source_row]
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._rank is None or self._note_id(source_row) in self._rank
+
+    def lessThan(self, left, right):
+        if self._rank is None:
+            return left.row() < right.row()
+        return self._rank.get(self._note_id(left.row()), 0) < self._rank.get(self._note_id(right.row()), 0)
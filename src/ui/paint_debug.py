@@ -0,0 +1,307 @@
+import importlib
+import logging
+import os
+import time
+from functools import wraps
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import Qt, QObject, QEvent, QPoint, QRect, QTimer
+from PyQt6.QtGui import QPainter, QColor, QFont, QRegion
+
+# Comma-separated modes: "log" (summaries in the log) and/or "overlay" (flash
+# repainted regions in the windows); "1" means "log"
+ENV_VAR = "FANQIE_PAINT_DEBUG"
+MODES = ("log", "overlay")
+# How long a repainted region stays highlighted, and the frame rate of its fade
+FLASH_MS = 300
+FLASH_FPS = 30
+# Log mode: interval between summaries (only written when something painted)
+LOG_INTERVAL_MS = 5000
+# Widget classes listed in a summary / the overlay's corner
+REPORT_LIMIT = 15
+OVERLAY_LIMIT = 6
+
+# Custom painting timed per call (module, class, method); Qt's own widgets are only counted
+TIMED_PAINTS = (
+    ("ui.widgets", "SmoothButton", "paintEvent"),
+    ("ui.widgets", "CircularProgressBar", "paintEvent"),
+    ("ui.widgets", "KanbanDelegate", "paint"),
+    ("ui.heatmap", "YearHeatmap", "paintEvent"),
+    ("ui.trend_chart", "TrendChart", "paintEvent"),
+)
+
+
+def paint_key(widget):
+    """Name paints are grouped under: the class, or the view's class for a scroll area viewport."""
+    if widget.objectName() == "qt_scrollarea_viewport" and widget.parent() is not None:
+        return f"{type(widget.parent()).__name__}.viewport"
+    return type(widget).__name__
+
+
+class PaintStats:
+    __slots__ = ("paints", "pixels", "calls", "total", "longest")
+
+    def __init__(self):
+        self.paints = 0   # Paint events delivered
+        self.pixels = 0   # Area of their bounding rects
+        self.calls = 0    # Timed paint calls (custom-painted classes only)
+        self.total = 0.0  # Seconds
+        self.longest = 0.0
+
+
+class PaintProfiler(QObject):
+    """
+    Counts repaints per widget class and times custom painting.
+
+    While started, an application-wide event filter sees every Paint event and
+    adds it (and its area) to the widget's class; the paint methods in
+    TIMED_PAINTS are wrapped to time each call. In log mode a summary is
+    logged every LOG_INTERVAL_MS; in overlay mode watched windows flash the
+    regions being repainted and list the busiest classes in a corner. Nothing
+    is installed until start(), and stop() removes it all again, so tests can
+    profile a block of offscreen painting.
+    """
+
+    def __init__(self, log=False, overlay=False, clock=time.perf_counter):
+        super().__init__()
+        self.log = log
+        self.overlay = overlay
+        self.clock = clock
+        self.stats = {} # paint key -> PaintStats
+        self.active = False
+        self._originals = []  # (class, method name, original function)
+        self._overlays = {}   # window -> PaintFlashOverlay
+        self._logged_paints = 0
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_INTERVAL_MS)
+        self._log_timer.timeout.connect(self.log_summary)
+
+    @classmethod
+    def from_environment(cls, environ=os.environ):
+        """The profiler the environment asks for, or None when paint debugging is off."""
+        value = environ.get(ENV_VAR, "").strip().lower()
+        if not value or value == "0":
+            return None
+        modes = {"log"} if value in ("1", "true", "yes") else {m.strip() for m in value.split(",")}
+        unknown = modes.difference(MODES)
+        if unknown:
+            logging.warning(f"Unknown {ENV_VAR} modes ignored: {', '.join(sorted(unknown))}")
+        return cls(log="log" in modes, overlay="overlay" in modes)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    def start(self):
+        if self.active:
+            return
+        self.active = True
+        self._instrument()
+        QApplication.instance().installEventFilter(self)
+        if self.log:
+            # The app configures no logging; make the summaries visible
+            logging.basicConfig(level=logging.INFO)
+            self._log_timer.start()
+
+    def stop(self):
+        if not self.active:
+            return
+        self.active = False
+        QApplication.instance().removeEventFilter(self)
+        for cls, name, original in self._originals:
+            setattr(cls, name, original)
+        self._originals.clear()
+        self._log_timer.stop()
+        for overlay in self._overlays.values():
+            overlay.deleteLater()
+        self._overlays.clear()
+        if self.log:
+            self.log_summary()
+
+    def reset(self):
+        self.stats.clear()
+        self._logged_paints = 0
+
+    def watch(self, window):
+        """Flash this window's repaints (overlay mode only)."""
+        if self.overlay and window not in self._overlays:
+            self._overlays[window] = PaintFlashOverlay(self, window)
+            window.destroyed.connect(lambda *args, window=window: self._overlays.pop(window, None))
+
+    def _instrument(self):
+        for module_name, class_name, method_name in TIMED_PAINTS:
+            cls = getattr(importlib.import_module(module_name), class_name)
+            original = cls.__dict__[method_name]
+            self._originals.append((cls, method_name, original))
+            setattr(cls, method_name, self._timed(original))
+
+    def _timed(self, paint):
+        profiler = self
+
+        @wraps(paint)
+        def timed_paint(obj, *args):
+            start = profiler.clock()
+            try:
+                return paint(obj, *args)
+            finally:
+                elapsed = profiler.clock() - start
+                stats = profiler._stats(type(obj).__name__)
+                stats.calls += 1
+                stats.total += elapsed
+                stats.longest = max(stats.longest, elapsed)
+                # Delegates paint rows, not widgets, so the event filter never counts them
+                if not isinstance(obj, QWidget):
+                    stats.paints += 1
+        return timed_paint
+
+    def _stats(self, key):
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = PaintStats()
+        return stats
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and obj.isWidgetType():
+            self.record_paint(obj, event.region())
+        elif event.type() == QEvent.Type.UpdateRequest and obj in self._overlays:
+            # A window's repaint pass starts
+            self._overlays[obj].begin_pass()
+        return False
+
+    def record_paint(self, widget, region):
+        if isinstance(widget, PaintFlashOverlay):
+            return
+        overlay = self._overlays.get(widget.window())
+        if overlay is not None:
+            window_region = region.translated(widget.mapTo(overlay.parentWidget(), QPoint(0, 0)))
+            if window_region.subtracted(overlay.echo).isEmpty():
+                # Uncovered by the overlay's own drawing, not repainted by the app
+                return
+            overlay.flash(window_region)
+        rect = region.boundingRect()
+        stats = self._stats(paint_key(widget))
+        stats.paints += 1
+        stats.pixels += rect.width() * rect.height()
+
+    def paint_counts(self):
+        return {key: stats.paints for key, stats in self.stats.items()}
+
+    def report(self):
+        """Per class, busiest first: paints, area, and for timed classes total/average/longest ms."""
+        rows = []
+        for key, stats in sorted(self.stats.items(), key=lambda item: item[1].paints, reverse=True):
+            rows.append({
+                "widget": key,
+                "paints": stats.paints,
+                "pixels": stats.pixels,
+                "timed_calls": stats.calls,
+                "total_ms": round(stats.total * 1000, 3) if stats.calls else None,
+                "avg_ms": round(stats.total * 1000 / stats.calls, 3) if stats.calls else None,
+                "max_ms": round(stats.longest * 1000, 3) if stats.calls else None,
+            })
+        return rows
+
+    def log_summary(self):
+        total = sum(stats.paints for stats in self.stats.values())
+        if total == self._logged_paints:
+            return
+        self._logged_paints = total
+        lines = [f"Paints so far: {total}"]
+        for row in self.report()[:REPORT_LIMIT]:
+            line = f"  {row['widget']:32} {row['paints']:7} paints {row['pixels']:11} px"
+            if row["timed_calls"]:
+                line += f"  {row['avg_ms']:7.3f} ms avg {row['max_ms']:7.3f} ms max"
+            lines.append(line)
+        logging.info("\n".join(lines))
+
+
+class PaintFlashOverlay(QWidget):
+    """
+    Transparent layer over a window that highlights repainted regions.
+
+    Each region fades out over FLASH_MS; the fade timer only runs while
+    something is highlighted. Repainting the overlay repaints the widgets
+    below it too, so what it invalidates is collected until the window's next
+    repaint pass and, during that pass, paints inside it (the `echo`) are not
+    reported back.
+    """
+
+    def __init__(self, profiler, window):
+        super().__init__(window)
+        self.profiler = profiler
+        self.flashes = [] # (region in window coordinates, start)
+        self.echo = QRegion()
+        self._invalidated = QRegion()
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._fade_timer = QTimer(self)
+        self._fade_timer.setInterval(1000 // FLASH_FPS)
+        self._fade_timer.timeout.connect(self.fade)
+        self.setGeometry(window.rect())
+        window.installEventFilter(self)
+        self.show()
+        self.raise_()
+        # Appearing repaints the whole window once; that is not the app's doing
+        self._invalidated = QRegion(self.rect())
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Resize:
+            self.setGeometry(obj.rect())
+        return False
+
+    def begin_pass(self):
+        self.echo = self._invalidated
+        self._invalidated = QRegion()
+
+    def invalidate(self, region):
+        self._invalidated = self._invalidated.united(region)
+        self.update(region)
+
+    def flash(self, region):
+        self.flashes.append((region, self.profiler.clock()))
+        # Other overlays (e.g. the long break one) may have been raised since
+        self.raise_()
+        self.invalidate(region)
+        self.invalidate(QRegion(self.legend_rect()))
+        if not self._fade_timer.isActive():
+            self._fade_timer.start()
+
+    def fade(self):
+        now = self.profiler.clock()
+        live = []
+        for region, start in self.flashes:
+            if (now - start) * 1000 < FLASH_MS:
+                live.append((region, start))
+            # Expired ones are erased, live ones redrawn lighter
+            self.invalidate(region)
+        self.flashes = live
+        if not live:
+            self._fade_timer.stop()
+
+    def legend_rect(self):
+        return QRect(self.width() - 330, 8, 322, 22 + 16 * OVERLAY_LIMIT)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        now = self.profiler.clock()
+        for region, start in self.flashes:
+            strength = max(0.0, 1 - (now - start) * 1000 / FLASH_MS)
+            painter.setClipRegion(region.intersected(event.region()))
+            painter.fillRect(region.boundingRect(), QColor(255, 0, 80, int(90 * strength)))
+        painter.setClipping(False)
+
+        legend = self.legend_rect()
+        if not event.rect().intersects(legend):
+            return
+        painter.fillRect(legend, QColor(0, 0, 0, 170))
+        painter.setPen(QColor("#FFFFFF"))
+        painter.setFont(QFont("monospace", 8))
+        lines = ["paints  avg ms  widget"]
+        for row in self.profiler.report()[:OVERLAY_LIMIT]:
+            avg = f"{row['avg_ms']:6.2f}" if row["timed_calls"] else "     -"
+            lines.append(f"{row['paints']:6}  {avg}  {row['widget']}")
+        for i, line in enumerate(lines):
+            painter.drawText(legend.left() + 8, legend.top() + 15 + 16 * i, line)
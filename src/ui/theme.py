@@ -0,0 +1,265 @@
+import re
+import time
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtWidgets import QAbstractButton
+from ui import icons
+import sys, os
+
+TEMPLATE_PATH = os.path.join("styles", "theme.qss")
+TOKEN = re.compile(r"@([a-z][a-z0-9_]*)")
+
+# Palette tokens per theme. The stylesheet template refers to them as @token;
+# custom-painted widgets read them with ThemeEngine.color().
+PALETTES = {
+    "light": {
+        "window_bg": "#FFFFFF",
+        "surface": "#FFFFFF",
+        "surface_alt": "#F8F9FA",
+        "surface_hover": "#FAFAFA",
+        "text": "#1A1A1A",
+        "text_strong": "#333333",
+        "text_body": "#555555",
+        "text_secondary": "#666666",
+        "text_muted": "#999999",
+        "border": "#EEEEEE",
+        "border_soft": "#F0F0F0",
+        "border_input": "#E0E0E0",
+        "border_strong": "#CCCCCC",
+        "selection": "#F5F5F5",
+        "selection_border": "#000000",
+        "accent": "#000000",
+        "accent_hover": "#333333",
+        "accent_text": "#FFFFFF",
+        "check": "#000000",
+        "track": "#F0F0F0",
+        "button_bg": "#F5F5F5",
+        "button_hover": "#EEEEEE",
+        "button_pressed": "#DDDDDD",
+        "input_bg": "#F9F9F9",
+        "input_focus_bg": "#FFFFFF",
+        "input_focus_border": "#000000",
+        "input_selection": "#DDDDDD",
+        "sidebar_bg": "#F8F8F8",
+        "sidebar_border": "#EEEEEE",
+        "sidebar_hover": "#EEEEEE",
+        "sidebar_text": "#999999",
+        "sidebar_text_hover": "#333333",
+        "sidebar_text_active": "#000000",
+        "sidebar_marker": "#000000",
+        "header_btn": "#F8F9FA",
+        "header_btn_border": "#CCCCCC",
+        "header_btn_hover": "#E9ECEF",
+        "header_btn_border_hover": "#999999",
+        "header_btn_pressed": "#DEE2E6",
+        "header_btn_border_pressed": "#666666",
+        "timer_text": "#1A1A1A",
+        "ring": "#000000",
+        "ring_track": "#F0F0F0",
+        "control": "#000000",
+        "control_hover": "#333333",
+        "control_pressed": "#555555",
+        "control_text": "#FFFFFF",
+        "floating_border": "#E0E0E0",
+        "internal_bg": "#FFF3E0",
+        "internal_text": "#E65100",
+        "external_bg": "#FFEBEE",
+        "external_text": "#C62828",
+        "quadrant_q1": "#FFEBEE",
+        "quadrant_q2": "#E3F2FD",
+        "quadrant_q3": "#FFF3E0",
+        "quadrant_q4": "#F3E5F5",
+        "quadrant_input": "rgba(255, 255, 255, 0.7)",
+        # Kanban rows: pomodoro count and the focus/delete buttons under the mouse
+        "kanban_pomodoro": "#FF6B6B",
+        "kanban_focus_hover": "#E3F2FD",
+        "kanban_delete_hover": "#FFEBEE",
+        "tone_red": "#FFF0F0",
+        "tone_blue": "#F0F8FF",
+        "tone_grey": "#F5F5F5",
+        "tone_amber": "#FFF8E1",
+        "sponsor_bg": "#FFEBEE",
+        "sponsor_text": "#D32F2F",
+        "sponsor_border": "#FFCDD2",
+        "overlay_bg": "rgba(26, 35, 126, 0.95)",
+        "overlay_text": "#FFFFFF",
+        "overlay_subtext": "#E8EAF6",
+        # Stats heatmap, from no focus time (level 0) to the most (level 4)
+        "heatmap_level_0": "#EBEDF0",
+        "heatmap_level_1": "#FFD6D1",
+        "heatmap_level_2": "#FF9E8F",
+        "heatmap_level_3": "#F2614C",
+        "heatmap_level_4": "#C8321E",
+        "heatmap_text": "#999999",
+        # Stats trend chart
+        "trend_bar": "#FFB3A7",
+        "trend_line": "#C8321E",
+        "trend_grid": "#EEEEEE",
+        "trend_text": "#999999",
+        # Single-colour SVG icons are drawn dark; None keeps their own colours
+        "icon_tint": None,
+    },
+    "dark": {
+        "window_bg": "#121212",
+        "surface": "#161616",
+        "surface_alt": "#1A1A1A",
+        "surface_hover": "#1C1C1C",
+        "text": "#E6E6E6",
+        "text_strong": "#E0E0E0",
+        "text_body": "#BDBDBD",
+        "text_secondary": "#A7A7A7",
+        "text_muted": "#8E8E8E",
+        "border": "#2A2A2A",
+        "border_soft": "#262626",
+        "border_input": "#333333",
+        "border_strong": "#3A3A3A",
+        "selection": "#1F1F1F",
+        "selection_border": "#3A3A3A",
+        "accent": "#E6E6E6",
+        "accent_hover": "#D9D9D9",
+        "accent_text": "#121212",
+        "check": "#5C5C5C",
+        "track": "#1E1E1E",
+        "button_bg": "#1E1E1E",
+        "button_hover": "#2A2A2A",
+        "button_pressed": "#323232",
+        "input_bg": "#1A1A1A",
+        "input_focus_bg": "#1C1C1C",
+        "input_focus_border": "#3A3A3A",
+        "input_selection": "#2F2F2F",
+        "sidebar_bg": "#1A1A1A",
+        "sidebar_border": "#222222",
+        "sidebar_hover": "#1F1F1F",
+        "sidebar_text": "#8B8B8B",
+        "sidebar_text_hover": "#E0E0E0",
+        "sidebar_text_active": "#FFFFFF",
+        "sidebar_marker": "#CFCFCF",
+        "header_btn": "#1E1E1E",
+        "header_btn_border": "#3A3A3A",
+        "header_btn_hover": "#2A2A2A",
+        "header_btn_border_hover": "#555555",
+        "header_btn_pressed": "#323232",
+        "header_btn_border_pressed": "#666666",
+        "timer_text": "#E6E6E6",
+        "ring": "#E6E6E6",
+        "ring_track": "#2A2A2A",
+        "control": "#2C2C2C",
+        "control_hover": "#3A3A3A",
+        "control_pressed": "#4A4A4A",
+        "control_text": "#E6E6E6",
+        "floating_border": "#222222",
+        "internal_bg": "#2D2519",
+        "internal_text": "#FFB74D",
+        "external_bg": "#2B1E20",
+        "external_text": "#FF8A80",
+        "quadrant_q1": "#2B1E20",
+        "quadrant_q2": "#1A2430",
+        "quadrant_q3": "#2D2519",
+        "quadrant_q4": "#261C2A",
+        "quadrant_input": "rgba(0, 0, 0, 0.25)",
+        "kanban_pomodoro": "#FF8A80",
+        "kanban_focus_hover": "#1A2430",
+        "kanban_delete_hover": "#2B1E20",
+        "tone_red": "#2B1E20",
+        "tone_blue": "#1A2430",
+        "tone_grey": "#1E1E1E",
+        "tone_amber": "#2D2519",
+        "sponsor_bg": "#2B1E20",
+        "sponsor_text": "#FF8A80",
+        "sponsor_border": "#3A2A2C",
+        "overlay_bg": "rgba(26, 35, 126, 0.95)",
+        "overlay_text": "#FFFFFF",
+        "overlay_subtext": "#E8EAF6",
+        "heatmap_level_0": "#2A2A2A",
+        "heatmap_level_1": "#5C2A24",
+        "heatmap_level_2": "#8E3A2F",
+        "heatmap_level_3": "#C94B38",
+        "heatmap_level_4": "#FF6B54",
+        "heatmap_text": "#888888",
+        "trend_bar": "#8E3A2F",
+        "trend_line": "#FF8A75",
+        "trend_grid": "#333333",
+        "trend_text": "#888888",
+        "icon_tint": "#CFCFCF",
+    },
+}
+
+
+def get_resource_path(relative_path):
+    if hasattr(sys, 'frozen'):
+        if hasattr(sys, '_MEIPASS'):
+            base_path = sys._MEIPASS
+        else:
+            base_path = os.path.dirname(sys.executable)
+    else:
+        # src/ui/theme.py -> src
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, relative_path)
+
+
+def compile_style_sheet(template, tokens):
+    """Substitute every @token in `template`; unknown tokens are an error."""
+    def replace(match):
+        value = tokens.get(match.group(1))
+        if value is None:
+            raise ValueError(f"Unknown theme token @{match.group(1)}")
+        return value
+    return TOKEN.sub(replace, template)
+
+
+def tint_icons(widget, theme_engine=None):
+    """Re-set the icon of every button under `widget` that names its SVG in the "icon_name" property."""
+    tint = (theme_engine or engine).color("icon_tint")
+    for button in widget.findChildren(QAbstractButton):
+        name = button.property("icon_name")
+        if name:
+            button.setIcon(icons.icon(name, tint))
+
+
+class ThemeEngine(QObject):
+    """
+    Application-wide themes compiled from one tokenized stylesheet.
+
+    The template is read and every palette compiled into a finished sheet
+    once, so switching themes is a single QApplication.setStyleSheet with no
+    file access. Widgets carry no stylesheets of their own; they are styled
+    through object names and dynamic properties, which the app-level sheet
+    reaches in every theme.
+    """
+    theme_changed = pyqtSignal(str)
+
+    def __init__(self, template=None, palettes=PALETTES):
+        super().__init__()
+        if template is None:
+            with open(get_resource_path(TEMPLATE_PATH), "r", encoding="utf-8") as f:
+                template = f.read()
+        self.palettes = palettes
+        self.theme = None
+        self.switches = 0
+        self.last_switch_ms = None
+        # QSS urls need forward slashes
+        variables = {"resources": get_resource_path("resources").replace("\\", "/")}
+        self.style_sheets = {name: compile_style_sheet(template, {**variables, **palette})
+                             for name, palette in palettes.items()}
+
+    def color(self, token, theme=None):
+        return self.palettes[theme or self.theme or "light"].get(token)
+
+    def apply(self, app, theme):
+        """Make `theme` current for the whole app; returns False if nothing had to change."""
+        if theme not in self.style_sheets:
+            theme = "light"
+        style_sheet = self.style_sheets[theme]
+        # Setting a sheet repolishes every widget in the app, so skip identical ones
+        if app.styleSheet() == style_sheet and theme == self.theme:
+            return False
+        start = time.perf_counter()
+        if app.styleSheet() != style_sheet:
+            app.setStyleSheet(style_sheet)
+        self.last_switch_ms = (time.perf_counter() - start) * 1000
+        self.switches += 1
+        self.theme = theme
+        self.theme_changed.emit(theme)
+        return True
+
+
+engine = ThemeEngine()
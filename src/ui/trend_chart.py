@@ -0,0 +1,167 @@
+from PyQt6.QtWidgets import QWidget, QToolTip
+from PyQt6.QtCore import Qt, QRectF, QPointF, QSize, QEvent
+from PyQt6.QtGui import QPainter, QColor, QFont, QPen, QPolygonF
+from logic.aggregation import StatsAggregator, INTERRUPTION_RATE
+from ui.theme import engine as theme_engine
+
+LEFT = 40   # Value axis labels
+RIGHT = 10
+TOP = 12
+BOTTOM = 22 # Bucket labels
+GRID_LINES = 4
+# Buckets shown and moving-average window per granularity
+PERIODS = {"day": (30, 7), "week": (26, 4), "month": (12, 3)}
+METRIC_LABELS = {"minutes": "分钟", "count": "个番茄", INTERRUPTION_RATE: "次/番茄"}
+
+
+class TrendChart(QWidget):
+    """
+    Bar chart of focus minutes, pomodoros or interruption rate per day, week
+    or month, with the moving average drawn as a line.
+
+    The numbers come from a StatsAggregator kept in step with DataManager:
+    a recorded session updates a single day of its arrays. The series is
+    only recomputed on the next paint, so a hidden chart costs nothing.
+    Colours are the trend_* tokens of the current theme.
+    """
+
+    def __init__(self, data_manager, parent=None):
+        super().__init__(parent)
+        self.data_manager = data_manager
+        self.metric = "minutes"
+        self.granularity = "day"
+        self.series_builds = 0
+        self._series = None # (labels, values, moving_averages)
+        self.aggregator = StatsAggregator()
+        self.rebuild()
+        self.setMouseTracking(True)
+        self.setMinimumHeight(200)
+        data_manager.stats_changed.connect(self.on_stats_changed)
+        theme_engine.theme_changed.connect(self.update)
+
+    def sizeHint(self):
+        return QSize(600, 220)
+
+    def rebuild(self):
+        data = self.data_manager.data
+        self.aggregator.rebuild(data.get("stats", {}).get("history", {}), data.get("interruptions", []))
+        self._invalidate()
+
+    def on_stats_changed(self, version):
+        day = self.data_manager.last_stats_day
+        if day is None:
+            self.rebuild()
+            return
+        day_data = self.data_manager.data.get("stats", {}).get("history", {}).get(day, {})
+        self.aggregator.set_day(day, minutes=day_data.get("minutes", 0), count=day_data.get("count", 0),
+                                interruptions=self.data_manager.interruptions_on(day))
+        self._invalidate()
+
+    def _invalidate(self):
+        self._series = None
+        self.update()
+
+    def set_metric(self, metric):
+        if metric != self.metric:
+            self.metric = metric
+            self._invalidate()
+
+    def set_granularity(self, granularity):
+        if granularity != self.granularity:
+            self.granularity = granularity
+            self._invalidate()
+
+    def series(self):
+        if self._series is None:
+            self.series_builds += 1
+            periods, window = PERIODS[self.granularity]
+            self._series = self.aggregator.series(self.metric, self.granularity, periods, window)
+        return self._series
+
+    # Geometry
+    def _plot_rect(self):
+        return QRectF(LEFT, TOP, max(self.width() - LEFT - RIGHT, 1), max(self.height() - TOP - BOTTOM, 1))
+
+    def _scale_max(self, values, averages):
+        peak = max(max(values, default=0), max(averages, default=0))
+        if self.metric == INTERRUPTION_RATE:
+            return max(peak, 0.5)
+        return max(peak, GRID_LINES)
+
+    def bucket_at(self, x):
+        labels = self.series()[0]
+        plot = self._plot_rect()
+        if not labels or not plot.left() <= x < plot.right():
+            return None
+        return min(int((x - plot.left()) / (plot.width() / len(labels))), len(labels) - 1)
+
+    def _format(self, value):
+        if self.metric == INTERRUPTION_RATE:
+            return f"{value:.2f}"
+        return f"{value:.0f}" if value == int(value) else f"{value:.1f}"
+
+    def paintEvent(self, event):
+        labels, values, averages = self.series()
+        grid_color = QColor(theme_engine.color("trend_grid"))
+        text_color = QColor(theme_engine.color("trend_text"))
+        plot = self._plot_rect()
+        scale = self._scale_max(values, averages)
+        slot = plot.width() / max(len(values), 1)
+
+        def y_of(value):
+            return plot.bottom() - value / scale * plot.height()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        font = QFont(self.font())
+        font.setPixelSize(10)
+        painter.setFont(font)
+
+        # Grid and value axis
+        for step in range(GRID_LINES + 1):
+            value = scale * step / GRID_LINES
+            y = y_of(value)
+            painter.setPen(QPen(grid_color, 1))
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(text_color)
+            painter.drawText(QRectF(0, y - 6, LEFT - 6, 12),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, self._format(value))
+
+        # Bars
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(theme_engine.color("trend_bar")))
+        bar_width = max(slot * 0.7, 1)
+        for index, value in enumerate(values):
+            if value:
+                x = plot.left() + index * slot + (slot - bar_width) / 2
+                painter.drawRoundedRect(QRectF(x, y_of(value), bar_width, plot.bottom() - y_of(value)), 2, 2)
+
+        # Moving average
+        if averages:
+            painter.setPen(QPen(QColor(theme_engine.color("trend_line")), 2))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawPolyline(QPolygonF([QPointF(plot.left() + (index + 0.5) * slot, y_of(value))
+                                            for index, value in enumerate(averages)]))
+
+        # Bucket labels, thinned out to about one every 60px
+        painter.setPen(text_color)
+        every = max(1, int(60 / slot) + 1)
+        for index in range(len(labels) - 1, -1, -every):
+            rect = QRectF(plot.left() + (index + 0.5) * slot - 30, plot.bottom() + 4, 60, BOTTOM - 4)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop, labels[index])
+        painter.end()
+
+    def event(self, event):
+        if event.type() == QEvent.Type.ToolTip:
+            index = self.bucket_at(event.pos().x())
+            if index is not None:
+                labels, values, averages = self.series()
+                _, window = PERIODS[self.granularity]
+                unit = METRIC_LABELS[self.metric]
+                QToolTip.showText(event.globalPos(),
+                                  f"{labels[index]}：{self._format(values[index])} {unit}\n"
+                                  f"{window} 期均值：{self._format(averages[index])} {unit}", self)
+            else:
+                QToolTip.hideText()
+            return True
+        return super().event(event)
@@ -1,19 +1,13 @@
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-                             QListWidget, QListWidgetItem, QAbstractItemView)
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QRectF, pyqtProperty, QPointF
-from PyQt6.QtGui import QColor, QFont, QIcon, QPainter, QPen, QPainterPath
-import sys, os
-
-def get_resource_path(relative_path):
-    if hasattr(sys, 'frozen'):
-        if hasattr(sys, '_MEIPASS'):
-            base_path = sys._MEIPASS
-        else:
-            base_path = os.path.dirname(sys.executable)
-    else:
-        # src/ui/widgets.py -> src
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    return os.path.join(base_path, relative_path)
+                             QListView, QAbstractItemView, QStyledItemDelegate, QStyle, QToolTip, QApplication)
+from PyQt6.QtCore import (Qt, pyqtSignal, QSize, QRect, QRectF, pyqtProperty, QPointF, QTimer,
+                          QAbstractListModel, QModelIndex, QMimeData, QByteArray)
+from PyQt6.QtGui import QColor, QFont, QPainter, QPen, QPainterPath, QDrag, QCursor, QPixmap
+from ui import icons
+from ui.theme import engine as theme_engine
+from collections import OrderedDict
+import json
+import math
 
 class SmoothButton(QPushButton):
     """
@@ -96,13 +90,41 @@ class SmoothButton(QPushButton):
             
             self.icon().paint(painter, int(x), int(y), icon_size.width(), icon_size.height())
 
+RING_WIDTH = 10
+# Rendered tracks kept as pixmaps, enough to switch themes back and forth without a rebuild
+RING_CACHE_SIZE = 4
+# Smooth mode: each value change glides over one timer tick, at most this many frames per second
+SMOOTH_DURATION_MS = 1000
+SMOOTH_MAX_FPS = 30
+# Changes larger than this share of the circle (resets, mode switches) jump instead of gliding
+SMOOTH_MAX_FRACTION = 0.25
+
 class CircularProgressBar(QWidget):
+    """
+    Progress ring drawn clockwise from the top.
+
+    The static track is rendered once per (size, track color, device pixel
+    ratio) into a cached pixmap that paintEvent blits through the clip, and a
+    value change only invalidates the bounding box of the arc segment that
+    changed. In smooth mode a change glides over one tick with a frame for
+    every device pixel the arc end travels (capped at SMOOTH_MAX_FPS), so a
+    long session still updates about once a second.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._value = 100
         self._max_value = 100
         self._color = QColor("#BB86FC")
         self._bg_color = QColor("#F0F0F0")
+        self._progress_pen = self._ring_pen(self._color)
+        self._ring_pixmaps = OrderedDict() # (size, track rgba, dpr) -> QPixmap
+        self.ring_builds = 0
+        self._smooth = False
+        self._tween = None # (start value, target value, frames, frames shown)
+        self._tween_timer = QTimer(self)
+        self._tween_timer.timeout.connect(self._advance_tween)
+        self.animation_frames = 0
         self.setMinimumSize(400, 400)
         
         # Layout for centered content
@@ -116,122 +138,365 @@ class CircularProgressBar(QWidget):
 
     @value.setter
     def value(self, val):
-        self._value = val
-        self.update()
+        self._stop_tween()
+        self._show_value(val)
 
     def set_max_value(self, max_val):
+        if max_val == self._max_value:
+            return
+        self._stop_tween()
         self._max_value = max_val
         self.update()
 
     def set_color(self, color_str):
         self._color = QColor(color_str)
+        self._progress_pen = self._ring_pen(self._color)
         self.update()
 
     def set_bg_color(self, color_str):
         self._bg_color = QColor(color_str)
         self.update()
 
+    def is_smooth(self):
+        return self._smooth
+
+    def set_smooth(self, enabled):
+        self._smooth = bool(enabled)
+        if not self._smooth:
+            self._stop_tween()
+
+    def animate_to(self, val):
+        """Show val, gliding there in smooth mode; otherwise the same as setting value."""
+        start = self._value
+        if self._tween is not None:
+            # Retarget from wherever the running glide has got to
+            self._tween_timer.stop()
+            self._tween = None
+        change = abs(self._fraction(val) - self._fraction(start))
+        if not self._smooth or not self.isVisible() or change > SMOOTH_MAX_FRACTION:
+            self._show_value(val)
+            return
+        # One frame per device pixel of arc travel is as smooth as the screen can show
+        travel = change * math.pi * self._ring_side() * self.devicePixelRatioF()
+        frames = min(math.ceil(travel), SMOOTH_MAX_FPS * SMOOTH_DURATION_MS // 1000)
+        if frames <= 1:
+            self._show_value(val)
+            return
+        self._tween = (start, val, frames, 0)
+        self._tween_timer.start(SMOOTH_DURATION_MS // frames)
+
+    def _advance_tween(self):
+        start, target, frames, shown = self._tween
+        shown += 1
+        self._tween = (start, target, frames, shown)
+        self.animation_frames += 1
+        self._show_value(start + (target - start) * shown / frames)
+        if shown >= frames:
+            self._stop_tween()
+
+    def _stop_tween(self):
+        if self._tween is not None:
+            target = self._tween[1]
+            self._tween_timer.stop()
+            self._tween = None
+            self._show_value(target)
+
+    def hideEvent(self, event):
+        # Nothing to glide while hidden; land on the target
+        self._stop_tween()
+        super().hideEvent(event)
+
+    def _show_value(self, val):
+        old = self._fraction(self._value)
+        self._value = val
+        new = self._fraction(val)
+        if new != old:
+            self.update(self._arc_rect(old, new))
+
+    def _fraction(self, val):
+        if self._max_value <= 0:
+            return 0.0
+        return max(0.0, min(1.0, val / self._max_value))
+
+    @staticmethod
+    def _ring_pen(color):
+        pen = QPen(color)
+        pen.setWidth(RING_WIDTH)
+        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        return pen
+
+    def _ring_side(self):
+        return min(self.width(), self.height()) - 20
+
+    def _arc_rect(self, start, end):
+        """Widget rect covering the arc between two fractions of the circle, caps included."""
+        start, end = min(start, end), max(start, end)
+        radius = self._ring_side() / 2
+        cx, cy = self.width() / 2, self.height() / 2
+        # Fractions run clockwise from the top; the extremes of the circle can lie in between
+        fractions = [start, end] + [f for f in (0.25, 0.5, 0.75) if start < f < end]
+        xs, ys = [], []
+        for f in fractions:
+            angle = math.pi / 2 - f * 2 * math.pi
+            xs.append(cx + radius * math.cos(angle))
+            ys.append(cy - radius * math.sin(angle))
+        # Half the pen on each side plus the round cap, and a pixel of antialiasing
+        margin = RING_WIDTH + 1
+        return QRectF(min(xs) - margin, min(ys) - margin,
+                      max(xs) - min(xs) + 2 * margin, max(ys) - min(ys) + 2 * margin).toAlignedRect()
+
+    def _touches_ring(self, rect):
+        # Repaints inside the hole (the timer label) need no arc
+        inner = self._ring_side() / 2 - RING_WIDTH
+        cx, cy = self.width() / 2, self.height() / 2
+        far_x = max(abs(rect.left() - cx), abs(rect.right() + 1 - cx))
+        far_y = max(abs(rect.top() - cy), abs(rect.bottom() + 1 - cy))
+        return far_x * far_x + far_y * far_y >= inner * inner
+
+    def _ring_pixmap(self):
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), self._bg_color.rgba(), dpr)
+        pixmap = self._ring_pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._ring_pixmaps[key] = self._build_ring_pixmap(dpr)
+            while len(self._ring_pixmaps) > RING_CACHE_SIZE:
+                self._ring_pixmaps.popitem(last=False)
+        self._ring_pixmaps.move_to_end(key)
+        return pixmap
+
+    def _build_ring_pixmap(self, dpr):
+        self.ring_builds += 1
+        pixmap = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        side = self._ring_side()
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.translate(self.width() / 2, self.height() / 2)
+        painter.setPen(self._ring_pen(self._bg_color))
+        painter.drawEllipse(QRectF(-side/2, -side/2, side, side))
+        painter.end()
+        return pixmap
+
     def paintEvent(self, event):
+        painter = QPainter(self)
+        # Blitted through the clip, so a small update copies a small area
+        painter.drawPixmap(0, 0, self._ring_pixmap())
+        
+        if self._max_value <= 0 or not self._touches_ring(event.rect()):
+            return
         width = self.width()
         height = self.height()
-        side = min(width, height) - 20
-        
-        painter = QPainter(self)
+        side = self._ring_side()
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Center the coordinate system
         painter.translate(width / 2, height / 2)
         
-        # Background Circle
-        bg_pen = QPen(self._bg_color)
-        bg_pen.setWidth(10)
-        bg_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        painter.setPen(bg_pen)
-        painter.drawEllipse(QRectF(-side/2, -side/2, side, side))
-        
         # Progress Arc
-        if self._max_value > 0:
-            progress_pen = QPen(self._color)
-            progress_pen.setWidth(10)
-            progress_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            painter.setPen(progress_pen)
-            
-            # Calculate angle (in 1/16th of a degree)
-            # 90 degrees is the top (start angle)
-            # Clockwise progress: span angle should be negative
-            span_angle = int(-(self._value / self._max_value) * 360 * 16)
-            painter.drawArc(QRectF(-side/2, -side/2, side, side), 90 * 16, span_angle)
-
-class KanbanItemWidget(QWidget):
-    focus_requested = pyqtSignal(dict)
-    delete_requested = pyqtSignal()
-    
-    def __init__(self, task_data, parent=None):
+        painter.setPen(self._progress_pen)
+        # Calculate angle (in 1/16th of a degree)
+        # 90 degrees is the top (start angle)
+        # Clockwise progress: span angle should be negative
+        span_angle = int(-(self._value / self._max_value) * 360 * 16)
+        painter.drawArc(QRectF(-side/2, -side/2, side, side), 90 * 16, span_angle)
+
+KANBAN_MIME_TYPE = "application/x-fanqie-task"
+KANBAN_ROW_HEIGHT = 80
+
+class KanbanModel(QAbstractListModel):
+    """
+    View of one quadrant's task list inside DataManager. The model holds no copy:
+    every edit is a single DataManager delta wrapped in the matching row signals,
+    so only the affected rows are touched.
+    """
+
+    def __init__(self, category, data_manager, parent=None):
         super().__init__(parent)
-        self.task_data = task_data
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(10, 5, 5, 5)
-        
-        # Content Layout
-        content_layout = QVBoxLayout()
-        content_layout.setSpacing(2)
-        
-        self.label = QLabel(task_data.get("content", ""))
-        self.label.setObjectName("KanbanItemLabel")
-        self.label.setWordWrap(True)
-        self.label.setStyleSheet("font-family: 'Microsoft YaHei', 'Segoe UI'; font-size: 14px; color: #333; line-height: 1.4;")
-        
-        # Pomodoro Count
-        pomo_count = task_data.get("pomodoros", 0)
-        self.pomo_label = QLabel(f"🍅 {pomo_count}" if pomo_count > 0 else "")
-        self.pomo_label.setStyleSheet("color: #FF6B6B; font-size: 12px; font-weight: bold;")
-        
-        content_layout.addWidget(self.label)
-        if pomo_count > 0:
-            content_layout.addWidget(self.pomo_label)
-        
-        self.focus_btn = QPushButton()
-        self.focus_btn.setFixedSize(30, 30)
-        self.focus_btn.setIcon(QIcon(get_resource_path("resources/icon_item_focus.svg")))
-        self.focus_btn.setIconSize(QSize(24, 24))
-        self.focus_btn.setToolTip("开始专注此任务")
-        self.focus_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.focus_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                border-radius: 15px;
-            }
-            QPushButton:hover {
-                background: #E3F2FD;
-            }
-        """)
-        self.focus_btn.clicked.connect(lambda: self.focus_requested.emit(self.task_data))
-        
-        self.delete_btn = QPushButton()
-        self.delete_btn.setFixedSize(30, 30)
-        self.delete_btn.setIcon(QIcon(get_resource_path("resources/icon_item_delete.svg")))
-        self.delete_btn.setIconSize(QSize(20, 20))
-        self.delete_btn.setToolTip("删除任务")
-        self.delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                border-radius: 15px;
-                margin-left: 5px;
-            }
-            QPushButton:hover {
-                background: #FFEBEE;
-            }
-        """)
-        self.delete_btn.clicked.connect(self.delete_requested.emit)
-        
-        layout.addLayout(content_layout, 1)
-        layout.addWidget(self.focus_btn)
-        layout.addWidget(self.delete_btn)
+        self.category = category
+        self.data_manager = data_manager
+
+    @property
+    def _tasks(self):
+        return self.data_manager.get_tasks(self.category)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tasks)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._tasks):
+            return None
+        task = self._tasks[index.row()]
+        if role == Qt.ItemDataRole.UserRole:
+            return task
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return task.get("content", "")
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            # Drops land between rows, never onto a task
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsDragEnabled
+
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+
+    def supportedDragActions(self):
+        return Qt.DropAction.MoveAction
+
+    def mimeTypes(self):
+        return [KANBAN_MIME_TYPE]
+
+    def mimeData(self, indexes):
+        mime = QMimeData()
+        if indexes:
+            row = indexes[0].row()
+            payload = {"category": self.category, "row": row, "id": self._tasks[row].get("id")}
+            mime.setData(KANBAN_MIME_TYPE, QByteArray(json.dumps(payload).encode("utf-8")))
+        return mime
+
+    def tasks(self):
+        return self._tasks
+
+    def task(self, row):
+        return self._tasks[row]
+
+    def reload(self):
+        # One reset instead of a signal per row keeps large boards fast to load
+        self.beginResetModel()
+        self.endResetModel()
+
+    def set_tasks(self, tasks):
+        self.beginResetModel()
+        self.data_manager.set_category_tasks(self.category, tasks)
+        self.endResetModel()
+
+    def insert_task(self, row, task):
+        row = max(0, min(row, len(self._tasks)))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.data_manager.add_task(self.category, task, row)
+        self.endInsertRows()
+
+    def take_task(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        task = self.data_manager.remove_task(self.category, row)
+        self.endRemoveRows()
+        return task
+
+    def move_task(self, src, dest):
+        """Move a row within this quadrant; `dest` is the insertion point before the move."""
+        if dest in (src, src + 1):
+            return False
+        self.beginMoveRows(QModelIndex(), src, src, QModelIndex(), dest)
+        self.data_manager.move_task(self.category, src, self.category, dest - 1 if dest > src else dest)
+        self.endMoveRows()
+        return True
+
+    def move_to(self, target, src, dest):
+        """Move a row into another quadrant's model as one DataManager delta."""
+        self.beginRemoveRows(QModelIndex(), src, src)
+        target.beginInsertRows(QModelIndex(), dest, dest)
+        self.data_manager.move_task(self.category, src, target.category, dest)
+        target.endInsertRows()
+        self.endRemoveRows()
+
+    def task_changed(self, row):
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+
+class KanbanDelegate(QStyledItemDelegate):
+    """
+    Paints a task card and owns the geometry of its focus and delete buttons,
+    so the list needs no per-row widgets.
+    """
+    FOCUS, DELETE = "focus", "delete"
+    BUTTON_SIZE = 30
 
-class KanbanList(QListWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hover = None # (row, part) under the mouse
+        self.text_font = QFont()
+        self.text_font.setFamilies(["Microsoft YaHei", "Segoe UI"])
+        self.text_font.setPixelSize(14)
+        self.pomo_font = QFont(self.text_font)
+        self.pomo_font.setPixelSize(12)
+        self.pomo_font.setBold(True)
+
+    def sizeHint(self, option, index):
+        return QSize(0, KANBAN_ROW_HEIGHT)
+
+    def card_rect(self, rect):
+        # Matches the 5px item margin of the old stylesheet
+        return rect.adjusted(5, 5, -5, -5)
+
+    def button_rects(self, rect):
+        card = self.card_rect(rect)
+        size = self.BUTTON_SIZE
+        top = card.center().y() - size // 2
+        delete = QRect(card.right() - 5 - size, top, size, size)
+        focus = QRect(delete.left() - 5 - size, top, size, size)
+        return {self.FOCUS: focus, self.DELETE: delete}
+
+    def hit_test(self, rect, pos):
+        for part, button in self.button_rects(rect).items():
+            if button.contains(pos):
+                return part
+        return None
+
+    def paint(self, painter, option, index):
+        task = index.data(Qt.ItemDataRole.UserRole) or {}
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card background comes from the list's ::item style rules
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, option.widget)
+
+        card = self.card_rect(option.rect)
+        buttons = self.button_rects(option.rect)
+        text_rect = QRect(card.left() + 10, card.top() + 5,
+                          buttons[self.FOCUS].left() - card.left() - 15, card.height() - 10)
+
+        pomodoros = task.get("pomodoros", 0)
+        if pomodoros > 0:
+            text_rect.setHeight(text_rect.height() - 18)
+            painter.setFont(self.pomo_font)
+            painter.setPen(QColor(theme_engine.color("kanban_pomodoro")))
+            painter.drawText(QRect(text_rect.left(), text_rect.bottom() + 2, text_rect.width(), 16),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, f"🍅 {pomodoros}")
+
+        painter.setFont(self.text_font)
+        painter.setPen(QColor(theme_engine.color("text_strong")))
+        painter.drawText(text_rect, Qt.AlignmentFlag.AlignVCenter | Qt.TextFlag.TextWordWrap,
+                         task.get("content", ""))
+
+        # Tinted like the buttons tint_icons handles
+        tint = theme_engine.color("icon_tint")
+        for part, icon_name, icon_size, hover_token in (
+                (self.FOCUS, "icon_item_focus.svg", 24, "kanban_focus_hover"),
+                (self.DELETE, "icon_item_delete.svg", 20, "kanban_delete_hover")):
+            button = buttons[part]
+            if self.hover == (index.row(), part):
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(QColor(theme_engine.color(hover_token)))
+                painter.drawEllipse(button)
+            icon_rect = QRect(0, 0, icon_size, icon_size)
+            icon_rect.moveCenter(button.center())
+            icons.icon(icon_name, tint).paint(painter, icon_rect)
+
+        painter.restore()
+
+    def helpEvent(self, event, view, option, index):
+        part = self.hit_test(option.rect, event.pos())
+        if part is not None:
+            QToolTip.showText(event.globalPos(), "开始专注此任务" if part == self.FOCUS else "删除任务", view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+
+class KanbanList(QListView):
     item_deleted = pyqtSignal()
     order_changed = pyqtSignal()
     focus_task = pyqtSignal(dict)
@@ -240,67 +505,226 @@ class KanbanList(QListWidget):
         super().__init__()
         self.data_manager = data_manager
         self.category = category
+        self.task_model = KanbanModel(category, data_manager, parent=self)
+        self.delegate = KanbanDelegate(self)
+        self.setModel(self.task_model)
+        self.setItemDelegate(self.delegate)
+        # Every card has the same height, which lets the view skip per-row layout
+        self.setUniformItemSizes(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setMouseTracking(True)
+        self._pressed = None
+        self._filter = None # Task ids to show, None shows all
+        self._rows_hidden = False
+        # Hidden rows are tracked by persistent index, so removals need nothing and
+        # only rows that arrive or move are checked against an active filter
+        self.task_model.rowsInserted.connect(self._filter_inserted_rows)
+        self.task_model.rowsMoved.connect(self._filter_moved_rows)
+        self.task_model.modelReset.connect(self._apply_filter)
+
         self.setObjectName("KanbanList")
         self.setDragEnabled(True)
         self.setAcceptDrops(True)
         self.setDropIndicatorShown(True)
+        self.setDragDropMode(QAbstractItemView.DragDropMode.DragDrop)
         self.setDefaultDropAction(Qt.DropAction.MoveAction)
         self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.setProperty("class", "KanbanList")
-        self.setStyleSheet("""
-            QListWidget::item { 
-                margin: 5px; 
-                background: #FFFFFF; 
-                border-radius: 12px;
-            }
-        """)
+
+    # QListWidget-compatible helpers used by the board
+    def count(self):
+        return self.task_model.rowCount()
+
+    def item(self, row):
+        return self.task_model.index(row)
+
+    def clear(self):
+        self.task_model.set_tasks([])
+
+    def tasks(self):
+        return self.task_model.tasks()
+
+    def set_tasks(self, tasks):
+        self.task_model.set_tasks(tasks)
+
+    def reload(self):
+        self.task_model.reload()
+
+    def set_filter(self, task_ids):
+        """Hide tasks whose id is not in `task_ids` (None shows every task)."""
+        self._filter = task_ids
+        self._apply_filter()
+
+    def _apply_filter(self):
+        # Without a filter and with nothing hidden there is nothing to undo
+        if self._filter is None and not self._rows_hidden:
+            return
+        self._filter_rows(0, self.count() - 1)
+        self._rows_hidden = self._filter is not None
+
+    def _filter_inserted_rows(self, parent, first, last):
+        if self._filter is not None:
+            self._filter_rows(first, last)
+
+    def _filter_moved_rows(self, parent, start, end, destination, row):
+        if self._filter is None:
+            return
+        # Moving down, the destination row counts the moved rows still above it
+        first = row - (end - start + 1) if row > end else row
+        self._filter_rows(first, first + end - start)
+
+    def _filter_rows(self, first, last):
+        tasks = self.tasks()
+        for row in range(first, last + 1):
+            self.setRowHidden(row, self._filter is not None and tasks[row].get("id") not in self._filter)
 
     def add_task_item(self, task_data):
-        item = QListWidgetItem(self)
-        # Store dict in UserRole
-        item.setData(Qt.ItemDataRole.UserRole, task_data)
-        item.setSizeHint(QSize(0, 80))
-        self.addItem(item)
-        
-        widget = KanbanItemWidget(task_data)
-        widget.focus_requested.connect(self.focus_task.emit)
-        widget.delete_requested.connect(lambda: self.handle_delete_item(item))
-        self.setItemWidget(item, widget)
-
-    def handle_delete_item(self, item):
-        row = self.row(item)
-        self.takeItem(row)
+        self.task_model.insert_task(self.count(), task_data)
+
+    def handle_delete_item(self, index):
+        self.task_model.take_task(index.row())
         self.item_deleted.emit()
 
+    # Button hit-testing
+    def _part_at(self, pos):
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return index, None
+        return index, self.delegate.hit_test(self.visualRect(index), pos)
+
+    def _set_hover(self, hover):
+        if hover == self.delegate.hover:
+            return
+        for row, _ in filter(None, (self.delegate.hover, hover)):
+            self.viewport().update(self.visualRect(self.task_model.index(row)))
+        self.delegate.hover = hover
+        if hover:
+            self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        else:
+            self.viewport().unsetCursor()
+
+    def mousePressEvent(self, event):
+        index, part = self._part_at(event.position().toPoint())
+        if part is not None and event.button() == Qt.MouseButton.LeftButton:
+            # Buttons never start a drag or change the selection
+            self._pressed = (index.row(), part)
+            event.accept()
+            return
+        self._pressed = None
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        index, part = self._part_at(event.position().toPoint())
+        self._set_hover((index.row(), part) if part is not None else None)
+        if self._pressed is not None:
+            event.accept()
+            return
+        super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        pressed, self._pressed = self._pressed, None
+        if pressed is None:
+            super().mouseReleaseEvent(event)
+            return
+        index, part = self._part_at(event.position().toPoint())
+        if (index.row(), part) != pressed:
+            return
+        if part == KanbanDelegate.FOCUS:
+            self.focus_task.emit(self.task_model.task(index.row()))
+        else:
+            self._set_hover(None)
+            self.handle_delete_item(index)
+
+    def leaveEvent(self, event):
+        self._set_hover(None)
+        super().leaveEvent(event)
+
+    # Drag and drop
+    def startDrag(self, supported_actions):
+        index = self.currentIndex()
+        if not index.isValid():
+            return
+        drag = QDrag(self)
+        drag.setMimeData(self.task_model.mimeData([index]))
+        # Render just the dragged card as the drag pixmap
+        rect = self.visualRect(index)
+        pixmap = self.viewport().grab(rect)
+        drag.setPixmap(pixmap)
+        drag.setHotSpot(self.viewport().mapFromGlobal(QCursor.pos()) - rect.topLeft())
+        # The drop target performs the whole move, so nothing is removed here
+        drag.exec(Qt.DropAction.MoveAction)
+
+    def drop_row(self, pos):
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return self.count()
+        rect = self.visualRect(index)
+        return index.row() + 1 if pos.y() > rect.center().y() else index.row()
+
     def dropEvent(self, event):
-        super().dropEvent(event)
-        # Re-apply widgets after drop
-        for i in range(self.count()):
-            item = self.item(i)
-            item.setSizeHint(QSize(0, 80))
-            if not self.itemWidget(item):
-                # Retrieve data from UserRole
-                task_data = item.data(Qt.ItemDataRole.UserRole)
-                if task_data:
-                    widget = KanbanItemWidget(task_data)
-                    widget.focus_requested.connect(self.focus_task.emit)
-                    widget.delete_requested.connect(lambda it=item: self.handle_delete_item(it))
-                    self.setItemWidget(item, widget)
-        
+        source = event.source()
+        mime = event.mimeData()
+        if not isinstance(source, KanbanList) or not mime.hasFormat(KANBAN_MIME_TYPE):
+            event.ignore()
+            return
+        payload = json.loads(bytes(mime.data(KANBAN_MIME_TYPE)).decode("utf-8"))
+
+        # Tell Qt the drop was handled by us so it does not touch either model again
+        event.setDropAction(Qt.DropAction.CopyAction)
+        event.accept()
+        self.stopAutoScroll()
+        self.setState(QAbstractItemView.State.NoState)
+        self.viewport().update()
+        self.move_from(source, payload["row"], self.drop_row(event.position().toPoint()))
+
+    def move_from(self, source, src_row, dest_row):
+        """Move one task from `source` (possibly this list) to `dest_row` here."""
+        if source is self:
+            if not self.task_model.move_task(src_row, dest_row):
+                return False
+        else:
+            dest_row = max(0, min(dest_row, self.count()))
+            source.task_model.move_to(self.task_model, src_row, dest_row)
+            source.order_changed.emit()
         self.order_changed.emit()
+        return True
+
+class SidebarHotZone(QWidget):
+    """
+    Invisible strip along the window's left edge that reveals a collapsed sidebar.
+
+    It is only shown while the sidebar is collapsed and reacts to the pointer
+    entering or moving over it, so the edge needs no cursor polling and costs
+    nothing while the sidebar is open or the window is hidden.
+    """
+    entered = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Move events without a pressed button, for a strip that appears under a resting pointer
+        self.setMouseTracking(True)
+
+    def enterEvent(self, event):
+        self.entered.emit()
+        super().enterEvent(event)
+
+    def mouseMoveEvent(self, event):
+        self.entered.emit()
+        super().mouseMoveEvent(event)
 
 class LongBreakOverlay(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setStyleSheet("background-color: rgba(26, 35, 126, 0.95);") # Deep indigo overlay
+        # Deep indigo overlay (overlay_bg token); custom QWidgets only paint a styled background on request
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground)
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         label = QLabel("🧘 长休息时间")
-        label.setStyleSheet("color: white; font-size: 48px; font-weight: bold;")
+        label.setProperty("role", "overlay_title")
         
         guide = QLabel("请离开座位，放松双眼。\n\n建议动作：\n1. 颈部拉伸\n2. 眺望远方\n3. 深呼吸三分钟")
-        guide.setStyleSheet("color: #E8EAF6; font-size: 24px; margin-top: 40px; line-height: 1.6;")
+        guide.setProperty("role", "overlay_guide")
         guide.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         layout.addWidget(label)
@@ -327,52 +751,28 @@ class NumberControl(QWidget):
         
         # Minus Button
         self.minus_btn = QPushButton()
-        self.minus_btn.setIcon(QIcon(get_resource_path("resources/icon_minus.svg")))
+        self.minus_btn.setIcon(icons.icon("icon_minus.svg"))
         self.minus_btn.setIconSize(QSize(18, 18))
         self.minus_btn.setFixedSize(36, 36)
         self.minus_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.minus_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F5F5F5;
-                border: 1px solid #E0E0E0;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #EEEEEE;
-                border-color: #CCCCCC;
-            }
-            QPushButton:pressed {
-                background-color: #E0E0E0;
-            }
-        """)
+        self.minus_btn.setProperty("role", "stepper")
+        self.minus_btn.setProperty("icon_name", "icon_minus.svg")
         self.minus_btn.clicked.connect(self.decrement)
         
         # Value Display
         self.value_label = QLabel()
         self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.value_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #333; background: transparent;")
+        self.value_label.setProperty("role", "stepper_value")
         self.value_label.setMinimumWidth(60)
         
         # Plus Button
         self.plus_btn = QPushButton()
-        self.plus_btn.setIcon(QIcon(get_resource_path("resources/icon_plus.svg")))
+        self.plus_btn.setIcon(icons.icon("icon_plus.svg"))
         self.plus_btn.setIconSize(QSize(18, 18))
         self.plus_btn.setFixedSize(36, 36)
         self.plus_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.plus_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F5F5F5;
-                border: 1px solid #E0E0E0;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #EEEEEE;
-                border-color: #CCCCCC;
-            }
-            QPushButton:pressed {
-                background-color: #E0E0E0;
-            }
-        """)
+        self.plus_btn.setProperty("role", "stepper")
+        self.plus_btn.setProperty("icon_name", "icon_plus.svg")
         self.plus_btn.clicked.connect(self.increment)
         
         layout.addWidget(self.minus_btn)
@@ -0,0 +1,151 @@
+import sys
+import os
+import unittest
+import datetime
+import tempfile
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtGui import QColor
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.aggregation import StatsAggregator, bucket_starts, INTERRUPTION_RATE
+from logic.data_manager import DataManager
+from ui.trend_chart import TrendChart
+from ui.theme import engine
+
+TODAY = datetime.date(2026, 3, 18) # A Wednesday
+
+def day(offset):
+    return (TODAY - datetime.timedelta(days=offset)).isoformat()
+
+HISTORY = {day(i): {"minutes": 25 * (i % 4), "count": i % 4} for i in range(0, 120, 3)}
+INTERRUPTIONS = [{"type": "internal", "timestamp": day(i) + "T10:00:00"} for i in range(0, 120, 9)]
+
+def aggregators():
+    aggregators = [StatsAggregator(use_numpy=False)]
+    if StatsAggregator().np is not None:
+        aggregators.append(StatsAggregator())
+    for aggregator in aggregators:
+        aggregator.rebuild(HISTORY, INTERRUPTIONS, today=TODAY)
+    return aggregators
+
+class TestStatsAggregator(unittest.TestCase):
+    def test_bucket_starts(self):
+        self.assertEqual(bucket_starts("week", 2, TODAY), [datetime.date(2026, 3, 9), datetime.date(2026, 3, 16),
+                                                          datetime.date(2026, 3, 23)])
+        self.assertEqual(bucket_starts("month", 3, TODAY)[0], datetime.date(2026, 1, 1))
+        self.assertEqual(bucket_starts("month", 3, TODAY)[-1], datetime.date(2026, 4, 1))
+
+    def test_sums_match_raw_history(self):
+        for aggregator in aggregators():
+            labels, values, averages = aggregator.series("minutes", "day", periods=10, window=1, today=TODAY)
+            self.assertEqual(values, [HISTORY.get(day(i), {}).get("minutes", 0) for i in range(9, -1, -1)])
+            self.assertEqual(averages, values)
+            self.assertEqual(labels[-1], "03-18")
+
+            _, values, _ = aggregator.series("count", "month", periods=2, window=1, today=TODAY)
+            march = sum(v["count"] for d, v in HISTORY.items() if d.startswith("2026-03"))
+            february = sum(v["count"] for d, v in HISTORY.items() if d.startswith("2026-02"))
+            self.assertEqual(values, [february, march])
+
+    def test_moving_average_reaches_before_visible_range(self):
+        for aggregator in aggregators():
+            _, daily, _ = aggregator.series("minutes", "day", periods=40, window=1, today=TODAY)
+            _, values, averages = aggregator.series("minutes", "day", periods=10, window=7, today=TODAY)
+            self.assertEqual(values, daily[-10:])
+            for index in range(10):
+                self.assertAlmostEqual(averages[index], sum(daily[30 + index - 6:31 + index]) / 7)
+
+    def test_interruption_rate(self):
+        for aggregator in aggregators():
+            _, rates, averages = aggregator.series(INTERRUPTION_RATE, "week", periods=8, window=4, today=TODAY)
+            _, interruptions, _ = aggregator.series("interruptions", "week", periods=11, window=1, today=TODAY)
+            _, counts, _ = aggregator.series("count", "week", periods=11, window=1, today=TODAY)
+            self.assertEqual(rates, [i / c if c else 0.0 for i, c in zip(interruptions[3:], counts[3:])])
+            self.assertAlmostEqual(averages[-1], sum(interruptions[-4:]) / sum(counts[-4:]))
+
+    def test_backends_agree(self):
+        results = [[aggregator.series(metric, granularity, 12, 3, today=TODAY)
+                    for metric in ("minutes", "count", INTERRUPTION_RATE)
+                    for granularity in ("day", "week", "month")] for aggregator in aggregators()]
+        self.assertEqual(results[0], results[-1])
+
+    def test_set_day_matches_rebuild(self):
+        history = dict(HISTORY)
+        history[day(0)] = {"minutes": 100, "count": 4}
+        tomorrow = (TODAY + datetime.timedelta(days=1)).isoformat()
+        history[tomorrow] = {"minutes": 25, "count": 1}
+        for aggregator in aggregators():
+            aggregator.set_day(day(0), minutes=100, count=4)
+            aggregator.set_day(tomorrow, minutes=25, count=1, interruptions=2)
+            expected = StatsAggregator(use_numpy=aggregator.np is not None)
+            interruptions = INTERRUPTIONS + [{"timestamp": tomorrow + "T09:00:00"}] * 2
+            expected.rebuild(history, interruptions, today=TODAY)
+            for metric in ("minutes", "count", "interruptions"):
+                self.assertEqual(aggregator.daily(metric), expected.daily(metric))
+            later = TODAY + datetime.timedelta(days=1)
+            self.assertEqual(aggregator.series("minutes", "week", 6, 2, today=later),
+                             expected.series("minutes", "week", 6, 2, today=later))
+            self.assertEqual(aggregator.rebuilds, 1)
+
+class TestTrendChart(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dm = DataManager(os.path.join(self.tmp.name, "data.json"))
+        self.chart = TrendChart(self.dm)
+        self.chart.resize(600, 220)
+        self.chart.show()
+
+    def tearDown(self):
+        engine.apply(self.app, "light")
+        self.chart.close()
+        QThreadPool.globalInstance().waitForDone()
+        self.tmp.cleanup()
+
+    def test_session_updates_one_day(self):
+        self.chart.repaint()
+        builds = self.chart.series_builds
+        self.dm.record_session(25)
+        self.dm.record_session(25)
+        self.dm.record_interruption("internal")
+        self.assertEqual(self.chart.aggregator.rebuilds, 1)
+        self.assertEqual(self.chart.aggregator.day_updates, 3)
+        _, values, _ = self.chart.series()
+        self.assertEqual(values[-1], 50)
+        self.assertEqual(self.chart.series_builds, builds + 1)
+
+        self.chart.set_metric(INTERRUPTION_RATE)
+        self.assertEqual(self.chart.series()[1][-1], 0.5)
+        self.chart.set_granularity("month")
+        self.assertEqual(len(self.chart.series()[0]), 12)
+        self.chart.repaint()
+
+    def test_colours_follow_theme(self):
+        self.dm.record_session(50)
+        plot = self.chart._plot_rect()
+        labels = self.chart.series()[0]
+        # Bottom of today's bar, below the moving average line
+        x = int(plot.left() + (len(labels) - 0.5) * plot.width() / len(labels))
+        y = int(plot.bottom()) - 2
+        self.assertEqual(self.chart.grab().toImage().pixelColor(x, y), QColor(engine.color("trend_bar", "light")))
+        engine.apply(self.app, "dark")
+        self.assertEqual(self.chart.grab().toImage().pixelColor(x, y), QColor(engine.color("trend_bar", "dark")))
+
+    def test_replaced_stats_rebuild(self):
+        self.dm.data["stats"]["history"] = {datetime.date.today().isoformat(): {"minutes": 75, "count": 3}}
+        self.dm.rebuild_stats_index()
+        self.assertEqual(self.chart.aggregator.rebuilds, 2)
+        self.assertEqual(self.chart.series()[1][-1], 75)
+        self.assertIsNotNone(self.chart.bucket_at(self.chart.width() - 20))
+
+if __name__ == '__main__':
+    unittest.main()
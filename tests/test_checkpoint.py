@@ -0,0 +1,143 @@
+import sys
+import os
+import json
+import time
+import types
+import unittest
+from unittest.mock import patch
+from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtCore import QThreadPool
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.timer import PomodoroTimer
+from logic.checkpoint import SessionCheckpoint, checkpoint_path_for, load_checkpoint, reconcile
+from ui.main_window import MainWindow
+from ui.floating_window import FloatingWindow
+import main
+
+class TestSessionCheckpoint(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.path = checkpoint_path_for(f"test_ckpt_{self.id().split('.')[-1]}.json")
+        self.task = None
+        self.timer = PomodoroTimer()
+        self.checkpoint = SessionCheckpoint(self.timer, self.path, task_provider=lambda: self.task,
+                                            min_interval_ms=0)
+
+    def tearDown(self):
+        self.timer.pause()
+        for path in (self.path, self.path + ".tmp"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_path_next_to_data_file(self):
+        self.assertTrue(checkpoint_path_for("data.json").endswith("data.session.json"))
+
+    def test_ticks_do_not_write(self):
+        self.timer.start()
+        writes = self.checkpoint.write_count
+        for seconds in range(1500, 1400, -1):
+            self.timer.tick.emit(seconds)
+        self.assertEqual(self.checkpoint.write_count, writes)
+
+    def test_transition_writes_state(self):
+        self.task = {"id": "t1", "content": "写报告"}
+        self.timer.start()
+        state = load_checkpoint(self.path)
+        self.assertIsNotNone(state)
+        self.assertTrue(state["is_running"])
+        self.assertEqual(state["mode"], 'work')
+        self.assertEqual(state["task"]["content"], "写报告")
+        self.assertAlmostEqual(state["end_at"], time.time() + self.timer.remaining_seconds, delta=2)
+
+    def test_writes_are_coalesced(self):
+        checkpoint = SessionCheckpoint(self.timer, self.path, min_interval_ms=60000)
+        for _ in range(5):
+            self.timer.start()
+            self.timer.pause()
+        # First transition writes immediately; the rest collapse into one pending write
+        self.assertEqual(checkpoint.write_count, 1)
+        self.assertTrue(checkpoint._pending.isActive())
+        checkpoint._pending.stop()
+
+    def test_idle_state_clears_file(self):
+        self.timer.start()
+        self.assertTrue(os.path.exists(self.path))
+        self.timer.reset()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_reconcile_running(self):
+        state = {"saved_at": 1000.0, "is_running": True, "end_at": 1000.0 + 600, "remaining_seconds": 600}
+        remaining, away = reconcile(state, now=1000.0 + 100)
+        self.assertEqual(remaining, 500)
+        self.assertEqual(away, 100)
+        remaining, _ = reconcile(state, now=1000.0 + 900)
+        self.assertEqual(remaining, 0)
+
+    def test_reconcile_paused(self):
+        state = {"saved_at": 1000.0, "is_running": False, "end_at": None, "remaining_seconds": 321}
+        self.assertEqual(reconcile(state, now=5000.0), (321, 4000))
+
+    def test_restore_state(self):
+        self.timer.switch_mode() # -> break, index 1
+        self.checkpoint.flush()
+        state = load_checkpoint(self.path)
+
+        other = PomodoroTimer()
+        other.restore_state(state["mode"], state["plan_index"], 120, state["pomodoros_completed"])
+        self.assertEqual(other.current_mode, 'break')
+        self.assertEqual(other.plan_index, 1)
+        self.assertEqual(other.remaining_seconds, 120)
+        self.assertEqual(other.pomodoros_completed, 1)
+
+    def test_corrupt_checkpoint_ignored(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        self.assertIsNone(load_checkpoint(self.path))
+
+class TestShowMainDuringSession(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def test_restoring_window_does_not_offer_resume(self):
+        timer = PomodoroTimer()
+        window = MainWindow(timer)
+        window.data_manager.save_data = lambda: None
+        floating = FloatingWindow(timer)
+        pomodoro_app = types.SimpleNamespace(main_window=window, floating_window=floating)
+        try:
+            timer.start()
+            window.checkpoint.flush()
+            self.assertIsNotNone(window.checkpoint.load())
+            # Compact mode, then back to the main window mid-session
+            window.hide()
+            floating.show()
+            with patch.object(QMessageBox, "question") as question:
+                main.PomodoroApp.show_main(pomodoro_app)
+                for _ in range(10):
+                    QApplication.processEvents()
+            question.assert_not_called()
+            self.assertTrue(timer.is_running)
+            # The live session's checkpoint is left alone
+            self.assertIsNotNone(window.checkpoint.load())
+        finally:
+            timer.pause()
+            window.checkpoint.clear()
+            window.close()
+            floating.close()
+            QThreadPool.globalInstance().waitForDone()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,9 @@ import os
 import json
 import time
 import shutil
-from logic.data_manager import DataManager
+from PyQt6.QtCore import QThreadPool
+from logic.data_manager import DataManager, SaveWorker
+from logic.note_store import note_store_dir_for
 
 class TestDataManager(unittest.TestCase):
     def setUp(self):
@@ -27,6 +29,7 @@ class TestDataManager(unittest.TestCase):
         if os.path.exists(self.test_filename + ".tmp"):
             try: os.remove(self.test_filename + ".tmp")
             except: pass
+        shutil.rmtree(note_store_dir_for(self.test_filename), ignore_errors=True)
 
     def test_default_data(self):
         data = self.dm.get_default_data()
@@ -93,6 +96,24 @@ class TestDataManager(unittest.TestCase):
         self.assertIn(today, self.dm.data["stats"]["history"])
         self.assertEqual(self.dm.data["stats"]["history"][today]["count"], 1)
 
+    def test_stats_version_and_index(self):
+        versions = []
+        self.dm.stats_changed.connect(versions.append)
+        start = self.dm.stats_version
+        self.dm.record_session(25)
+        self.dm.record_session(25, is_work=False)
+        self.dm.record_interruption("internal")
+        self.assertEqual(versions, [start + 1, start + 2])
+        
+        import datetime
+        today = datetime.date.today().isoformat()
+        self.assertEqual(self.dm.recent_history_dates(7), [today])
+        self.assertEqual(self.dm.interruptions_on(today), 1)
+        self.dm.data["stats"]["history"]["2020-01-01"] = {"minutes": 5, "count": 1}
+        self.dm.rebuild_stats_index()
+        self.assertEqual(self.dm.recent_history_dates(7), [today, "2020-01-01"])
+        self.assertEqual(self.dm.recent_history_dates(1), [today])
+
     def test_task_migration(self):
         # Create a file with old format (list of strings in "tasks")
         old_data = {
@@ -117,5 +138,112 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(new_dm.data["tasks"]["q2"][0]["content"], "Task 1")
         self.assertIn("id", new_dm.data["tasks"]["q2"][0])
 
+    def test_task_deltas(self):
+        self.dm.add_task("q1", "A")
+        self.dm.add_task("q1", {"id": "b", "content": "B", "pomodoros": 0})
+        self.dm.add_task("q1", {"id": "c", "content": "C", "pomodoros": 0}, row=0)
+        self.assertEqual([t["content"] for t in self.dm.get_tasks("q1")], ["C", "A", "B"])
+        
+        moved = self.dm.move_task("q1", 0, "q2", 0)
+        self.assertEqual(moved["id"], "c")
+        self.assertEqual([t["content"] for t in self.dm.get_tasks("q1")], ["A", "B"])
+        self.assertEqual([t["content"] for t in self.dm.get_tasks("q2")], ["C"])
+        
+        removed = self.dm.remove_task("q1", 1)
+        self.assertEqual(removed["id"], "b")
+        self.assertEqual(len(self.dm.get_tasks("q1")), 1)
+
+    def test_task_index_stays_in_sync(self):
+        def task(task_id):
+            return {"id": task_id, "content": task_id, "pomodoros": 0}
+        for task_id in ("a", "b", "c"):
+            self.dm.add_task("q1", task(task_id))
+        self.dm.add_task("q2", task("d"))
+        
+        def check():
+            # Every indexed position must point at the same record in the lists
+            for category, tasks in self.dm.data["tasks"].items():
+                for position, record in enumerate(tasks):
+                    self.assertEqual(self.dm.find_task(record["id"]), (category, position, record))
+        
+        check()
+        self.dm.move_task("q1", 0, "q2", 1)
+        check()
+        self.dm.move_task("q1", 1, "q1", 0)
+        check()
+        self.dm.add_task("q1", task("e"), row=0)
+        check()
+        self.assertEqual(self.dm.delete_task("b")["id"], "b")
+        self.assertIsNone(self.dm.find_task("b"))
+        check()
+        
+        self.assertEqual(self.dm.increment_task_pomodoros("a"), ("q2", 1))
+        self.assertEqual(self.dm.get_task("a")["pomodoros"], 1)
+        self.assertIsNone(self.dm.increment_task_pomodoros("missing"))
+
+    def test_note_bodies_are_externalized(self):
+        body = "复盘：" + "今天专注了四个番茄。" * 50
+        self.dm.update_notes([{"title": "日记", "content": body, "date": "2026-01-01"}])
+        note = self.dm.data["notes"][0]
+        self.assertNotIn("content", note)
+        self.assertTrue(note["summary"].startswith("复盘：今天专注"))
+        self.assertTrue(os.path.exists(self.dm.note_store.path_for(note["body"])))
+        self.assertEqual(self.dm.note_body(note), body)
+        
+        SaveWorker(self.dm.filename, self.dm.data, self.dm.key, None).run()
+        new_dm = DataManager(self.test_filename)
+        # Loading only reads the index; the body is read when the note is opened
+        self.assertEqual(new_dm.note_store.reads, 0)
+        self.assertEqual(new_dm.note_body(new_dm.data["notes"][0]), body)
+        self.assertEqual(new_dm.note_store.reads, 1)
+        # Bodies are stored encrypted
+        with open(new_dm.note_store.path_for(note["body"]), "rb") as f:
+            self.assertNotIn("番茄".encode("utf-8"), f.read())
+
+    def test_inline_notes_migrate_and_orphans_are_pruned(self):
+        old_data = {"notes": [{"title": "A", "content": "same", "date": "2026-01-01"},
+                              {"title": "B", "content": "same", "date": "2026-01-02"}]}
+        with open(self.test_filename, "w", encoding="utf-8") as f:
+            json.dump(old_data, f)
+        orphan = self.dm.note_store.put("deleted note")
+        
+        new_dm = DataManager(self.test_filename)
+        notes = new_dm.data["notes"]
+        self.assertTrue(all("content" not in note for note in notes))
+        # Identical bodies share one file
+        self.assertEqual(notes[0]["body"], notes[1]["body"])
+        self.assertEqual(os.listdir(new_dm.note_store.directory), [notes[0]["body"]])
+        self.assertNotEqual(orphan, notes[0]["body"])
+
+    def test_notes_by_id(self):
+        for note_id in ("a", "b", "c"):
+            self.dm.save_note({"id": note_id, "title": note_id, "content": note_id})
+        # Newest first, and the saved list follows the same order
+        self.assertEqual(self.dm.note_ids(), ["c", "b", "a"])
+        self.assertEqual([n["id"] for n in self.dm.data["notes"]], ["c", "b", "a"])
+        
+        # Editing keeps the note's place
+        self.dm.save_note({"id": "a", "title": "A2", "content": "new"})
+        self.assertEqual(self.dm.note_ids(), ["c", "b", "a"])
+        self.assertEqual(self.dm.get_note("a")["title"], "A2")
+        
+        self.assertEqual(self.dm.delete_note("b")["id"], "b")
+        self.assertIsNone(self.dm.delete_note("b"))
+        self.assertIsNone(self.dm.get_note("b"))
+        self.assertEqual([n["id"] for n in self.dm.notes()], ["c", "a"])
+        
+        # Let the background saves finish so none of them lands after ours
+        QThreadPool.globalInstance().waitForDone()
+        SaveWorker(self.dm.filename, self.dm.data, self.dm.key, None).run()
+        new_dm = DataManager(self.test_filename)
+        self.assertEqual(new_dm.note_ids(), ["c", "a"])
+        self.assertEqual(new_dm.note_body(new_dm.get_note("a")), "new")
+
+    def test_duplicate_note_ids_are_split(self):
+        self.dm.update_notes([{"id": "x", "title": "1", "content": ""},
+                              {"id": "x", "title": "2", "content": ""}])
+        self.assertEqual(len(self.dm.note_ids()), 2)
+        self.assertEqual(self.dm.get_note("x")["title"], "1")
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,46 @@
+import sys
+import os
+import json
+import tempfile
+import subprocess
+import unittest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+# Only needed by one page, dialog or optional feature
+DEFERRED = ("requests", "PyQt6.QtMultimedia", "logic.quote_worker", "ui.notes_model",
+            "ui.note_editor", "ui.heatmap", "ui.trend_chart", "logic.aggregation")
+
+SCRIPT = """
+import sys, json
+sys.path.insert(0, {src!r})
+from PyQt6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+from ui.main_window import MainWindow
+from logic.timer import PomodoroTimer
+deferred = {deferred!r}
+loaded = lambda: sorted(m for m in deferred if m in sys.modules)
+window = MainWindow(PomodoroTimer())
+window.data_manager.save_data = lambda: None
+window.noise_player.available
+startup = loaded()
+window.ensure_page(2)
+window.ensure_page(3)
+window.quote_worker.wait()
+print(json.dumps([startup, loaded()]))
+"""
+
+class TestDeferredImports(unittest.TestCase):
+    def test_startup_skips_single_use_modules(self):
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        with tempfile.TemporaryDirectory() as tmp:
+            result = subprocess.run([sys.executable, "-c", SCRIPT.format(src=SRC, deferred=DEFERRED)],
+                                    cwd=tmp, env=env, capture_output=True, text=True, timeout=120)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        startup, after_pages = json.loads(result.stdout.strip().splitlines()[-1])
+        self.assertEqual(startup, [])
+        for module in ("logic.quote_worker", "ui.notes_model", "ui.heatmap", "ui.trend_chart"):
+            self.assertIn(module, after_pages)
+
+if __name__ == '__main__':
+    unittest.main()
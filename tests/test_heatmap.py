@@ -0,0 +1,112 @@
+import sys
+import os
+import unittest
+import datetime
+import tempfile
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtGui import QColor
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.data_manager import DataManager
+from logic.heatmap import year_levels, _year_levels_python, level_for, days_in_year
+from ui.heatmap import YearHeatmap
+from ui.theme import engine
+
+HISTORY = {
+    "2024-01-01": {"minutes": 10, "count": 1},
+    "2024-02-29": {"minutes": 25, "count": 1},
+    "2024-12-31": {"minutes": 200, "count": 8},
+    "2023-06-01": {"minutes": 80, "count": 3},
+}
+
+class TestHeatmapLevels(unittest.TestCase):
+    def test_levels(self):
+        self.assertEqual([level_for(m) for m in (0, 1, 24, 25, 75, 149, 150, 999)],
+                         [0, 1, 1, 2, 3, 3, 4, 4])
+        levels = year_levels(HISTORY, 2024)
+        self.assertEqual(len(levels), days_in_year(2024))
+        self.assertEqual((levels[0], levels[59], levels[365]), (1, 2, 4))
+        self.assertEqual(sum(1 for level in levels if level), 3)
+
+    def test_fallback_matches(self):
+        days = [day for day in HISTORY if day.startswith("2024-")]
+        minutes = [HISTORY[day]["minutes"] for day in days]
+        self.assertEqual(_year_levels_python(2024, days, minutes), year_levels(HISTORY, 2024))
+
+class TestYearHeatmap(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dm = DataManager(os.path.join(self.tmp.name, "data.json"))
+        self.dm.data["stats"]["history"] = dict(HISTORY)
+        self.dm.rebuild_stats_index()
+        self.heatmap = YearHeatmap(self.dm)
+        self.heatmap.show()
+
+    def tearDown(self):
+        engine.apply(self.app, "light")
+        self.heatmap.close()
+        QThreadPool.globalInstance().waitForDone()
+        self.tmp.cleanup()
+
+    def paint(self):
+        self.heatmap.repaint()
+        self.app.processEvents()
+
+    def cell_color(self, year, day_index):
+        pixmap = self.heatmap._pixmaps[(year, engine.theme or "light", self.heatmap.devicePixelRatioF())]
+        center = self.heatmap.cell_rect(year, day_index).center()
+        return pixmap.toImage().pixelColor(center)
+
+    def test_year_pixmap_built_once(self):
+        self.heatmap.set_year(2024)
+        self.paint()
+        self.paint()
+        self.assertEqual(self.heatmap.pixmap_builds, 1)
+        self.heatmap.set_year(2023)
+        self.paint()
+        self.heatmap.set_year(2024)
+        self.paint()
+        self.assertEqual(self.heatmap.pixmap_builds, 2)
+        # A theme switch reaches the heatmap by itself
+        engine.apply(self.app, "dark")
+        self.app.processEvents()
+        self.assertEqual(self.heatmap.pixmap_builds, 3)
+        self.assertEqual(self.cell_color(2024, 365), QColor(engine.color("heatmap_level_4")))
+        engine.apply(self.app, "light")
+        self.paint()
+        self.assertEqual(self.heatmap.pixmap_builds, 3)
+
+    def test_session_repaints_only_todays_cell(self):
+        self.paint()
+        today = datetime.date.today()
+        day_index = (today - datetime.date(today.year, 1, 1)).days
+        self.assertEqual(self.cell_color(today.year, day_index), QColor(engine.color("heatmap_level_0")))
+
+        self.dm.record_session(30)
+        self.paint()
+        self.assertEqual(self.heatmap.pixmap_builds, 1)
+        self.assertEqual(self.heatmap.cell_updates, 1)
+        self.assertEqual(self.cell_color(today.year, day_index), QColor(engine.color("heatmap_level_2")))
+
+    def test_year_range_and_hit_test(self):
+        self.heatmap.set_year(1990)
+        self.assertEqual(self.heatmap.year, 2023) # Earliest year with history
+        self.heatmap.set_year(3000)
+        self.assertEqual(self.heatmap.year, datetime.date.today().year)
+        self.heatmap.set_year(2024)
+        rect = self.heatmap.cell_rect(2024, 59)
+        self.assertEqual(self.heatmap.day_at(rect.center()), datetime.date(2024, 2, 29))
+        self.assertIsNone(self.heatmap.day_at(rect.topLeft() - rect.topLeft()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import sys
+import os
+import unittest
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QSize, QThreadPool
+from PyQt6.QtGui import QIcon
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from ui.icons import IconRegistry, registry
+from ui.main_window import MainWindow
+from logic.timer import PomodoroTimer
+
+class TestIconRegistry(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def test_parsed_once_rasterized_per_size_and_dpr(self):
+        icons = IconRegistry()
+        icon = icons.icon("icon_play.svg")
+        self.assertIs(icons.icon("icon_play.svg"), icon)
+        icon.pixmap(QSize(32, 32))
+        icon.pixmap(QSize(32, 32))
+        self.assertEqual((icons.parses, icons.rasterizations), (1, 1))
+
+        pixmap = icon.pixmap(QSize(32, 32), 2.0)
+        self.assertEqual(pixmap.size(), QSize(64, 64))
+        icon.pixmap(QSize(16, 16))
+        self.assertEqual((icons.parses, icons.rasterizations), (1, 3))
+
+    def test_eviction(self):
+        icons = IconRegistry(cache_size=2)
+        for size in (16, 24, 32):
+            icons.pixmap("icon_stop.svg", size)
+        self.assertEqual(len(icons._pixmaps), 2)
+        icons.pixmap("icon_stop.svg", 32)
+        self.assertEqual(icons.rasterizations, 3)
+        icons.pixmap("icon_stop.svg", 16)
+        self.assertEqual(icons.rasterizations, 4)
+        self.assertEqual(icons.parses, 1)
+
+    def test_tinted_variant(self):
+        icons = IconRegistry()
+        image = icons.icon("icon_focus.svg", "#CFCFCF").pixmap(QSize(24, 24)).toImage()
+        opaque = {image.pixelColor(x, y).name() for x in range(24) for y in range(24)
+                  if image.pixelColor(x, y).alpha() == 255}
+        self.assertEqual(opaque, {"#cfcfcf"})
+        self.assertIsNot(icons.icon("icon_focus.svg", "#CFCFCF"), icons.icon("icon_focus.svg"))
+        self.assertEqual(icons.parses, 1)
+
+        disabled = icons.icon("icon_focus.svg").pixmap(QSize(24, 24), QIcon.Mode.Disabled)
+        self.assertFalse(disabled.isNull())
+
+    def test_toggle_timer_reuses_icons(self):
+        window = MainWindow(PomodoroTimer())
+        window.data_manager.save_data = lambda: None
+        parses = None
+        for _ in range(4):
+            window.toggle_timer()
+            window.start_btn.icon().pixmap(QSize(32, 32))
+            # The first play/pause pair parses each SVG (lazily); later toggles reuse them
+            if parses is None and not window.timer.is_running:
+                parses = registry.parses
+        window.timer.reset()
+        self.assertEqual(registry.parses, parses)
+        window.apply_theme("dark")
+        window.apply_theme("light")
+        self.assertEqual(registry.parses, parses)
+        QThreadPool.globalInstance().waitForDone()
+        window.close()
+
+if __name__ == '__main__':
+    unittest.main()
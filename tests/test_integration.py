@@ -65,6 +65,7 @@ class TestIntegration(unittest.TestCase):
         
         # Simulate work mode
         timer.current_mode = 'work'
+        window.ensure_page(4)
         window.work_mins_spin.setValue(25)
         
         # Simulate finish
@@ -89,6 +90,7 @@ class TestIntegration(unittest.TestCase):
         from PyQt6.QtWidgets import QLineEdit
         input_field = QLineEdit()
         input_field.setText("Focus Task")
+        window.ensure_page(1)
         window.add_kanban_task("q1", input_field)
         
         # Verify task added
@@ -114,6 +116,7 @@ class TestIntegration(unittest.TestCase):
         window.data_manager.filename = self.test_db
         
         # Change settings
+        window.ensure_page(4)
         window.work_mins_spin.setValue(50)
         window.break_mins_spin.setValue(10)
         
@@ -0,0 +1,181 @@
+import sys
+import os
+import unittest
+import tempfile
+from unittest.mock import patch
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import Qt, QPoint, QThreadPool
+from PyQt6.QtGui import QColor
+from PyQt6.QtTest import QTest
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.data_manager import DataManager
+from ui import icons
+from ui.widgets import KanbanList, KanbanDelegate
+from ui.theme import engine
+
+def make_tasks(n, prefix="t"):
+    return [{"id": f"{prefix}{i}", "content": f"Task {i}", "pomodoros": 0} for i in range(n)]
+
+class TestKanbanList(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dm = DataManager(os.path.join(self.tmp.name, "data.json"))
+        self.list = KanbanList(self.dm, "q1")
+        self.list.resize(400, 400)
+        self.list.set_tasks(make_tasks(3))
+        self.list.show()
+        QTest.qWaitForWindowExposed(self.list)
+
+    def tearDown(self):
+        self.list.close()
+        QThreadPool.globalInstance().waitForDone()
+        self.tmp.cleanup()
+
+    def ids(self, kanban_list):
+        return [t["id"] for t in kanban_list.tasks()]
+
+    def button_center(self, row, part):
+        rect = self.list.visualRect(self.list.item(row))
+        return self.list.delegate.button_rects(rect)[part].center()
+
+    def test_compatible_item_access(self):
+        self.assertEqual(self.list.count(), 3)
+        self.assertEqual(self.list.item(1).data(Qt.ItemDataRole.UserRole)["content"], "Task 1")
+        self.list.add_task_item({"id": "new", "content": "New", "pomodoros": 0})
+        self.assertEqual(self.list.count(), 4)
+        self.list.clear()
+        self.assertEqual(self.list.count(), 0)
+
+    def test_no_item_widgets(self):
+        self.assertIsNone(self.list.indexWidget(self.list.item(0)))
+
+    def test_delete_button_hit(self):
+        deleted = []
+        self.list.item_deleted.connect(lambda: deleted.append(True))
+        QTest.mouseClick(self.list.viewport(), Qt.MouseButton.LeftButton,
+                         pos=self.button_center(1, KanbanDelegate.DELETE))
+        self.assertEqual(deleted, [True])
+        self.assertEqual(self.ids(self.list), ["t0", "t2"])
+        self.assertEqual([t["id"] for t in self.dm.data["tasks"]["q1"]], ["t0", "t2"])
+
+    def test_focus_button_hit(self):
+        focused = []
+        self.list.focus_task.connect(focused.append)
+        QTest.mouseClick(self.list.viewport(), Qt.MouseButton.LeftButton,
+                         pos=self.button_center(2, KanbanDelegate.FOCUS))
+        self.assertEqual([t["id"] for t in focused], ["t2"])
+        self.assertEqual(self.list.count(), 3)
+
+    def test_click_outside_buttons_selects(self):
+        focused = []
+        self.list.focus_task.connect(focused.append)
+        rect = self.list.visualRect(self.list.item(0))
+        QTest.mouseClick(self.list.viewport(), Qt.MouseButton.LeftButton,
+                         pos=QPoint(rect.left() + 20, rect.center().y()))
+        self.assertEqual(focused, [])
+        self.assertEqual(self.list.currentIndex().row(), 0)
+
+    def test_move_within_list(self):
+        changes = []
+        self.list.order_changed.connect(lambda: changes.append(True))
+        self.assertTrue(self.list.move_from(self.list, 0, 3))
+        self.assertEqual(self.ids(self.list), ["t1", "t2", "t0"])
+        # Dropping a task onto its own position is a no-op
+        self.assertFalse(self.list.move_from(self.list, 1, 1))
+        self.assertEqual(changes, [True])
+
+    def test_move_between_lists(self):
+        other = KanbanList(self.dm, "q2")
+        other.set_tasks(make_tasks(2, prefix="o"))
+        self.list.move_from(other, 1, 1)
+        self.assertEqual(self.ids(self.list), ["t0", "o1", "t1", "t2"])
+        self.assertEqual(self.ids(other), ["o0"])
+
+    def test_move_is_single_delta(self):
+        # A drop goes through DataManager.move_task once, with no full rebuild
+        calls = []
+        original = self.dm.move_task
+        self.dm.move_task = lambda *args: calls.append(args) or original(*args)
+        self.dm.update_tasks = lambda *args: self.fail("board rebuilt the task dict")
+        other = KanbanList(self.dm, "q2")
+        other.set_tasks(make_tasks(1, prefix="o"))
+        self.list.move_from(other, 0, 3)
+        self.assertEqual(calls, [("q2", 0, "q1", 3)])
+        self.assertEqual([t["id"] for t in self.dm.data["tasks"]["q1"]], ["t0", "t1", "t2", "o0"])
+        self.assertEqual(self.dm.data["tasks"]["q2"], [])
+
+    def hidden(self, kanban_list):
+        return [t["id"] for row, t in enumerate(kanban_list.tasks()) if kanban_list.isRowHidden(row)]
+
+    def test_unfiltered_moves_do_not_touch_rows(self):
+        other = KanbanList(self.dm, "q2")
+        other.set_tasks(make_tasks(2, prefix="o"))
+        calls = []
+        self.list.setRowHidden = lambda *args: calls.append(args)
+        self.list.move_from(other, 0, 1)
+        self.list.move_from(self.list, 0, 3)
+        self.list.add_task_item({"id": "new", "content": "New", "pomodoros": 0})
+        self.list.set_filter(None)
+        self.assertEqual(calls, [])
+
+    def test_filter_follows_inserts_and_moves(self):
+        self.list.set_tasks(make_tasks(6))
+        self.list.set_filter({"t1", "t3", "o0"})
+        self.assertEqual(self.hidden(self.list), ["t0", "t2", "t4", "t5"])
+
+        other = KanbanList(self.dm, "q2")
+        other.set_tasks(make_tasks(2, prefix="o"))
+        self.list.move_from(other, 0, 2) # Matches
+        self.list.move_from(other, 0, 0) # Does not
+        self.assertEqual(self.hidden(self.list), ["o1", "t0", "t2", "t4", "t5"])
+
+        # Down and up within the column, then a removal
+        self.list.move_from(self.list, 2, 6)
+        self.list.move_from(self.list, 5, 0)
+        self.list.task_model.take_task(0)
+        self.assertEqual(self.hidden(self.list),
+                         [t["id"] for t in self.list.tasks() if t["id"] not in {"t1", "t3", "o0"}])
+
+        # Only a changed filter or a reset revisits every row
+        self.list.set_filter(None)
+        self.assertEqual(self.hidden(self.list), [])
+
+    def test_rows_follow_theme(self):
+        self.list.set_tasks([{"id": "p", "content": "Pomodoros", "pomodoros": 3}] + make_tasks(1))
+        self.list.delegate.hover = (0, KanbanDelegate.DELETE)
+        requested = []
+        icon = icons.icon
+
+        def recording_icon(name, color=None):
+            requested.append((name, color))
+            return icon(name, color)
+
+        engine.apply(self.app, "dark")
+        try:
+            with patch.object(icons, "icon", recording_icon):
+                image = self.list.viewport().grab().toImage()
+        finally:
+            engine.apply(self.app, "light")
+        # Inside the hover circle, beside the icon
+        inside = self.button_center(0, KanbanDelegate.DELETE) + QPoint(12, 0)
+        self.assertEqual(image.pixelColor(inside), QColor(engine.color("kanban_delete_hover", "dark")))
+        self.assertNotEqual(image.pixelColor(self.button_center(1, KanbanDelegate.DELETE) + QPoint(12, 0)),
+                            QColor(engine.color("kanban_delete_hover", "dark")))
+        self.assertEqual({color for name, color in requested}, {engine.color("icon_tint", "dark")})
+        pomodoro = QColor(engine.color("kanban_pomodoro", "dark"))
+        card = self.list.visualRect(self.list.item(0))
+        self.assertTrue(any(image.pixelColor(x, y) == pomodoro
+                            for x in range(card.left(), card.left() + 80) for y in range(card.top(), card.bottom())))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import sys
+import os
+import time
+import unittest
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QSize, QThreadPool
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from ui.main_window import MainWindow, PAGES
+from ui.theme import PALETTES
+from logic.timer import PomodoroTimer
+
+class TestLazyPages(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.window = MainWindow(PomodoroTimer())
+        self.window.data_manager.save_data = lambda: None
+
+    def tearDown(self):
+        QThreadPool.globalInstance().waitForDone()
+        self.window.apply_theme("light")
+        self.window.close()
+
+    def test_only_timer_page_built(self):
+        self.assertEqual(set(self.window.pages), {0})
+        self.assertEqual(self.window.content_stack.count(), len(PAGES))
+
+        self.window.data_manager.data["tasks"]["q2"].append({"id": "t1", "content": "Lazy", "pomodoros": 0})
+        self.window.switch_page(1)
+        self.assertEqual(set(self.window.pages), {0, 1})
+        self.assertIs(self.window.content_stack.currentWidget(), self.window.pages[1])
+        self.assertEqual(self.window.content_stack.count(), len(PAGES))
+        self.assertEqual([t["id"] for t in self.window.kanban_cols["q2"].tasks()], ["t1"])
+
+    def test_ensure_page_builds_in_background(self):
+        self.window.data_manager.data["settings"]["work_mins"] = 40
+        self.assertFalse(hasattr(self.window, "work_mins_spin"))
+        self.window.ensure_page(4)
+        self.assertEqual(self.window.work_mins_spin.value(), 40)
+        self.assertEqual(set(self.window.pages), {0, 4})
+        # Building a page in the background keeps the visible one
+        self.assertEqual(self.window.content_stack.currentIndex(), 0)
+
+    def test_auto_hide_without_settings_page(self):
+        self.window.show()
+        self.window.sidebar.setFixedWidth(85)
+        self.window.toggle_timer()
+        self.assertEqual(self.window.anim_min.endValue(), 0)
+        self.window.timer.reset()
+        self.assertFalse(self.window.is_page_built(4))
+
+        # The checkbox applies straight away, before 保存设置
+        self.window.ensure_page(4)
+        self.window.auto_hide_sidebar_toggle.setChecked(False)
+        self.assertFalse(self.window.auto_hide_sidebar)
+
+    def test_prebuilt_after_first_frame(self):
+        self.window.show()
+        deadline = time.monotonic() + 5
+        while len(self.window.pages) < len(PAGES) and time.monotonic() < deadline:
+            QApplication.processEvents()
+        self.assertEqual(len(self.window.pages), len(PAGES))
+        self.assertEqual(self.window.content_stack.currentIndex(), 0)
+
+    def test_late_page_follows_theme(self):
+        self.window.apply_theme("dark")
+        self.window.ensure_page(4)
+        stepper = self.window.work_mins_spin.minus_btn
+        image = stepper.icon().pixmap(QSize(32, 32)).toImage()
+        opaque = {image.pixelColor(x, y).name() for x in range(32) for y in range(32)
+                  if image.pixelColor(x, y).alpha() == 255}
+        self.assertEqual(opaque, {PALETTES["dark"]["icon_tint"].lower()})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import sys
+import os
+import array
+import unittest
+from unittest import mock
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QIODevice
+from logic.noise import generate_noise, LoopDevice, NoisePlayer, SAMPLE_RATE
+from logic.timer import PomodoroTimer
+
+class TestNoiseGeneration(unittest.TestCase):
+    def check_loop(self, pcm, seconds):
+        samples = array.array("h")
+        samples.frombytes(pcm)
+        self.assertEqual(len(samples), int(seconds * SAMPLE_RATE))
+        self.assertGreater(max(samples), 0)
+        # Seam between the last and first sample must not be a click
+        typical_step = sum(abs(samples[i + 1] - samples[i]) for i in range(2000)) / 2000
+        self.assertLessEqual(abs(samples[0] - samples[-1]), typical_step * 6 + 1)
+
+    def test_all_kinds(self):
+        for kind in ("white", "pink", "brown"):
+            self.check_loop(generate_noise(kind, seconds=1, seed=42), 1)
+
+    def test_pure_python_fallback(self):
+        with mock.patch.dict(sys.modules, {"numpy": None}):
+            for kind in ("white", "pink", "brown"):
+                self.check_loop(generate_noise(kind, seconds=1, seed=42), 1)
+
+    def test_unknown_kind(self):
+        with self.assertRaises(ValueError):
+            generate_noise("purple")
+
+    def test_loop_device_wraps(self):
+        pcm = bytes(range(10))
+        device = LoopDevice(pcm)
+        device.open(QIODevice.OpenModeFlag.ReadOnly)
+        self.assertEqual(device.readData(8), pcm[:8])
+        self.assertEqual(device.readData(8), pcm[8:] + pcm[:6])
+
+class TestNoisePlayer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.timer = PomodoroTimer()
+        self.player = NoisePlayer(self.timer, enabled=True)
+
+    def tearDown(self):
+        self.player.stop()
+
+    def test_plays_only_during_running_work(self):
+        self.assertFalse(self.player.should_play())
+        self.timer.start()
+        self.assertTrue(self.player.should_play())
+        self.timer.pause()
+        self.assertFalse(self.player.should_play())
+
+    def test_break_stops_noise(self):
+        self.timer.start()
+        self.timer.skip()
+        self.assertEqual(self.timer.current_mode, 'break')
+        self.assertFalse(self.player.is_playing)
+
+    def test_buffer_cached(self):
+        first = self.player.get_buffer("white")
+        self.assertIs(first, self.player.get_buffer("white"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import sys
+import os
+import unittest
+import tempfile
+from unittest.mock import patch
+from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtWidgets import QApplication, QPlainTextEdit
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtTest import QTest
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.data_manager import DataManager
+from ui.note_editor import NoteEditorDialog
+
+class TestNoteEditor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dm = DataManager(os.path.join(self.tmp.name, "data.json"))
+        self.dm.save_note({"id": "n1", "title": "周会", "content": "原始内容", "date": "2026-01-01"})
+        QThreadPool.globalInstance().waitForDone()
+        self.saves = []
+        original = self.dm.save_data
+        self.dm.save_data = lambda: self.saves.append(True) or original()
+
+    def tearDown(self):
+        QThreadPool.globalInstance().waitForDone()
+        self.tmp.cleanup()
+
+    def open_editor(self, note_id=None, **kwargs):
+        dialog = NoteEditorDialog(self.dm, self.dm.get_note(note_id), **kwargs)
+        dialog.autosave_timer.setInterval(10)
+        return dialog
+
+    def type_text(self, dialog, text):
+        dialog.content_edit.moveCursor(QTextCursor.MoveOperation.End)
+        for char in text:
+            dialog.content_edit.insertPlainText(char) # One textChanged per keystroke
+        QTest.qWait(50)
+
+    def test_plain_text_editor_loads_body(self):
+        dialog = self.open_editor("n1")
+        self.assertIsInstance(dialog.content_edit, QPlainTextEdit)
+        self.assertEqual(dialog.content_edit.toPlainText(), "原始内容")
+
+    def test_typing_autosaves_draft_only(self):
+        dialog = self.open_editor("n1")
+        self.type_text(dialog, "abc")
+        draft = self.dm.note_drafts.load("n1")
+        self.assertEqual(draft["content"], "原始内容abc")
+        # Keystrokes within the quiet period are coalesced into one write
+        self.assertEqual(self.dm.note_drafts.writes, 1)
+        # The main data file is untouched until the note is saved
+        self.assertEqual(self.saves, [])
+        self.assertEqual(self.dm.note_body(self.dm.data["notes"][0]), "原始内容")
+
+    def test_save_commits_one_note_and_drops_draft(self):
+        self.dm.save_note({"id": "n2", "title": "其他", "content": "x", "date": "2026-01-02"})
+        self.saves.clear()
+        dialog = self.open_editor("n1")
+        self.type_text(dialog, "!")
+        dialog.save()
+        self.assertEqual(self.saves, [True])
+        self.assertIsNone(self.dm.note_drafts.load("n1"))
+        self.assertEqual([n["id"] for n in self.dm.data["notes"]], ["n2", "n1"])
+        self.assertEqual(self.dm.note_body(dialog.saved_note), "原始内容!")
+
+    def test_new_note_is_inserted_first(self):
+        dialog = self.open_editor()
+        dialog.title_edit.setText("新的")
+        dialog.save()
+        self.assertEqual(self.dm.data["notes"][0]["title"], "新的")
+        self.assertEqual(len(self.dm.data["notes"]), 2)
+
+    def test_draft_recovered_after_crash(self):
+        dialog = self.open_editor("n1")
+        self.type_text(dialog, "未保存")
+        # Simulate a crash: the dialog goes away without save or cancel
+        dialog.autosave_timer.stop()
+        del dialog
+
+        restored = self.open_editor("n1")
+        self.assertEqual(restored.content_edit.toPlainText(), "原始内容未保存")
+        self.assertTrue(restored.draft_label.text().startswith("已恢复"))
+
+    def test_unsaved_new_note_is_pending(self):
+        dialog = self.open_editor()
+        self.type_text(dialog, "灵感")
+        pending = self.dm.note_drafts.pending()
+        self.assertEqual([d["note_id"] for d in pending], [dialog.note_id])
+
+        restored = self.open_editor(draft=pending[0])
+        self.assertEqual(restored.note_id, dialog.note_id)
+        restored.save()
+        self.assertEqual(self.dm.data["notes"][0]["id"], dialog.note_id)
+        self.assertEqual(self.dm.note_drafts.pending(), [])
+
+    def reject_answering(self, dialog, answer):
+        with patch.object(QMessageBox, "question", return_value=answer) as question:
+            dialog.reject()
+        return question.called
+
+    def test_cancel_discards_draft(self):
+        dialog = self.open_editor("n1")
+        self.type_text(dialog, "x")
+        self.assertTrue(self.reject_answering(dialog, QMessageBox.StandardButton.Yes))
+        self.assertIsNone(self.dm.note_drafts.load("n1"))
+        self.assertEqual(self.dm.note_body(self.dm.data["notes"][0]), "原始内容")
+
+    def test_cancel_can_keep_unsaved_text_as_draft(self):
+        dialog = self.open_editor("n1")
+        # Cancel straight after typing, before the autosave fires
+        dialog.content_edit.moveCursor(QTextCursor.MoveOperation.End)
+        dialog.content_edit.insertPlainText("还没写完")
+        self.assertTrue(self.reject_answering(dialog, QMessageBox.StandardButton.No))
+        self.assertEqual(self.dm.note_drafts.load("n1")["content"], "原始内容还没写完")
+        self.assertEqual([d["note_id"] for d in self.dm.note_drafts.pending()], ["n1"])
+        self.assertEqual(self.dm.note_body(self.dm.data["notes"][0]), "原始内容")
+
+    def test_cancel_without_changes_does_not_ask(self):
+        dialog = self.open_editor("n1")
+        self.assertFalse(self.reject_answering(dialog, QMessageBox.StandardButton.No))
+        self.assertIsNone(self.dm.note_drafts.load("n1"))
+
+    def test_cancel_restored_draft_asks(self):
+        self.dm.note_drafts.save("n1", "周会", "草稿内容")
+        dialog = self.open_editor("n1")
+        self.assertTrue(self.reject_answering(dialog, QMessageBox.StandardButton.No))
+        self.assertEqual(self.dm.note_drafts.load("n1")["content"], "草稿内容")
+
+if __name__ == '__main__':
+    unittest.main()
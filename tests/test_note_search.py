@@ -0,0 +1,285 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch
+from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtCore import QThreadPool
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.note_search import NoteSearcher
+from logic.search_index import SearchIndex, tokenize, query_terms
+from ui.main_window import MainWindow
+from logic.timer import PomodoroTimer
+
+NOTES = [
+    {"id": "n0", "title": "周会记录", "content": "讨论番茄钟发布计划", "date": "2026-01-01"},
+    {"id": "n1", "title": "Reading", "content": "Deep Work chapter 2", "date": "2026-01-02"},
+    {"id": "n2", "title": "灵感", "content": "番茄工作法 + 白噪音", "date": "2026-01-03"},
+    {"id": "n3", "title": "Groceries", "content": "tea, milk", "date": "2026-01-04"},
+]
+
+class TestSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = SearchIndex()
+        for note in NOTES:
+            self.index.add(("note", note["id"]), note["content"], note["title"])
+
+    def ids(self, query, **kwargs):
+        return [key[1] for key, score in self.index.search(query, **kwargs)]
+
+    def test_tokenize_cjk_ngrams_and_words(self):
+        self.assertEqual(tokenize("番茄钟"), ["番", "茄", "钟", "番茄", "茄钟", "番茄钟"])
+        self.assertEqual(tokenize("Deep Work!"), ["deep", "work"])
+        self.assertEqual(query_terms("番茄工作"), [("番茄工", False), ("茄工作", False)])
+        self.assertEqual(query_terms("wor"), [("wor", True)])
+        self.assertEqual(query_terms(" + "), [])
+
+    def test_cjk_queries_of_any_length(self):
+        self.assertEqual(sorted(self.ids("番")), ["n0", "n2"])
+        self.assertEqual(sorted(self.ids("番茄")), ["n0", "n2"])
+        self.assertEqual(self.ids("番茄工作法"), ["n2"])
+        self.assertEqual(self.ids("番工"), [])
+
+    def test_latin_prefix_and_all_terms_required(self):
+        self.assertEqual(self.ids("wor"), ["n1"])
+        self.assertEqual(self.ids("deep chap"), ["n1"])
+        self.assertEqual(self.ids("deep milk"), [])
+
+    def test_bm25_ranks_title_and_frequency_higher(self):
+        self.index.add(("note", "t"), "其他内容", "番茄")
+        self.index.add(("note", "f"), "番茄番茄番茄")
+        ranked = self.ids("番茄")
+        self.assertEqual(set(ranked[:2]), {"t", "f"})
+        self.assertEqual(set(ranked[2:]), {"n0", "n2"})
+
+    def test_incremental_updates(self):
+        self.index.add(("note", "n3"), "coffee")
+        self.assertEqual(self.ids("tea"), [])
+        self.assertEqual(self.ids("coffee"), ["n3"])
+        self.index.remove(("note", "n3"))
+        self.assertEqual(self.ids("coffee"), [])
+        self.assertEqual(len(self.index), 3)
+
+    def test_sync_and_kinds(self):
+        self.index.sync("task", [("a", "", "写番茄报告"), ("b", "", "buy tea")])
+        self.assertEqual(sorted(self.ids("番茄")), ["a", "n0", "n2"])
+        self.assertEqual(self.ids("番茄", kind="task"), ["a"])
+        self.index.sync("task", [("b", "", "buy tea")])
+        self.assertNotIn(("task", "a"), self.index)
+        self.assertEqual(self.ids("tea", kind="note"), ["n3"])
+
+    def test_kana_hangul_and_other_scripts(self):
+        self.index.add(("note", "ja"), "カタカナのメモ")
+        self.index.add(("note", "ko"), "한국어 공부")
+        self.index.add(("note", "ru"), "Привет, мир")
+        self.index.add(("note", "fr"), "Un café noir")
+        self.assertEqual(query_terms("한국어"), [("한국어", False)])
+        self.assertEqual(self.ids("カタカナ"), ["ja"])
+        self.assertEqual(self.ids("ｶﾀｶﾅ"), ["ja"]) # Half-width kana
+        self.assertEqual(self.ids("한국"), ["ko"])
+        self.assertEqual(self.ids("прив"), ["ru"])
+        # Accents are folded on both sides
+        self.assertEqual(self.ids("cafe"), ["fr"])
+        self.assertEqual(self.ids("CAFÉ"), ["fr"])
+        self.assertEqual(self.ids("cafe\u0301"), ["fr"])
+
+    def test_query_without_terms_matches_substring(self):
+        self.assertEqual(query_terms("+"), [])
+        self.assertEqual(self.ids(" + "), ["n2"])
+        self.assertEqual(self.ids("+", candidates={("note", "n0"), ("note", "n2")}), ["n2"])
+        self.assertEqual(self.ids("+", kind="task"), [])
+        self.assertEqual(self.ids("#"), [])
+        self.assertEqual(self.ids("  "), [])
+
+    def test_candidates_shrink_intersection(self):
+        for i in range(500):
+            self.index.add(("note", f"r{i}"), f"weekly report {i}")
+        self.index.docs_examined = 0
+        self.assertEqual(len(self.ids("weekly report")), 500)
+        full = self.index.docs_examined
+
+        self.index.docs_examined = 0
+        candidates = {("note", "r3"), ("note", "r7"), ("note", "n3")}
+        self.assertEqual(sorted(self.ids("weekly report", candidates=candidates)), ["r3", "r7"])
+        # Only the candidates are looked up in each posting list
+        self.assertLessEqual(self.index.docs_examined, 2 * len(candidates))
+        self.assertGreaterEqual(full, 1000)
+
+class TestNoteSearcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.searcher = NoteSearcher(debounce_ms=10)
+        self.searcher.set_notes(NOTES)
+        self.results = []
+        self.searcher.results_ready.connect(lambda query, matches: self.results.append((query, matches)))
+
+    def wait(self):
+        self.searcher.thread_pool.waitForDone()
+        self.app.processEvents()
+
+    def test_search_matches_title_and_content(self):
+        self.searcher.search_now("番茄")
+        self.wait()
+        self.assertEqual(self.results[-1][0], "番茄")
+        self.assertEqual(sorted(self.results[-1][1]), ["n0", "n2"])
+        self.searcher.search_now("DEEP")
+        self.wait()
+        self.assertEqual(self.results[-1][1], ("n1",))
+        self.searcher.search_now("Groceries")
+        self.wait()
+        self.assertEqual(self.results[-1][1], ("n3",))
+
+    def test_empty_query_clears_filter(self):
+        self.searcher.search_now("")
+        self.searcher.search_now("  ")
+        self.assertEqual(self.results, [("", None), ("  ", None)])
+
+    def test_punctuation_query_filters_by_substring(self):
+        self.searcher.search_now("+")
+        self.wait()
+        self.assertEqual(self.results[-1], ("+", ("n2",)))
+        # Adding a word is not narrowed from the substring matches
+        self.searcher.search_now("+tea")
+        self.wait()
+        self.assertEqual(self.searcher.narrowed_searches, 0)
+        self.assertEqual(self.results[-1], ("+tea", ("n3",)))
+
+    def test_cache_and_narrowing(self):
+        self.searcher.search_now("番茄")
+        self.wait()
+        self.searcher.search_now("番茄工")
+        self.wait()
+        self.assertEqual(self.searcher.narrowed_searches, 1)
+        self.assertEqual(self.results[-1][1], ("n2",))
+
+        # Deleting back to a previous query is served from the cache
+        self.searcher.search_now("番茄")
+        self.assertEqual(self.searcher.cache_hits, 1)
+        self.assertEqual(sorted(self.results[-1][1]), ["n0", "n2"])
+
+    def test_narrowed_search_examines_cached_matches_only(self):
+        self.searcher.set_notes(NOTES + [{"id": f"w{i}", "title": "", "content": f"weekly {i}"}
+                                         for i in range(300)] + [{"id": "wr", "title": "", "content": "weekly report"}])
+        self.searcher.search_now("weekly")
+        self.wait()
+        self.assertGreaterEqual(self.searcher.index.docs_examined, 300)
+        self.searcher.search_now("rep")
+        self.wait()
+        self.searcher.index.docs_examined = 0
+        self.searcher.search_now("report weekly")
+        self.wait()
+        self.assertEqual(self.searcher.narrowed_searches, 1)
+        self.assertEqual(self.results[-1][1], ("wr",))
+        # The 300 documents holding "weekly" are never walked
+        self.assertLessEqual(self.searcher.index.docs_examined, 2)
+
+    def test_debounce_runs_last_query_only(self):
+        for query in ("t", "te", "tea"):
+            self.searcher.search(query)
+        self.assertEqual(self.results, [])
+        while not self.results:
+            self.app.processEvents()
+            self.wait()
+        self.assertEqual(self.results, [("tea", ("n3",))])
+
+    def test_notes_change_invalidates_cache(self):
+        self.searcher.search_now("tea")
+        self.wait()
+        self.searcher.set_notes(NOTES[:3])
+        self.wait()
+        self.assertEqual(self.results[-1], ("tea", ()))
+
+    def test_edited_note_is_reindexed(self):
+        notes = [dict(n) for n in NOTES]
+        notes[3]["content"] = "coffee"
+        self.searcher.set_notes(notes)
+        self.searcher.search_now("coffee")
+        self.wait()
+        self.assertEqual(self.results[-1][1], ("n3",))
+        self.assertEqual(self.searcher.index.search("tea"), [])
+
+class TestNotesPage(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.window = MainWindow(PomodoroTimer())
+        # Keep the real data file untouched: notes are swapped in memory only
+        self.window.data_manager.save_data = lambda: None
+        self.window.data_manager.data["notes"] = [dict(n) for n in NOTES]
+        self.window.data_manager.rebuild_note_index()
+        self.window.refresh_notes_table()
+
+    def tearDown(self):
+        QThreadPool.globalInstance().waitForDone()
+        self.window.close()
+
+    def test_filter_maps_back_to_note_ids(self):
+        self.assertEqual(self.window.notes_proxy.rowCount(), 4)
+        self.window.refresh_notes_table("番茄")
+        self.window.note_searcher.thread_pool.waitForDone()
+        self.app.processEvents()
+
+        proxy = self.window.notes_proxy
+        self.assertEqual(proxy.rowCount(), 2)
+        ids = [self.window.note_id_at(proxy.index(row, 0)) for row in range(proxy.rowCount())]
+        self.assertEqual(sorted(ids), ["n0", "n2"])
+        self.assertEqual(proxy.index(ids.index("n2"), 1).data(), "番茄工作法 + 白噪音")
+
+        # Clearing the search restores list order
+        self.window.refresh_notes_table("")
+        self.assertEqual(proxy.rowCount(), 4)
+        self.assertEqual(self.window.note_id_at(proxy.index(3, 0)), "n3")
+
+    def test_filter_survives_rows_shifting(self):
+        self.window.refresh_notes_table("番茄")
+        self.window.note_searcher.thread_pool.waitForDone()
+        self.app.processEvents()
+        proxy = self.window.notes_proxy
+
+        # A new note goes first and shifts every source row; until the query
+        # reruns the same notes stay visible
+        self.window.data_manager.save_note({"id": "n4", "title": "Coffee", "content": "beans"})
+        self.window.refresh_notes_table()
+        ids = [self.window.note_id_at(proxy.index(row, 0)) for row in range(proxy.rowCount())]
+        self.assertEqual(sorted(ids), ["n0", "n2"])
+
+    def test_delete_by_id_while_filtered(self):
+        self.window.refresh_notes_table("番茄")
+        self.window.note_searcher.thread_pool.waitForDone()
+        self.app.processEvents()
+        with patch.object(QMessageBox, "question", return_value=QMessageBox.StandardButton.Yes):
+            self.window.delete_note("n2")
+        self.assertIsNone(self.window.data_manager.get_note("n2"))
+        self.assertEqual(self.window.data_manager.note_ids(), ["n0", "n1", "n3"])
+
+    def test_task_search_filters_kanban(self):
+        self.window.ensure_page(1)
+        col = self.window.kanban_cols["q1"]
+        saved = list(col.tasks())
+        col.set_tasks([{"id": "k0", "content": "写番茄报告", "pomodoros": 0},
+                       {"id": "k1", "content": "buy tea", "pomodoros": 0}])
+        self.window.refresh_task_search()
+        self.window.task_searcher.search_now("番茄")
+        self.window.task_searcher.thread_pool.waitForDone()
+        self.app.processEvents()
+        self.assertFalse(col.isRowHidden(0))
+        self.assertTrue(col.isRowHidden(1))
+        self.window.task_searcher.search_now("")
+        self.assertFalse(col.isRowHidden(1))
+        col.set_tasks(saved)
+
+if __name__ == '__main__':
+    unittest.main()
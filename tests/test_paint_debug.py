@@ -0,0 +1,119 @@
+import sys
+import os
+import time
+import tempfile
+import unittest
+from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
+from PyQt6.QtCore import QThreadPool
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.data_manager import DataManager
+from ui.paint_debug import PaintProfiler, ENV_VAR, FLASH_MS
+from ui.widgets import CircularProgressBar, KanbanList, SmoothButton
+
+def wait(ms):
+    deadline = time.monotonic() + ms / 1000
+    while time.monotonic() < deadline:
+        QApplication.processEvents()
+
+class TestPaintProfiler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.window = QWidget()
+        self.window.resize(500, 600)
+        layout = QVBoxLayout(self.window)
+        self.ring = CircularProgressBar()
+        self.ring.set_max_value(60)
+        self.ring.value = 60
+        self.button = SmoothButton("开始")
+        layout.addWidget(self.ring)
+        layout.addWidget(self.button)
+        self.window.show()
+        QApplication.processEvents()
+
+    def tearDown(self):
+        self.window.close()
+
+    def test_from_environment(self):
+        self.assertIsNone(PaintProfiler.from_environment({}))
+        self.assertIsNone(PaintProfiler.from_environment({ENV_VAR: "0"}))
+        profiler = PaintProfiler.from_environment({ENV_VAR: "1"})
+        self.assertEqual((profiler.log, profiler.overlay), (True, False))
+        profiler = PaintProfiler.from_environment({ENV_VAR: "overlay"})
+        self.assertEqual((profiler.log, profiler.overlay), (False, True))
+        profiler = PaintProfiler.from_environment({ENV_VAR: "log,overlay"})
+        self.assertEqual((profiler.log, profiler.overlay), (True, True))
+
+    def test_counts_and_times_paints(self):
+        paint_event = CircularProgressBar.paintEvent
+        with PaintProfiler() as profiler:
+            self.ring.value = 30
+            self.button.update()
+            QApplication.processEvents()
+        # Instrumentation is gone once stopped
+        self.assertIs(CircularProgressBar.paintEvent, paint_event)
+
+        rows = {row["widget"]: row for row in profiler.report()}
+        self.assertGreaterEqual(rows["CircularProgressBar"]["paints"], 1)
+        self.assertGreaterEqual(rows["CircularProgressBar"]["timed_calls"], 1)
+        self.assertGreater(rows["CircularProgressBar"]["max_ms"], 0)
+        self.assertGreaterEqual(rows["SmoothButton"]["paints"], 1)
+        # Only the moved arc was repainted
+        self.assertLess(rows["CircularProgressBar"]["pixels"], self.ring.width() * self.ring.height())
+
+        # Nothing is recorded while stopped
+        self.ring.value = 10
+        QApplication.processEvents()
+        self.assertEqual(profiler.report(), list(rows.values()))
+
+    def test_kanban_rows_are_counted(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            dm = DataManager(os.path.join(tmp, "data.json"))
+            kanban = KanbanList(dm, "q1")
+            kanban.resize(400, 400)
+            kanban.set_tasks([{"id": f"t{i}", "content": f"Task {i}", "pomodoros": 0} for i in range(3)])
+            with PaintProfiler() as profiler:
+                kanban.show()
+                QApplication.processEvents()
+            kanban.close()
+            QThreadPool.globalInstance().waitForDone()
+        counts = profiler.paint_counts()
+        self.assertGreaterEqual(counts["KanbanList.viewport"], 1)
+        self.assertEqual(counts["KanbanDelegate"], 3)
+
+    def test_overlay_flashes_and_settles(self):
+        with PaintProfiler(overlay=True) as profiler:
+            profiler.watch(self.window)
+            overlay = profiler._overlays[self.window]
+            # Let the overlay's own first repaint go by
+            wait(50)
+            self.ring.value = 30
+            QApplication.processEvents()
+            self.assertTrue(overlay.flashes)
+
+            wait(FLASH_MS * 2)
+            self.assertEqual(overlay.flashes, [])
+            self.assertFalse(overlay._fade_timer.isActive())
+            # The overlay's own repaints are not reported back as new flashes
+            settled = profiler.paint_counts()
+            wait(100)
+            self.assertEqual(profiler.paint_counts(), settled)
+
+    def test_log_summary(self):
+        with PaintProfiler() as profiler:
+            self.ring.value = 30
+            QApplication.processEvents()
+        with self.assertLogs(level="INFO") as logs:
+            profiler.log_summary()
+        self.assertIn("CircularProgressBar", logs.output[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import sys
+import os
+import unittest
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import QTimer
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.timer import PomodoroTimer
+from logic.power import PowerManager
+
+class TestPowerManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.timer = PomodoroTimer()
+        self.timer.set_sound_enabled(False)
+        self.window_a = QWidget()
+        self.window_b = QWidget()
+        self.window_a.show()
+        self.ui_timer = QTimer()
+        self.ui_timer.setInterval(50)
+        self.ui_timer.start()
+
+        self.power = PowerManager(self.timer, [self.window_a, self.window_b])
+        self.power.register_timer(self.ui_timer)
+        self.app.processEvents()
+
+    def tearDown(self):
+        self.timer.pause()
+        self.ui_timer.stop()
+        self.window_a.close()
+        self.window_b.close()
+
+    def test_enters_low_power_when_all_hidden(self):
+        self.timer.start()
+        self.assertFalse(self.power.low_power)
+
+        self.window_a.hide()
+        self.app.processEvents()
+        self.assertTrue(self.power.low_power)
+        self.assertFalse(self.timer.timer.isActive())
+        self.assertFalse(self.ui_timer.isActive())
+        # The session deadline stays armed
+        self.assertTrue(self.timer.scheduler._wakeup.isActive())
+
+    def test_switching_windows_does_not_enter_low_power(self):
+        changes = []
+        self.power.low_power_changed.connect(changes.append)
+        self.window_a.hide()
+        self.window_b.show()
+        self.app.processEvents()
+        self.assertFalse(self.power.low_power)
+        self.assertEqual(changes, [])
+
+    def test_resume_delivers_immediate_tick(self):
+        received = []
+        self.timer.dispatcher.subscribe("sub", received.append)
+        self.timer.start()
+        self.window_a.hide()
+        self.app.processEvents()
+
+        # Ticks while suspended are not fanned out
+        self.timer.tick.emit(1000)
+        self.assertEqual(received, [])
+
+        self.window_a.show()
+        self.app.processEvents()
+        self.assertFalse(self.power.low_power)
+        self.assertTrue(self.timer.timer.isActive())
+        self.assertTrue(self.ui_timer.isActive())
+        self.assertEqual(len(received), 1)
+
+    def test_start_in_low_power_keeps_display_stopped(self):
+        self.window_a.hide()
+        self.app.processEvents()
+        self.timer.start()
+        self.assertFalse(self.timer.timer.isActive())
+        self.assertTrue(self.timer.scheduler.has_timer(PomodoroTimer.SESSION_TIMER))
+
+        self.timer.pause()
+        self.assertLessEqual(self.timer.remaining_seconds, 25 * 60)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import sys
+import os
+import time
+import unittest
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QRect
+from PyQt6.QtGui import QColor
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from ui.widgets import CircularProgressBar, SMOOTH_MAX_FPS
+from ui.main_window import MainWindow
+from logic.timer import PomodoroTimer
+
+class TestProgressRing(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.ring = CircularProgressBar()
+        self.ring.resize(400, 400)
+        self.ring.set_color("#FF0000")
+        self.ring.set_bg_color("#00FF00")
+        self.ring.set_max_value(1500)
+        self.ring.value = 1500
+        self.ring.show()
+        QApplication.processEvents()
+
+    def tearDown(self):
+        self.ring.close()
+
+    def record_updates(self):
+        updates = []
+        self.ring.update = lambda *args: updates.append(args)
+        return updates
+
+    def test_track_rendered_once_per_size_and_theme(self):
+        for value in range(1500, 1400, -1):
+            self.ring.value = value
+            self.ring.repaint()
+        self.assertEqual(self.ring.ring_builds, 1)
+
+        self.ring.set_bg_color("#333333")
+        self.ring.repaint()
+        self.assertEqual(self.ring.ring_builds, 2)
+        # The previous theme is still cached
+        self.ring.set_bg_color("#00FF00")
+        self.ring.repaint()
+        self.assertEqual(self.ring.ring_builds, 2)
+
+        self.ring.resize(500, 500)
+        self.ring.repaint()
+        self.assertEqual(self.ring.ring_builds, 3)
+
+    def test_value_change_invalidates_arc_end_only(self):
+        updates = self.record_updates()
+        self.ring.value = 1499
+        self.assertEqual(len(updates), 1)
+        rect = updates[0][0]
+        # A second of a 25 minute session: a small box around the top of the ring
+        self.assertLess(rect.width() * rect.height(), 40 * 40)
+        self.assertTrue(rect.contains(200, 10))
+
+        # Unchanged values repaint nothing
+        self.ring.value = 1499
+        self.assertEqual(len(updates), 1)
+
+    def test_arc_rect_covers_circle_extremes(self):
+        # From three o'clock round to the top: the bottom and left extremes lie in between
+        rect = self.ring._arc_rect(0.25, 1.0)
+        self.assertTrue(rect.contains(QRect(0, 0, 400, 400).adjusted(10, 10, -10, -10)))
+        quarter = self.ring._arc_rect(0.0, 0.25)
+        self.assertLess(quarter.bottom(), 200 + 15)
+        self.assertGreater(quarter.left(), 200 - 15)
+
+    def test_paints_arc_and_track(self):
+        self.ring.value = 750
+        image = self.ring.grab().toImage()
+        # Right side (a quarter in) still to go, left side (three quarters in) done
+        self.assertEqual(image.pixelColor(390, 200), QColor("#FF0000"))
+        self.assertEqual(image.pixelColor(10, 200), QColor("#00FF00"))
+
+    def test_smooth_mode_glides_short_steps(self):
+        self.ring.set_smooth(True)
+        self.ring.set_max_value(60)
+        self.ring.value = 60
+        # One second of a minute moves the arc end ~18 px: a glide with a frame per pixel, capped
+        self.ring.animate_to(59)
+        self.assertEqual(self.ring.value, 60)
+        deadline = time.monotonic() + 3
+        while self.ring.value != 59 and time.monotonic() < deadline:
+            QApplication.processEvents()
+        self.assertEqual(self.ring.value, 59)
+        self.assertGreater(self.ring.animation_frames, 1)
+        self.assertLessEqual(self.ring.animation_frames, SMOOTH_MAX_FPS)
+
+    def test_smooth_mode_costs_nothing_extra_for_long_sessions(self):
+        self.ring.set_smooth(True)
+        # Under a pixel per second: shown straight away, no extra frames
+        self.ring.animate_to(1499)
+        self.assertEqual(self.ring.value, 1499)
+        # A reset jumps
+        self.ring.animate_to(1500)
+        self.assertEqual(self.ring.value, 1500)
+        self.assertEqual(self.ring.animation_frames, 0)
+
+    def test_main_window_ring_follows_timer(self):
+        window = MainWindow(PomodoroTimer())
+        window.data_manager.save_data = lambda: None
+        window.update_timer_display(600)
+        self.assertEqual(window.progress_bar.value, 600)
+        self.assertEqual(window.progress_bar._max_value, window.current_total_seconds())
+        window.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+import sys
+import os
+import datetime
+import unittest
+from unittest.mock import patch
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QDate, QThreadPool
+from logic.schedule import parse_schedule, compile_schedule, default_plan, plan_for_day, Step
+from logic.timer import PomodoroTimer
+from ui.main_window import MainWindow, DAY_CHANGE_TIMER
+
+class TestScheduleParsing(unittest.TestCase):
+    def test_classic_cycle(self):
+        steps = parse_schedule("25/5x4 then 15")
+        self.assertEqual(len(steps), 8)
+        self.assertEqual(steps[0], Step("work", 1500))
+        self.assertEqual(steps[1], Step("break", 300))
+        self.assertEqual(steps[-1], Step("long_break", 900))
+
+    def test_long_block_cycle(self):
+        steps = parse_schedule("50/10 ×3 then 30")
+        self.assertEqual([s.mode for s in steps],
+                         ["work", "break", "work", "break", "work", "long_break"])
+        self.assertEqual(steps[-1].seconds, 30 * 60)
+
+    def test_ultradian(self):
+        self.assertEqual(parse_schedule("90/20"), [Step("work", 5400), Step("break", 1200)])
+
+    def test_multiple_segments(self):
+        steps = parse_schedule("50/10, 25/5x2")
+        self.assertEqual([s.seconds // 60 for s in steps], [50, 10, 25, 5, 25, 5])
+
+    def test_invalid_specs(self):
+        for spec in ("", "abc", "25/5x0", "0/5", "25/5 then x", "500/5"):
+            with self.assertRaises(ValueError, msg=spec):
+                parse_schedule(spec)
+
+    def test_default_plan_matches_classic(self):
+        self.assertEqual(default_plan(25, 5, 15), compile_schedule("25/5x4 then 15"))
+
+class TestSessionPlan(unittest.TestCase):
+    def setUp(self):
+        self.plan = compile_schedule("50/10x3 then 30")
+
+    def test_next_index_wraps(self):
+        self.assertEqual(self.plan.next_index(len(self.plan) - 1), 0)
+
+    def test_find(self):
+        self.assertEqual(self.plan.find("long_break"), 5)
+        self.assertEqual(self.plan.find("work", 5), 0)
+        self.assertIsNone(compile_schedule("90/20").find("long_break"))
+
+    def test_seconds_until_sessions(self):
+        # At the start of the first work block: one session = 50 min
+        self.assertEqual(self.plan.seconds_until_sessions(0, 3000, 1), 3000)
+        # Three sessions: 50+10+50+10+50
+        self.assertEqual(self.plan.seconds_until_sessions(0, 3000, 3), 170 * 60)
+        # Four sessions cross into the next cycle: full cycle (200) + 50
+        self.assertEqual(self.plan.seconds_until_sessions(0, 3000, 4), 200 * 60 + 50 * 60)
+        # Halfway through a break: 5 min left, then a 50 min block
+        self.assertEqual(self.plan.seconds_until_sessions(1, 300, 1), 55 * 60)
+
+    def test_predict_finish(self):
+        now = datetime.datetime(2026, 1, 5, 9, 0)
+        finish = self.plan.predict_finish(0, 3000, 3, now)
+        self.assertEqual(finish, datetime.datetime(2026, 1, 5, 11, 50))
+
+    def test_weekday_profiles(self):
+        settings = {
+            "work_mins": 25, "break_mins": 5, "long_break_mins": 15,
+            "schedule": "50/10x3 then 30",
+            "schedule_profiles": {"sat": "90/20"}
+        }
+        saturday = datetime.date(2026, 1, 3)
+        monday = datetime.date(2026, 1, 5)
+        self.assertEqual(plan_for_day(settings, saturday), compile_schedule("90/20"))
+        self.assertEqual(plan_for_day(settings, monday), compile_schedule("50/10x3 then 30"))
+        settings["schedule"] = ""
+        self.assertEqual(plan_for_day(settings, monday), default_plan(25, 5, 15))
+
+class TestTimerWithPlan(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def test_custom_plan_cycle(self):
+        timer = PomodoroTimer()
+        timer.set_plan(compile_schedule("50/10x3 then 30"))
+        self.assertEqual(timer.remaining_seconds, 3000)
+        modes = []
+        for _ in range(6):
+            timer.switch_mode()
+            modes.append((timer.current_mode, timer.remaining_seconds // 60))
+        self.assertEqual(modes, [("break", 10), ("work", 50), ("break", 10),
+                                 ("work", 50), ("long_break", 30), ("work", 50)])
+        self.assertEqual(timer.pomodoros_completed, 3)
+
+    def test_set_durations_keeps_long_break(self):
+        timer = PomodoroTimer()
+        timer.set_durations(30, 6, 20)
+        self.assertEqual(timer.long_break_seconds, 20 * 60)
+
+class TestPlanFollowsDate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.window = MainWindow(PomodoroTimer())
+        self.window.data_manager.save_data = lambda: None
+        self.window.timer.set_sound_enabled(False)
+        self.settings = self.window.data_manager.data["settings"]
+        self.settings.update({"work_mins": 25, "break_mins": 5, "long_break_mins": 15,
+                              "schedule": "", "schedule_profiles": {"sat": "90/20"}})
+
+    def tearDown(self):
+        self.window.timer.pause()
+        QThreadPool.globalInstance().waitForDone()
+        self.window.close()
+
+    def on_day(self, day):
+        return patch.object(QDate, "currentDate", return_value=QDate(day))
+
+    def midnight(self, day):
+        with self.on_day(day):
+            self.window.timer.scheduler.timer_finished.emit(DAY_CHANGE_TIMER, "")
+
+    def test_plan_switches_at_midnight(self):
+        friday, saturday = datetime.date(2026, 1, 2), datetime.date(2026, 1, 3)
+        with self.on_day(friday):
+            self.window.apply_schedule()
+        self.assertEqual(self.window.timer.plan, default_plan(25, 5, 15))
+        scheduler = self.window.timer.scheduler
+        self.assertTrue(scheduler.has_timer(DAY_CHANGE_TIMER))
+        self.assertLessEqual(scheduler.remaining(DAY_CHANGE_TIMER), 24 * 3600 + 1)
+
+        # Left running in the tray past midnight
+        self.window.timer.start()
+        self.midnight(saturday)
+        self.assertEqual(self.window.timer.plan, compile_schedule("90/20"))
+        self.assertTrue(self.window.timer.is_running)
+        self.assertTrue(scheduler.has_timer(DAY_CHANGE_TIMER))
+
+    def test_paused_step_keeps_its_time_until_it_ends(self):
+        saturday, sunday = datetime.date(2026, 1, 3), datetime.date(2026, 1, 4)
+        with self.on_day(saturday):
+            self.window.apply_schedule()
+        timer = self.window.timer
+        timer.start()
+        timer.pause()
+        timer.remaining_seconds = 600
+        self.midnight(sunday)
+        self.assertEqual((timer.plan, timer.remaining_seconds), (compile_schedule("90/20"), 600))
+
+        with self.on_day(sunday):
+            timer.skip()
+        self.assertEqual(timer.plan, default_plan(25, 5, 15))
+
+if __name__ == '__main__':
+    unittest.main()
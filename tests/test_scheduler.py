@@ -0,0 +1,131 @@
+import sys
+import os
+import time
+import unittest
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QEventLoop, QTimer
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.scheduler import TimerScheduler
+from logic.timer import PomodoroTimer
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class TestTimerScheduler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = TimerScheduler(clock=self.clock)
+        self.finished = []
+        self.scheduler.timer_finished.connect(lambda name, label: self.finished.append(name))
+
+    def advance(self, seconds):
+        self.clock.now += seconds
+        self.scheduler._on_wakeup()
+
+    def test_timers_finish_in_deadline_order(self):
+        self.scheduler.add("meeting", 30)
+        self.scheduler.add("tea", 3)
+        self.scheduler.add("focus", 25)
+        self.assertEqual([t.name for t in self.scheduler.timers()], ["tea", "focus", "meeting"])
+
+        self.advance(3)
+        self.assertEqual(self.finished, ["tea"])
+        self.advance(22)
+        self.assertEqual(self.finished, ["tea", "focus"])
+        self.assertAlmostEqual(self.scheduler.remaining("meeting"), 5)
+        self.advance(5)
+        self.assertEqual(self.finished, ["tea", "focus", "meeting"])
+        self.assertFalse(self.scheduler._wakeup.isActive())
+
+    def test_pause_resume_and_cancel(self):
+        self.scheduler.add("tea", 10)
+        self.scheduler.add("meeting", 20)
+        self.clock.now += 4
+        self.scheduler.pause("tea")
+        self.assertAlmostEqual(self.scheduler.remaining("tea"), 6)
+
+        # A paused timer does not fire even after its old deadline
+        self.advance(10)
+        self.assertEqual(self.finished, [])
+        self.scheduler.resume("tea")
+        self.scheduler.cancel("meeting")
+        self.advance(6)
+        self.assertEqual(self.finished, ["tea"])
+        self.assertFalse(self.scheduler.has_timer("meeting"))
+
+    def test_replacing_timer_ignores_old_deadline(self):
+        self.scheduler.add("tea", 3)
+        self.scheduler.add("tea", 10)
+        self.advance(3)
+        self.assertEqual(self.finished, [])
+        self.advance(7)
+        self.assertEqual(self.finished, ["tea"])
+
+    def test_internal_timers_are_not_listed(self):
+        self.scheduler.add("pomodoro", 1500, internal=True)
+        self.scheduler.add("tea", 180)
+        self.assertEqual([t.name for t in self.scheduler.timers()], ["tea"])
+        self.scheduler.clear()
+        self.assertTrue(self.scheduler.has_timer("pomodoro"))
+        self.assertFalse(self.scheduler.has_timer("tea"))
+
+    def test_heartbeat_only_with_listed_running_timer(self):
+        beats = []
+        self.scheduler.heartbeat.connect(lambda: beats.append(1))
+        self.scheduler.set_heartbeat(1000)
+        self.scheduler.add("pomodoro", 60, internal=True)
+        self.assertIsNone(self.scheduler._next_heartbeat)
+
+        self.scheduler.add("tea", 60)
+        self.advance(1)
+        self.advance(1)
+        self.assertEqual(len(beats), 2)
+        self.scheduler.set_heartbeat(0)
+        self.advance(1)
+        self.assertEqual(len(beats), 2)
+
+    def test_many_timers_share_one_wakeup(self):
+        # Ten timers with the same deadline cost a single wakeup
+        scheduler = TimerScheduler()
+        finished = []
+        scheduler.timer_finished.connect(lambda name, label: finished.append(name))
+        for i in range(10):
+            scheduler.add(f"t{i}", 0.05)
+
+        loop = QEventLoop()
+        QTimer.singleShot(500, loop.quit)
+        loop.exec()
+
+        self.assertEqual(len(finished), 10)
+        self.assertEqual(scheduler.wakeups, 1)
+
+    def test_pomodoro_session_uses_scheduler(self):
+        timer = PomodoroTimer(scheduler=self.scheduler)
+        timer.set_sound_enabled(False)
+        finished = []
+        timer.finished.connect(lambda: finished.append(True))
+        timer.start()
+        self.assertTrue(self.scheduler.has_timer(PomodoroTimer.SESSION_TIMER))
+
+        self.advance(25 * 60)
+        self.assertEqual(finished, [True])
+        self.assertEqual(timer.current_mode, 'break')
+        self.assertFalse(timer.is_running)
+        self.assertFalse(self.scheduler.has_timer(PomodoroTimer.SESSION_TIMER))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,6 +25,7 @@ class TestSidebarAutoHide(unittest.TestCase):
         self.window = MainWindow(self.timer)
         self.window.show()
         # Ensure setting is enabled
+        self.window.ensure_page(4)
         self.window.auto_hide_sidebar_toggle.setChecked(True)
         # Ensure sidebar starts expanded
         self.window.sidebar.setFixedWidth(85)
@@ -23,6 +23,7 @@ class TestSidebarFix(unittest.TestCase):
         self.timer = PomodoroTimer()
         self.window = MainWindow(self.timer)
         self.window.show()
+        self.window.ensure_page(4)
         self.window.auto_hide_sidebar_toggle.setChecked(True)
         self.window.sidebar.setFixedWidth(85)
         QApplication.processEvents()
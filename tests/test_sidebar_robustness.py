@@ -3,7 +3,8 @@ import sys
 import os
 import unittest
 from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt, QEvent, QTimer
+from PyQt6.QtCore import Qt, QEvent, QTimer, QPointF
+from PyQt6.QtGui import QEnterEvent
 
 # Ensure path
 sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
@@ -24,6 +25,7 @@ class TestSidebarRobustness(unittest.TestCase):
         self.window = MainWindow(self.timer)
         self.window.show()
         # Enable auto-hide and ensure timer is running for event filter logic
+        self.window.ensure_page(4)
         self.window.auto_hide_sidebar_toggle.setChecked(True)
         self.timer.start() 
         self.window.sidebar.setFixedWidth(0) # Start collapsed
@@ -104,5 +106,26 @@ class TestSidebarRobustness(unittest.TestCase):
         self.assertEqual(self.window.anim_min.endValue(), 85)
         print("[Robustness] Fast re-entry cancelled hide timer")
 
+    def test_hot_zone_expands_collapsed_sidebar(self):
+        """Entering the left-edge strip expands the sidebar without any polling timer"""
+        self.assertFalse(hasattr(self.window, 'sidebar_hover_timer'))
+        zone = self.window.sidebar_hot_zone
+        self.assertTrue(zone.isVisible())
+        self.assertEqual(zone.geometry().x(), 0)
+        self.assertEqual(zone.height(), self.window.centralWidget().height())
+
+        QApplication.sendEvent(zone, QEnterEvent(QPointF(5, 5), QPointF(5, 5), QPointF(5, 5)))
+        self.assertEqual(self.window.anim_min.endValue(), 85)
+
+        # Expanded sidebar handles its own Enter/Leave; the strip gets out of the way
+        self.window.anim_group.stop()
+        self.window.sidebar.setFixedWidth(85)
+        QApplication.processEvents()
+        self.assertFalse(zone.isVisible())
+        self.window.sidebar.setFixedWidth(0)
+        QApplication.processEvents()
+        self.assertTrue(zone.isVisible())
+        print("[Robustness] Hot zone shown only while collapsed and expands on enter")
+
 if __name__ == '__main__':
     unittest.main()
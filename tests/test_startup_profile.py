@@ -0,0 +1,131 @@
+import sys
+import os
+import json
+import time
+import tempfile
+import builtins
+import unittest
+from unittest.mock import patch
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QThreadPool
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.startup_profile import StartupProfiler, ENV_VAR, DEFAULT_REPORT
+from ui import main_window
+from ui.main_window import MainWindow, PAGES
+from logic.timer import PomodoroTimer
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestStartupProfiler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "profile.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_from_environment(self):
+        self.assertFalse(StartupProfiler.from_environment({}).enabled)
+        self.assertFalse(StartupProfiler.from_environment({ENV_VAR: "0"}).enabled)
+        self.assertEqual(StartupProfiler.from_environment({ENV_VAR: "1"}).report_path, DEFAULT_REPORT)
+        self.assertEqual(StartupProfiler.from_environment({ENV_VAR: self.path}).report_path, self.path)
+
+    def test_phases_and_marks(self):
+        clock = FakeClock()
+        profiler = StartupProfiler(self.path, clock=clock)
+        with profiler.phase("main_window"):
+            clock.now = 0.010
+            with profiler.phase("init_ui"):
+                clock.now = 0.025
+        profiler.mark("first_paint")
+        clock.now = 0.030
+        profiler.mark("first_paint")
+        profiler.mark("interactive")
+
+        report = profiler.finish()
+        self.assertEqual(report["phases"], [
+            {"name": "main_window", "start_ms": 0.0, "duration_ms": 25.0, "depth": 0},
+            {"name": "init_ui", "start_ms": 10.0, "duration_ms": 15.0, "depth": 1},
+        ])
+        self.assertEqual((report["time_to_first_paint_ms"], report["time_to_interactive_ms"]), (25.0, 30.0))
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["phases"], report["phases"])
+        # Written once
+        self.assertIsNone(profiler.finish())
+
+    def test_disabled_does_nothing(self):
+        profiler = StartupProfiler()
+        profiler.track_imports()
+        self.assertIsNot(builtins.__import__, profiler._timed_import)
+        with profiler.phase("init_ui"):
+            profiler.mark("first_paint")
+        self.assertIsNone(profiler.finish())
+        self.assertEqual((profiler.phases, profiler.marks), ([], {}))
+
+    def test_import_times(self):
+        package = os.path.join(self.tmp.name, "profiled_pkg")
+        os.mkdir(package)
+        with open(os.path.join(package, "__init__.py"), "w") as f:
+            f.write("import time\ntime.sleep(0.01)\nfrom . import child\n")
+        with open(os.path.join(package, "child.py"), "w") as f:
+            f.write("import time\ntime.sleep(0.02)\n")
+        sys.path.insert(0, self.tmp.name)
+        profiler = StartupProfiler(self.path)
+        profiler.track_imports()
+        try:
+            import profiled_pkg
+            import profiled_pkg # Already loaded: not recorded again
+        finally:
+            profiler.stop_tracking_imports()
+            sys.path.remove(self.tmp.name)
+            sys.modules.pop("profiled_pkg", None)
+            sys.modules.pop("profiled_pkg.child", None)
+
+        imports = {i["module"]: i for i in profiler.report()["imports"]}
+        self.assertEqual(set(imports), {"profiled_pkg", "profiled_pkg.child"})
+        self.assertGreaterEqual(imports["profiled_pkg.child"]["self_ms"], 20)
+        self.assertGreaterEqual(imports["profiled_pkg"]["cumulative_ms"], 30)
+        self.assertLess(imports["profiled_pkg"]["self_ms"], imports["profiled_pkg"]["cumulative_ms"] - 15)
+
+class TestMainWindowProfile(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def test_report_after_prebuild(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler = StartupProfiler(os.path.join(tmp, "profile.json"))
+            # Let windows left by other tests finish their prebuilds, which end the profile too
+            for _ in range(10):
+                QApplication.processEvents()
+            with patch.object(main_window, "profiler", profiler):
+                window = MainWindow(PomodoroTimer())
+                window.data_manager.save_data = lambda: None
+                window.show()
+                deadline = time.monotonic() + 5
+                while not profiler.finished and time.monotonic() < deadline:
+                    QApplication.processEvents()
+            QThreadPool.globalInstance().waitForDone()
+            window.close()
+
+            with open(profiler.report_path, encoding="utf-8") as f:
+                report = json.load(f)
+        names = [phase["name"] for phase in report["phases"]]
+        for name in ("load_data", "init_ui", "load_saved_data", "apply_theme") + tuple(b for b, _ in PAGES[1:]):
+            self.assertIn(name, names)
+        self.assertIsNotNone(report["time_to_first_paint_ms"])
+        self.assertGreaterEqual(report["time_to_interactive_ms"], report["time_to_first_paint_ms"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import sys
+import os
+import unittest
+import datetime
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QThreadPool
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from ui.main_window import MainWindow
+from logic.timer import PomodoroTimer
+
+def day(offset):
+    return (datetime.date.today() - datetime.timedelta(days=offset)).isoformat()
+
+class TestStatsPage(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.window = MainWindow(PomodoroTimer())
+        dm = self.window.data_manager
+        # Keep the real data file untouched
+        dm.save_data = lambda: None
+        history = {day(i): {"count": i + 1, "minutes": 25 * (i + 1)} for i in range(1, 10)}
+        dm.data["stats"] = {"total_pomodoros": 54, "total_minutes": 1350, "total_days": 9, "history": history}
+        dm.data["interruptions"] = [{"type": "internal", "timestamp": day(1) + "T10:00:00"}]
+        dm.rebuild_stats_index()
+        self.window.switch_page(3)
+
+    def tearDown(self):
+        QThreadPool.globalInstance().waitForDone()
+        self.window.close()
+
+    def rows(self):
+        return [self.window.history_list.item(i) for i in range(self.window.history_list.count())]
+
+    def test_unchanged_stats_skip_render(self):
+        renders = self.window.stats_renders
+        self.window.refresh_stats()
+        self.window.switch_page(0)
+        self.window.switch_page(3)
+        self.assertEqual(self.window.stats_renders, renders)
+
+    def test_history_shows_last_seven_days(self):
+        rows = self.rows()
+        self.assertEqual(len(rows), 7)
+        self.assertIn(day(1), rows[0].text())
+        self.assertIn(day(7), rows[6].text())
+        self.assertEqual(self.window.stat_pomos.val_label.text(), "54")
+
+    def test_session_updates_only_affected_rows(self):
+        before = self.rows()
+        renders = self.window.stats_renders
+        self.window.data_manager.record_session(25)
+        self.assertEqual(self.window.stats_renders, renders + 1)
+        after = self.rows()
+        # Today's row is new; the six most recent older rows are the same items
+        self.assertIn(day(0), after[0].text())
+        self.assertEqual([id(item) for item in after[1:]], [id(item) for item in before[:6]])
+        self.assertEqual(self.window.stat_pomos.val_label.text(), "55")
+
+        text = after[1].text()
+        self.window.data_manager.record_session(25)
+        self.assertIn("2 个番茄", self.rows()[0].text())
+        self.assertEqual(self.rows()[1].text(), text)
+
+    def test_interruptions_counted_per_day(self):
+        self.window.data_manager.record_interruption("external")
+        self.assertIn("打断：1 次", self.window.today_stat_label.text())
+        self.assertEqual(self.window.stat_interrupts.val_label.text(), "2")
+
+    def test_hidden_page_renders_on_show(self):
+        self.window.switch_page(0)
+        renders = self.window.stats_renders
+        self.window.data_manager.record_session(25)
+        self.window.data_manager.record_session(25)
+        self.assertEqual(self.window.stats_renders, renders)
+        self.window.switch_page(3)
+        self.assertEqual(self.window.stats_renders, renders + 1)
+        self.assertEqual(self.window.stat_pomos.val_label.text(), "56")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import QSize, QThreadPool
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from ui.theme import ThemeEngine, PALETTES, TOKEN, compile_style_sheet, engine
+from ui.main_window import MainWindow
+from ui.floating_window import FloatingWindow
+from logic.timer import PomodoroTimer
+
+class TestThemeEngine(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def test_palettes_compile_completely(self):
+        self.assertEqual(set(PALETTES["light"]), set(PALETTES["dark"]))
+        for name, style_sheet in engine.style_sheets.items():
+            self.assertIsNone(TOKEN.search(style_sheet), name)
+            self.assertNotIn("@resources", style_sheet)
+
+    def test_unknown_token(self):
+        self.assertEqual(compile_style_sheet("a { color: @text; }", {"text": "#000"}), "a { color: #000; }")
+        with self.assertRaises(ValueError):
+            compile_style_sheet("a { color: @missing; }", {"text": "#000"})
+        with self.assertRaises(ValueError):
+            ThemeEngine(template="a { color: @missing; }")
+
+    def test_switch_is_one_app_style_sheet(self):
+        window = MainWindow(PomodoroTimer())
+        window.data_manager.save_data = lambda: None
+        floating = FloatingWindow(window.timer)
+        changed = []
+        engine.theme_changed.connect(changed.append)
+        calls = []
+        set_style_sheet = QApplication.setStyleSheet
+
+        def counting_set_style_sheet(app, style_sheet):
+            calls.append(style_sheet)
+            set_style_sheet(app, style_sheet)
+
+        try:
+            with patch.object(QApplication, "setStyleSheet", counting_set_style_sheet):
+                window.apply_theme("dark")
+                window.apply_theme("dark")
+                window.apply_theme("light")
+        finally:
+            engine.theme_changed.disconnect(changed.append)
+        self.assertEqual(calls, [engine.style_sheets["dark"], engine.style_sheets["light"]])
+        self.assertEqual(changed, ["dark", "light"])
+        self.assertIsNotNone(engine.last_switch_ms)
+
+        # Everything is reached through object names and roles, not per-widget sheets
+        for widget in (window, floating):
+            styled = [w.objectName() or type(w).__name__ for w in widget.findChildren(QWidget) if w.styleSheet()]
+            self.assertEqual(styled, [])
+        QThreadPool.globalInstance().waitForDone()
+        floating.close()
+        window.close()
+
+    def test_icons_follow_theme(self):
+        window = MainWindow(PomodoroTimer())
+        window.data_manager.save_data = lambda: None
+
+        def settings_pixels():
+            image = window.nav_btns[-1].icon().pixmap(QSize(24, 24)).toImage()
+            return {image.pixelColor(x, y).name() for x in range(24) for y in range(24)
+                    if image.pixelColor(x, y).alpha() == 255}
+
+        window.apply_theme("dark")
+        self.assertEqual(settings_pixels(), {PALETTES["dark"]["icon_tint"].lower()})
+        window.apply_theme("light")
+        self.assertNotEqual(settings_pixels(), {PALETTES["dark"]["icon_tint"].lower()})
+        QThreadPool.globalInstance().waitForDone()
+        window.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import sys
+import os
+import unittest
+from PyQt6.QtWidgets import QApplication, QWidget
+
+# Ensure path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from logic.timer import PomodoroTimer
+
+class TestTickDispatcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.timer = PomodoroTimer()
+        self.dispatcher = self.timer.dispatcher
+        self.received = []
+
+    def test_change_only_delivery(self):
+        self.dispatcher.subscribe("sub", self.received.append)
+        self.timer.tick.emit(100)
+        self.timer.tick.emit(100)
+        self.timer.tick.emit(99)
+        self.assertEqual(self.received, [100, 99])
+        self.assertEqual(self.dispatcher.repaint_counts()["sub"], 2)
+        self.assertEqual(self.dispatcher.skip_counts()["sub"], 1)
+
+    def test_resolution(self):
+        self.dispatcher.subscribe("minutes", self.received.append, resolution=60)
+        for seconds in range(180, 100, -1):
+            self.timer.tick.emit(seconds)
+        # 180 -> "3 min", 179..121 -> "3 min" (rounded up), 120 -> "2 min"
+        self.assertEqual(self.received, [180, 120])
+
+    def test_hidden_widget_receives_nothing(self):
+        widget = QWidget()
+        self.dispatcher.subscribe("window", self.received.append, widget=widget)
+        for seconds in (10, 9, 8):
+            self.timer.tick.emit(seconds)
+        self.assertEqual(self.received, [])
+        self.assertEqual(self.dispatcher.repaint_counts()["window"], 0)
+
+        # Showing the widget delivers the latest value exactly once
+        widget.show()
+        QApplication.processEvents()
+        self.assertEqual(self.received, [8])
+        widget.close()
+
+    def test_mode_change_forces_update(self):
+        self.dispatcher.subscribe("sub", self.received.append)
+        self.timer.tick.emit(300)
+        self.timer.mode_changed.emit('break')
+        self.timer.tick.emit(300)
+        self.assertEqual(self.received, [300, 300])
+
+    def test_unsubscribe(self):
+        self.dispatcher.subscribe("sub", self.received.append)
+        self.dispatcher.unsubscribe("sub")
+        self.timer.tick.emit(5)
+        self.assertEqual(self.received, [])
+        self.assertNotIn("sub", self.dispatcher.repaint_counts())
+
+if __name__ == '__main__':
+    unittest.main()
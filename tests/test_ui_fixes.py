@@ -115,7 +115,7 @@ class TestUIBugs(unittest.TestCase):
         Test 3: Settings Numerals
         Check locale of the spinboxes.
         """
-        settings_page = self.window.content_stack.widget(4) # Index 4 is settings
+        settings_page = self.window.ensure_page(4) # Index 4 is settings
         # We need to access work_mins_spin. MainWindow saves it as self.work_mins_spin
         # but that attribute is on MainWindow.
         